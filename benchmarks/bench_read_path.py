@@ -0,0 +1,106 @@
+"""Compare lifelog archive scan throughput: read_text+json.loads vs the mmap/bytes read path.
+
+Usage:
+    python benchmarks/bench_read_path.py --files 100000
+    python benchmarks/bench_read_path.py --files 20000 --layout packed --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from limitless_tools.codec import BACKEND
+from limitless_tools.storage.json_repo import StorageLayout, iter_lifelogs
+from limitless_tools.storage.readers import read_json_file
+from limitless_tools.testing.synthetic import iter_synthetic_lifelogs, write_archive
+
+
+def build_archive(base: Path, files: int, *, layout: StorageLayout, seed: int = 0) -> None:
+    # Same deterministic corpus as benchmarks/run.py for a given seed
+    write_archive(iter_synthetic_lifelogs(files, seed=seed), str(base), layout=layout, chunk_size=1000)
+
+
+def _scan_read_text(base: Path) -> int:
+    n = 0
+    for p in base.rglob("lifelog_*.json"):
+        json.loads(p.read_text())
+        n += 1
+    return n
+
+
+def _scan_bytes_path(base: Path) -> int:
+    n = 0
+    for p in base.rglob("lifelog_*.json"):
+        read_json_file(p)
+        n += 1
+    return n
+
+
+def _scan_mmap_forced(base: Path) -> int:
+    n = 0
+    for p in base.rglob("lifelog_*.json"):
+        read_json_file(p, mmap_threshold=0)
+        n += 1
+    return n
+
+
+def _scan_iter_lifelogs(base: Path) -> int:
+    return sum(1 for _ in iter_lifelogs(base))
+
+
+def _time(fn: Callable[[Path], int], base: Path, repeat: int) -> dict[str, float]:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        count = fn(base)
+        best = min(best, time.perf_counter() - t0)
+    return {"items": count, "seconds": best, "items_per_sec": (count / best) if best > 0 else 0.0}
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--files", type=int, default=100_000, help="Number of synthetic lifelogs (default: 100000)")
+    p.add_argument("--layout", choices=("files", "packed"), default="files")
+    p.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed (default: 0)")
+    p.add_argument("--repeat", type=int, default=3, help="Runs per variant; best time is reported")
+    p.add_argument("--data-dir", type=str, help="Reuse/create the archive here instead of a temp dir")
+    p.add_argument("--json", action="store_true", default=False, help="Print results as JSON")
+    args = p.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="limitless-bench-") as tmp:
+        base = Path(args.data_dir).expanduser() if args.data_dir else Path(tmp)
+        if not any(base.rglob("*.json*")):
+            build_archive(base, args.files, layout=args.layout, seed=args.seed)
+        results: dict[str, Any] = {
+            "files": args.files,
+            "layout": args.layout,
+            "seed": args.seed,
+            "decoder": BACKEND,
+        }
+        if args.layout == "files":
+            results["read_text_json_loads"] = _time(_scan_read_text, base, args.repeat)
+            results["bytes_read_path"] = _time(_scan_bytes_path, base, args.repeat)
+            results["mmap_forced"] = _time(_scan_mmap_forced, base, args.repeat)
+        results["iter_lifelogs"] = _time(_scan_iter_lifelogs, base, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, res in results.items():
+            if isinstance(res, dict):
+                print(f"{name:>22}: {res['items']} items in {res['seconds']:.2f}s ({res['items_per_sec']:.0f}/s)")
+            else:
+                print(f"{name:>22}: {res}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""Standalone benchmark runner for storage, index, search and export hot paths.
+
+Each benchmark runs against a deterministic synthetic archive (see
+``limitless_tools.testing.synthetic``) per corpus size and reports min/median/mean
+wall time and items per second as JSON. Archives are built once and kept in
+``--work-dir``, so repeated runs only pay for generation the first time.
+
+    python -m benchmarks.run --sizes 1000,10000 --output results.json
+    python -m benchmarks.run --sizes 1000,10000 --compare baseline.json
+
+With ``--compare`` the exit status is 1 when any benchmark's median is more than
+``--max-regression`` slower than in the baseline file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import platform
+import shutil
+import statistics
+import subprocess  # nosec B404 - only used to read the git commit
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from limitless_tools import __version__, codec
+from limitless_tools.services.lifelog_service import LifelogService
+from limitless_tools.storage.json_repo import JsonFileRepository, StorageLayout
+from limitless_tools.testing.stub_server import StubApi, StubSession
+from limitless_tools.testing.synthetic import (
+    DEFAULT_START,
+    generate_lifelogs,
+    iter_synthetic_lifelogs,
+    write_archive,
+)
+
+DEFAULT_SIZES = (1_000, 10_000)
+# Save and sync benchmarks hold their lifelogs in memory, so they use at most this many
+MAX_IN_MEMORY = 10_000
+SYNC_END = "2100-01-01"
+
+
+@dataclass
+class Context:
+    size: int
+    seed: int
+    layout: StorageLayout
+    work_dir: Path
+    archive: Path
+    _lifelogs: list[dict[str, Any]] | None = field(default=None, repr=False)
+
+    @property
+    def lifelogs(self) -> list[dict[str, Any]]:
+        if self._lifelogs is None:
+            self._lifelogs = generate_lifelogs(min(self.size, MAX_IN_MEMORY), seed=self.seed)
+        return self._lifelogs
+
+    def scratch(self, name: str) -> Path:
+        path = self.work_dir / "scratch" / name
+        shutil.rmtree(path, ignore_errors=True)
+        return path
+
+    def service(self, data_dir: Path | None = None, **kwargs: Any) -> LifelogService:
+        return LifelogService(api_key="bench", api_url=None, data_dir=str(data_dir or self.archive), **kwargs)
+
+    def middle_date(self) -> str:
+        rows = codec.loads((self.archive / "index.json").read_bytes())
+        return str(rows[len(rows) // 2]["startTime"])[:10]
+
+
+# A benchmark prepares untimed state and returns (timed callable, items processed)
+Prepare = Callable[[Context], tuple[Callable[[], object], int]]
+
+
+def bench_save_lifelog(ctx: Context) -> tuple[Callable[[], object], int]:
+    repo = JsonFileRepository(str(ctx.scratch("save_lifelog")), layout=ctx.layout)
+    items = ctx.lifelogs
+
+    def run() -> object:
+        for item in items:
+            repo.save_lifelog(item)
+        return None
+
+    return run, len(items)
+
+
+def bench_save_many(ctx: Context) -> tuple[Callable[[], object], int]:
+    repo = JsonFileRepository(str(ctx.scratch("save_many")), layout=ctx.layout)
+    items = ctx.lifelogs
+    return (lambda: repo.save_many(items)), len(items)
+
+
+def _sync_service(ctx: Context, data_dir: Path) -> tuple[LifelogService, int]:
+    api = StubApi(ctx.lifelogs)
+    service = ctx.service(data_dir, http_session=StubSession(api), breaker_threshold=0)
+    return service, len(ctx.lifelogs)
+
+
+def bench_sync_initial(ctx: Context) -> tuple[Callable[[], object], int]:
+    service, count = _sync_service(ctx, ctx.scratch("sync_initial") / "lifelogs")
+    return (lambda: service.sync(start=DEFAULT_START[:10], end=SYNC_END, timezone="UTC", batch_size=100)), count
+
+
+def bench_sync_index_merge(ctx: Context) -> tuple[Callable[[], object], int]:
+    # Re-sync of an up-to-date archive: every item is compared and merged into index.json
+    data_dir = ctx.scratch("sync_merge") / "lifelogs"
+    service, count = _sync_service(ctx, data_dir)
+    service.sync(start=DEFAULT_START[:10], end=SYNC_END, timezone="UTC", batch_size=100)
+    return (lambda: service.sync(start=DEFAULT_START[:10], end=SYNC_END, timezone="UTC", batch_size=100)), count
+
+
+def bench_list_local(ctx: Context) -> tuple[Callable[[], object], int]:
+    service = ctx.service()
+    return service.list_local, ctx.size
+
+
+def bench_search_substring(ctx: Context) -> tuple[Callable[[], object], int]:
+    service = ctx.service()
+    return (lambda: service.search_local(query="deadline")), ctx.size
+
+
+def bench_search_regex(ctx: Context) -> tuple[Callable[[], object], int]:
+    service = ctx.service()
+    return (lambda: service.search_local(query=r"budget\s+\w+ing", regex=True)), ctx.size
+
+
+def bench_search_fuzzy(ctx: Context) -> tuple[Callable[[], object], int]:
+    service = ctx.service()
+    return (lambda: service.search_local(query="dedline", fuzzy=True)), ctx.size
+
+
+def bench_export_markdown_by_date(ctx: Context) -> tuple[Callable[[], object], int]:
+    service = ctx.service()
+    date = ctx.middle_date()
+    return (lambda: service.export_markdown_by_date(date=date, frontmatter=True)), ctx.size
+
+
+def bench_export_csv(ctx: Context) -> tuple[Callable[[], object], int]:
+    service = ctx.service()
+    return service.export_csv, ctx.size
+
+
+BENCHMARKS: dict[str, Prepare] = {
+    "save_lifelog": bench_save_lifelog,
+    "save_many": bench_save_many,
+    "sync_initial": bench_sync_initial,
+    "sync_index_merge": bench_sync_index_merge,
+    "list_local": bench_list_local,
+    "search_substring": bench_search_substring,
+    "search_regex": bench_search_regex,
+    "search_fuzzy": bench_search_fuzzy,
+    "export_markdown_by_date": bench_export_markdown_by_date,
+    "export_csv": bench_export_csv,
+}
+
+
+def ensure_archive(work_dir: Path, size: int, seed: int, layout: StorageLayout) -> Path:
+    """Return a synthetic archive for (size, seed, layout), generating it on first use."""
+    archive = work_dir / f"archive-{size}-s{seed}-{layout}" / "lifelogs"
+    marker = archive.parent / ".complete"
+    if not marker.exists():
+        shutil.rmtree(archive.parent, ignore_errors=True)
+        started = time.perf_counter()
+        write_archive(iter_synthetic_lifelogs(size, seed=seed), str(archive), layout=layout)
+        marker.write_text("ok\n", encoding="utf-8")
+        print(f"generated {size} lifelogs in {time.perf_counter() - started:.1f}s -> {archive}", file=sys.stderr)
+    return archive
+
+
+def run_benchmark(name: str, ctx: Context, repeat: int) -> dict[str, Any]:
+    timings = []
+    items = 0
+    for _ in range(max(1, repeat)):
+        run, items = BENCHMARKS[name](ctx)
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    return {
+        "name": name,
+        "size": ctx.size,
+        "items": items,
+        "repeat": len(timings),
+        "min": round(min(timings), 6),
+        "median": round(median, 6),
+        "mean": round(statistics.fmean(timings), 6),
+        "items_per_sec": round(items / median, 1) if median > 0 else None,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(  # nosec B603 B607 - fixed argv
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=False, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_suite(
+    *,
+    sizes: list[int],
+    names: list[str],
+    repeat: int,
+    seed: int,
+    layout: StorageLayout,
+    work_dir: Path,
+) -> dict[str, Any]:
+    results = []
+    for size in sizes:
+        archive = ensure_archive(work_dir, size, seed, layout)
+        ctx = Context(size=size, seed=seed, layout=layout, work_dir=work_dir, archive=archive)
+        for name in names:
+            result = run_benchmark(name, ctx, repeat)
+            print(
+                f"{name:<24} n={size:<7} median={result['median']:.4f}s  {result['items_per_sec']} items/s",
+                file=sys.stderr,
+            )
+            results.append(result)
+        shutil.rmtree(work_dir / "scratch", ignore_errors=True)
+    return {
+        "meta": {
+            "version": __version__,
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "layout": layout,
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    """Return a description of every benchmark whose median regressed beyond ``max_regression``."""
+    before = {(r["name"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current.get("results", []):
+        old = before.get((result["name"], result["size"]))
+        if not old or not old.get("median"):
+            continue
+        change = result["median"] / old["median"] - 1.0
+        print(f"{result['name']:<24} n={result['size']:<7} {change:+.1%}", file=sys.stderr)
+        if change > max_regression:
+            regressions.append(f"{result['name']} (n={result['size']}): {old['median']:.4f}s -> {result['median']:.4f}s")
+    return regressions
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Run the limitless-tools benchmarks")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Comma-separated archive sizes (e.g. 1000,10000,100000)",
+    )
+    parser.add_argument("--only", default=None, help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark (median is reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--layout", choices=("files", "packed"), default="files")
+    parser.add_argument("--work-dir", default=None, help="Where archives are cached (default: a temp dir)")
+    parser.add_argument("--output", default=None, help="Write JSON results here (default: stdout)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON results to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed median slowdown (0.2 = 20%%)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmarks: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    work_dir = Path(args.work_dir).expanduser() if args.work_dir else Path(tempfile.mkdtemp(prefix="limitless-bench-"))
+    report = run_suite(
+        sizes=sizes, names=names, repeat=args.repeat, seed=args.seed, layout=args.layout, work_dir=work_dir
+    )
+    if not args.work_dir:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    payload = codec.dumps(report, indent=True)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    if args.compare:
+        regressions = compare(report, codec.loads(Path(args.compare).read_bytes()), args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
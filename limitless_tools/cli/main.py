@@ -1,20 +1,30 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import os
 import sys
 import time
 from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from zoneinfo import ZoneInfo
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from limitless_tools import codec
+from limitless_tools.cli.profiling import run_profiled
 from limitless_tools.config.config import default_config_path, get_profile, load_config
-from limitless_tools.config.env import load_env
+from limitless_tools.config.env import load_env, resolve_timezone
 from limitless_tools.config.logging import setup_logging
 from limitless_tools.config.paths import default_data_dir, expand_path
 from limitless_tools.errors import LimitlessError, ValidationError
-from limitless_tools.services.lifelog_service import LifelogService, SaveReport
+from limitless_tools.http.session import DEFAULT_POOL_SIZE, shared_session
+from limitless_tools.metrics import METRICS_FORMATS, MetricsRegistry
+from limitless_tools.services.lifelog_service import LifelogService, PhaseTimings, SaveReport
+from limitless_tools.storage.json_repo import STORAGE_LAYOUTS, load_lifelog
+from limitless_tools.testing.cassette import RecordingSession, ReplaySession
 
 
 def _stderr_line(message: str) -> None:
@@ -22,9 +32,47 @@ def _stderr_line(message: str) -> None:
     sys.stderr.flush()
 
 
+Window = tuple[datetime, datetime]
+
+
+def _parse_bound(value: str, tz: Any) -> datetime:
+    moment = datetime.fromisoformat(value.strip().replace(" ", "T").replace("Z", "+00:00"))
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=tz)
+
+
+def _sync_window(date: str | None, start: str | None, end: str | None, timezone: str | None) -> Window | None:
+    """Return the requested time range when it is bounded on both ends (used for the ETA)."""
+    try:
+        tz = ZoneInfo(resolve_timezone(timezone) or "UTC")
+        if date:
+            lo = _parse_bound(date, tz)
+            return lo, lo + timedelta(days=1)
+        if start and end:
+            return _parse_bound(start, tz), _parse_bound(end, tz)
+    except (ValueError, ZoneInfoNotFoundError):
+        return None
+    return None
+
+
+def _format_duration(seconds: float) -> str:
+    total = int(round(seconds))
+    if total < 60:
+        return f"{total}s"
+    if total < 3600:
+        return f"{total // 60}m{total % 60:02d}s"
+    return f"{total // 3600}h{total % 3600 // 60:02d}m"
+
+
 class ProgressReporter:
-    def __init__(self, action: str):
+    """Prints progress to stderr with throughput, per-phase timing and, for bounded windows, an ETA.
+
+    ``timings`` is passed to the service, which updates it after every page.
+    """
+
+    def __init__(self, action: str, *, window: Window | None = None):
         self.action = action
+        self.window = window
+        self.timings = PhaseTimings()
         self._start_ts: float | None = None
         self._callback: Callable[[int, int], None] | None = None
 
@@ -33,21 +81,71 @@ class ProgressReporter:
             self._start_ts = time.perf_counter()
             _stderr_line(f"{self.action.title()} started...")
 
+    def elapsed(self) -> float:
+        return (time.perf_counter() - self._start_ts) if self._start_ts is not None else 0.0
+
+    def _rates(self, items: int) -> tuple[float, float]:
+        elapsed = self.elapsed()
+        if elapsed <= 0:
+            return 0.0, 0.0
+        return items / elapsed, self.timings.bytes / elapsed
+
+    def eta_seconds(self) -> float | None:
+        """Seconds left, from how far back into the window the oldest lifelog so far reaches."""
+        if self.window is None or not self.timings.oldest_start:
+            return None
+        lo, hi = self.window
+        try:
+            oldest = _parse_bound(self.timings.oldest_start, lo.tzinfo)
+        except ValueError:
+            return None
+        span = (hi - lo).total_seconds()
+        if span <= 0:
+            return None
+        done = min(1.0, max(0.0, (hi - oldest).total_seconds() / span))
+        if done <= 0:
+            return None
+        return self.elapsed() * (1.0 - done) / done
+
     def make_callback(self) -> Callable[[int, int], None]:
         if self._callback is None:
             def _cb(page: int, total: int) -> None:
+                items_per_sec, bytes_per_sec = self._rates(self.timings.items or total)
+                detail = f"{items_per_sec:.1f} items/s, {bytes_per_sec / 1_048_576:.2f} MB/s"
+                eta = self.eta_seconds()
+                if eta is not None:
+                    detail += f", ETA {_format_duration(eta)}"
                 _stderr_line(
-                    f"{self.action.title()} in progress: {total} lifelogs processed (page {page})"
+                    f"{self.action.title()} in progress: {total} lifelogs processed (page {page}) - {detail}"
                 )
 
             self._callback = _cb
         return self._callback
 
+    def stats(self, report: SaveReport | None) -> dict[str, Any]:
+        """Return run statistics (duration, throughput, per-phase seconds) for JSON output."""
+        items = self.timings.items or (report.total if report is not None else 0)
+        items_per_sec, bytes_per_sec = self._rates(items)
+        return {
+            "duration_seconds": round(self.elapsed(), 3),
+            "items_per_sec": round(items_per_sec, 1),
+            "bytes_per_sec": round(bytes_per_sec, 1),
+            **self.timings.as_dict(),
+        }
+
     def finish(self, report: SaveReport | None) -> None:
         if self._start_ts is None:
             self.start()
         duration = (time.perf_counter() - self._start_ts) if self._start_ts is not None else None
         _stderr_line(_format_summary(self.action, report, duration))
+        t = self.timings
+        if t.items or t.network:
+            items_per_sec, bytes_per_sec = self._rates(t.items)
+            _stderr_line(
+                f"{self.action.title()} phases: network {t.network:.2f}s, decode {t.decode:.2f}s, "
+                f"save {t.save:.2f}s, index {t.index:.2f}s; "
+                f"{items_per_sec:.1f} items/s, {bytes_per_sec / 1_048_576:.2f} MB/s"
+            )
 
 
 def _format_summary(action: str, report: SaveReport | None, duration: float | None) -> str:
@@ -71,11 +169,204 @@ def _format_summary(action: str, report: SaveReport | None, duration: float | No
     return f"{title} complete{duration_text}: no lifelogs returned."
 
 
+@dataclass(frozen=True, slots=True)
+class _ProfileOption:
+    """A config profile key, its ``configure`` flag and, for ``commands``, the run flag it defaults.
+
+    A value from the profile is used only when the flag is not on the command line and
+    ``env`` (if any) is unset. ``resolve=False`` keys are read from the profile where used.
+    """
+
+    key: str
+    type: type
+    default: Any = None
+    help: str | None = None
+    choices: tuple[str, ...] | None = None
+    commands: tuple[str, ...] = ("fetch", "sync")
+    env: str | None = None
+    path: bool = False
+    resolve: bool = True
+
+    @property
+    def flag(self) -> str:
+        return "--" + self.key.replace("_", "-")
+
+    def from_config(self, value: object) -> Any:
+        """Return ``value`` converted to the flag's type, or None when it is missing or invalid."""
+        if self.choices is not None:
+            return value if value in self.choices else None
+        if self.type is bool or self.type is str:
+            return value if isinstance(value, self.type) else None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return self.type(value)
+        return None
+
+
+_PROFILE_OPTIONS: tuple[_ProfileOption, ...] = (
+    _ProfileOption("api_key", str, commands=(), resolve=False),
+    _ProfileOption("api_url", str, commands=(), resolve=False),
+    _ProfileOption("data_dir", str, commands=(), env="LIMITLESS_DATA_DIR", path=True),
+    _ProfileOption("timezone", str, commands=(), env="LIMITLESS_TZ"),
+    _ProfileOption("batch_size", int, 50, "Page size per request (default: 50)"),
+    _ProfileOption("http_timeout", float, commands=(), resolve=False),
+    _ProfileOption("output_dir", str, commands=(), resolve=False),
+    _ProfileOption(
+        "storage_layout",
+        str,
+        "files",
+        "On-disk layout: one JSON file per lifelog ('files') or one packed file per day ('packed')",
+        choices=STORAGE_LAYOUTS,
+    ),
+    _ProfileOption(
+        "dedupe_contents",
+        bool,
+        False,
+        "Store markdown/contents once per unique value in a content-addressed blob store",
+    ),
+    _ProfileOption(
+        "headers_first",
+        bool,
+        False,
+        "List the window without bodies first and download only new or changed lifelogs (by updatedAt)",
+        commands=("sync",),
+    ),
+    _ProfileOption(
+        "checkpoint_every",
+        int,
+        10,
+        "Checkpoint sync progress every N pages (default: 10; 0 disables)",
+        commands=("sync",),
+    ),
+    _ProfileOption(
+        "rate_limit",
+        float,
+        None,
+        "Pace API requests to at most this many per second (shared by all requests in the process)",
+    ),
+    _ProfileOption("rate_burst", float, None, "Requests allowed in a burst with --rate-limit"),
+    _ProfileOption(
+        "adaptive_batch",
+        bool,
+        False,
+        "Adjust the page size per request from latency, payload size and errors (--batch-size is the start)",
+    ),
+    _ProfileOption(
+        "prefetch",
+        bool,
+        False,
+        "Request the next page in the background while the current page is processed",
+    ),
+    _ProfileOption(
+        "max_retries",
+        int,
+        0,
+        "Retries per request on network errors, 429 and 5xx, with jittered backoff (default: 0)",
+    ),
+    _ProfileOption("retry_budget", int, None, "Maximum retries across the whole run"),
+    _ProfileOption(
+        "retry_budget_seconds",
+        float,
+        None,
+        "Maximum total seconds spent waiting between retries across the whole run",
+    ),
+    _ProfileOption(
+        "breaker_threshold",
+        int,
+        5,
+        "Consecutive API failures before failing fast (default: 5; 0 disables)",
+    ),
+    _ProfileOption(
+        "breaker_cooldown",
+        float,
+        60.0,
+        "Seconds the circuit breaker stays open before a probe request (default: 60)",
+    ),
+    _ProfileOption(
+        "http_cache",
+        bool,
+        False,
+        "Cache API responses on disk and revalidate them with ETag/Last-Modified",
+    ),
+    _ProfileOption(
+        "http_cache_ttl",
+        float,
+        0.0,
+        "Serve cached responses younger than this many seconds without a request (default: 0)",
+    ),
+    # Relative paths in the config file are resolved against the config directory
+    _ProfileOption(
+        "metrics_file",
+        str,
+        None,
+        "Write run metrics (requests, retries, bytes, items, phase seconds, index size) to this file",
+        path=True,
+    ),
+    _ProfileOption(
+        "metrics_format",
+        str,
+        None,
+        "Metrics file format (default: json for *.json, otherwise Prometheus textfile)",
+        choices=METRICS_FORMATS,
+    ),
+)
+
+
+def _add_run_options(parser: argparse.ArgumentParser, command: str) -> None:
+    """Add the options fetch and sync share: storage, pacing, retries, caching, metrics, cassettes."""
+    parser.add_argument("--data-dir", type=str, default=os.getenv("LIMITLESS_DATA_DIR") or default_data_dir())
+    for opt in _PROFILE_OPTIONS:
+        if command not in opt.commands:
+            continue
+        if opt.type is bool:
+            parser.add_argument(opt.flag, action="store_true", default=opt.default, help=opt.help)
+        else:
+            parser.add_argument(opt.flag, type=opt.type, default=opt.default, choices=opt.choices, help=opt.help)
+    parser.add_argument(
+        "--record-cassette",
+        type=str,
+        default=None,
+        help="Append every API response (API key redacted) to this cassette file",
+    )
+    parser.add_argument(
+        "--replay-cassette",
+        type=str,
+        default=None,
+        help="Serve API responses from this cassette file instead of the network",
+    )
+
+
+def _apply_profile(args: argparse.Namespace, prof: dict, *, argv_list: list[str], config_base_dir: str) -> None:
+    """Fill options the command has but the user did not pass (CLI > env > config profile)."""
+    for opt in _PROFILE_OPTIONS:
+        if not opt.resolve or not hasattr(args, opt.key) or opt.flag in argv_list:
+            continue
+        if opt.env and os.getenv(opt.env):
+            continue
+        value = opt.from_config(prof.get(opt.key))
+        if value is None:
+            continue
+        if opt.path:
+            value = expand_path(value, base_dir=config_base_dir)
+        setattr(args, opt.key, value)
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="limitless", description="Limitless Tools CLI")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
     parser.add_argument("--config", type=str, help=f"Path to config TOML (default: {default_config_path()})")
     parser.add_argument("--profile", type=str, default=None, help="Config profile/section to use (default)")
+    parser.add_argument(
+        "--profile-cpu",
+        metavar="FILE",
+        default=None,
+        help="Run the command under cProfile, write pstats data to FILE and print the hottest functions",
+    )
+    parser.add_argument(
+        "--profile-mem",
+        action="store_true",
+        default=False,
+        help="Trace allocations with tracemalloc and print peak memory and the top allocation sites",
+    )
     sub = parser.add_subparsers(dest="command")
 
     fetch = sub.add_parser("fetch", help="Fetch lifelogs")
@@ -88,8 +379,7 @@ def _build_parser() -> argparse.ArgumentParser:
     fetch.add_argument("--include-headings", dest="include_headings", action="store_true")
     fetch.add_argument("--no-include-headings", dest="include_headings", action="store_false")
     fetch.set_defaults(include_headings=True)
-    fetch.add_argument("--batch-size", type=int, default=50, help="Page size to use when fetching (default: 50)")
-    fetch.add_argument("--data-dir", type=str, default=os.getenv("LIMITLESS_DATA_DIR") or default_data_dir())
+    _add_run_options(fetch, "fetch")
     fetch.add_argument("--json", action="store_true", default=False, help="Output JSON summary of saved items")
 
     sync = sub.add_parser("sync", help="Sync lifelogs for a date or range")
@@ -102,8 +392,13 @@ def _build_parser() -> argparse.ArgumentParser:
         help="IANA timezone name (e.g., 'America/Los_Angeles', 'UTC')."
     )
     sync.add_argument("--starred-only", action="store_true", default=False)
-    sync.add_argument("--batch-size", type=int, default=50, help="Page size to use when syncing (default: 50)")
-    sync.add_argument("--data-dir", type=str, default=os.getenv("LIMITLESS_DATA_DIR") or default_data_dir())
+    sync.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="Continue an interrupted sync from its last page checkpoint",
+    )
+    _add_run_options(sync, "sync")
     sync.add_argument("--json", action="store_true", default=False, help="Output JSON summary of results")
 
     lst = sub.add_parser("list", help="List local lifelogs")
@@ -141,17 +436,27 @@ def _build_parser() -> argparse.ArgumentParser:
     fa.add_argument("--data-dir", type=str, default=os.getenv("LIMITLESS_DATA_DIR") or default_data_dir())
 
     cfgp = sub.add_parser("configure", help="Create or update user config (TOML)")
-    cfgp.add_argument("--api-key", type=str)
-    cfgp.add_argument("--api-url", type=str)
-    cfgp.add_argument("--data-dir", type=str)
-    cfgp.add_argument("--timezone", type=str)
-    cfgp.add_argument("--batch-size", type=int)
-    cfgp.add_argument("--http-timeout", type=float)
-    cfgp.add_argument("--output-dir", type=str)
+    for opt in _PROFILE_OPTIONS:
+        if opt.type is bool:
+            cfgp.add_argument(opt.flag, action="store_true", default=None)
+        else:
+            cfgp.add_argument(opt.flag, type=opt.type, choices=opt.choices)
 
     return parser
 
 
+def _write_metrics(metrics: MetricsRegistry | None, args: argparse.Namespace, log: logging.Logger) -> None:
+    """Export run metrics to --metrics-file; a failed write is logged, never fatal for the run."""
+    if metrics is None or not getattr(args, "metrics_file", None):
+        return
+    try:
+        path = metrics.write(args.metrics_file, args.metrics_format)
+    except LimitlessError as exc:
+        log.warning("metrics_write_failed", extra={"error": str(exc), "context": exc.context})
+        return
+    log.debug("metrics_written", extra={"path": str(path)})
+
+
 def _normalize_data_dir(value: str | None, *, base_dir: str | None = None) -> str:
     """Return a data_dir resolved relative to an optional base directory."""
     normalized = expand_path(value, base_dir=base_dir)
@@ -174,6 +479,23 @@ def _coerce_timeout_value(value: object, log: logging.Logger) -> float | None:
     return None
 
 
+def _cassette_session(args: argparse.Namespace, *, api_key: str | None, pool_size: int | None) -> Any:
+    """Return a record/replay session for --record-cassette/--replay-cassette, else None."""
+    replay = getattr(args, "replay_cassette", None)
+    record = getattr(args, "record_cassette", None)
+    if replay and record:
+        raise ValidationError("Use either --record-cassette or --replay-cassette, not both.")
+    if replay:
+        path = Path(expand_path(replay) or replay)
+        if not path.exists():
+            raise ValidationError(f"Cassette not found: {replay}", context={"path": str(path)})
+        return ReplaySession(path)
+    if record:
+        inner = shared_session(pool_size=pool_size or DEFAULT_POOL_SIZE)
+        return RecordingSession(inner, Path(expand_path(record) or record), secrets=(api_key or "",))
+    return None
+
+
 def _execute_command(
     *,
     args: argparse.Namespace,
@@ -185,25 +507,7 @@ def _execute_command(
     resolved_config_path: str,
     profile_name: str,
 ) -> int:
-    def _provided(opt: str) -> bool:
-        return opt in argv_list
-
-    # data_dir precedence
-    data_dir_from_config = False
-    if not _provided("--data-dir") and not os.getenv("LIMITLESS_DATA_DIR"):
-        if isinstance(prof.get("data_dir"), str):
-            setattr(args, "data_dir", prof["data_dir"])
-            data_dir_from_config = True
-
-    # batch_size precedence for fetch/sync
-    if not _provided("--batch-size") and isinstance(prof.get("batch_size"), (int, float)):
-        # argparse stores parsed ints; coerce to int
-        setattr(args, "batch_size", int(prof["batch_size"]))
-
-    # timezone precedence for sync
-    if getattr(args, "command", None) == "sync" and not _provided("--timezone") and not os.getenv("LIMITLESS_TZ"):
-        if isinstance(prof.get("timezone"), str):
-            setattr(args, "timezone", prof["timezone"])
+    _apply_profile(args, prof, argv_list=argv_list, config_base_dir=config_base_dir)
 
     # Resolve API credentials
     resolved_api_key = os.getenv("LIMITLESS_API_KEY") or (prof.get("api_key") if isinstance(prof.get("api_key"), str) else None)
@@ -211,11 +515,15 @@ def _execute_command(
     resolved_http_timeout: float | None = None
     if not os.getenv("LIMITLESS_HTTP_TIMEOUT"):
         resolved_http_timeout = _coerce_timeout_value(prof.get("http_timeout"), log)
+    pool_size = prof.get("http_pool_size")
+    resolved_pool_size: int | None = None
+    if isinstance(pool_size, int) and not isinstance(pool_size, bool) and pool_size > 0:
+        resolved_pool_size = pool_size
 
-    args.data_dir = _normalize_data_dir(
-        getattr(args, "data_dir", None),
-        base_dir=config_base_dir if data_dir_from_config else None,
-    )
+    args.data_dir = _normalize_data_dir(getattr(args, "data_dir", None))
+
+    http_session = _cassette_session(args, api_key=resolved_api_key, pool_size=resolved_pool_size)
+    metrics = MetricsRegistry() if getattr(args, "metrics_file", None) else None
 
     if args.command == "fetch":
         service = LifelogService(
@@ -223,35 +531,53 @@ def _execute_command(
             api_url=resolved_api_url,
             data_dir=args.data_dir,
             http_timeout=resolved_http_timeout,
+            storage_layout=args.storage_layout,
+            dedupe_contents=bool(args.dedupe_contents),
+            rate_limit=args.rate_limit if args.rate_limit and args.rate_limit > 0 else None,
+            rate_burst=args.rate_burst,
+            adaptive_batch=bool(args.adaptive_batch),
+            prefetch=bool(args.prefetch),
+            max_retries=max(0, int(args.max_retries)),
+            retry_budget=args.retry_budget,
+            retry_budget_seconds=args.retry_budget_seconds,
+            breaker_threshold=max(0, int(args.breaker_threshold)),
+            breaker_cooldown=float(args.breaker_cooldown),
+            http_pool_size=resolved_pool_size,
+            http_cache=bool(args.http_cache),
+            http_cache_ttl=float(args.http_cache_ttl),
+            http_session=http_session,
+            metrics=metrics,
         )
         reporter = ProgressReporter("fetch")
         reporter.start()
-        saved = service.fetch(
-            limit=args.limit,
-            direction=args.direction,
-            include_markdown=args.include_markdown,
-            include_headings=args.include_headings,
-            batch_size=max(1, int(args.batch_size)),
-            progress_callback=reporter.make_callback(),
-        )
+        try:
+            saved = service.fetch(
+                limit=args.limit,
+                direction=args.direction,
+                include_markdown=args.include_markdown,
+                include_headings=args.include_headings,
+                batch_size=max(1, int(args.batch_size)),
+                progress_callback=reporter.make_callback(),
+                timings=reporter.timings,
+            )
+        finally:
+            _write_metrics(metrics, args, log)
         if args.json:
-            import json as _json
             docs = []
             for p in saved:
-                try:
-                    with open(p, encoding="utf-8") as _f:
-                        obj = _json.loads(_f.read())
-                    docs.append({
-                        "id": obj.get("id"),
-                        "title": obj.get("title"),
-                        "startTime": obj.get("startTime"),
-                        "endTime": obj.get("endTime"),
-                        "path": p,
-                    })
-                except (_json.JSONDecodeError, OSError) as exc:
-                    log.debug("Skipping invalid saved lifelog %s: %s", p, exc)
+                obj = load_lifelog(p)
+                if obj is None:
+                    log.debug("Skipping invalid saved lifelog %s", p)
                     continue
-            print(_json.dumps(docs, ensure_ascii=False))
+                docs.append({
+                    "id": obj.get("id"),
+                    "title": obj.get("title"),
+                    "startTime": obj.get("startTime"),
+                    "endTime": obj.get("endTime"),
+                    "path": p,
+                })
+            # stdout keeps the stdlib layout (", "/": " separators) that scripts already parse
+            print(json.dumps(docs, ensure_ascii=False))
         reporter.finish(getattr(service, "last_report", None))
         return 0
 
@@ -271,45 +597,65 @@ def _execute_command(
             api_url=resolved_api_url,
             data_dir=args.data_dir,
             http_timeout=resolved_http_timeout,
+            storage_layout=args.storage_layout,
+            dedupe_contents=bool(args.dedupe_contents),
+            rate_limit=args.rate_limit if args.rate_limit and args.rate_limit > 0 else None,
+            rate_burst=args.rate_burst,
+            adaptive_batch=bool(args.adaptive_batch),
+            prefetch=bool(args.prefetch),
+            max_retries=max(0, int(args.max_retries)),
+            retry_budget=args.retry_budget,
+            retry_budget_seconds=args.retry_budget_seconds,
+            breaker_threshold=max(0, int(args.breaker_threshold)),
+            breaker_cooldown=float(args.breaker_cooldown),
+            http_pool_size=resolved_pool_size,
+            http_cache=bool(args.http_cache),
+            http_cache_ttl=float(args.http_cache_ttl),
+            http_session=http_session,
+            metrics=metrics,
         )
-        reporter = ProgressReporter("sync")
+        reporter = ProgressReporter("sync", window=_sync_window(args.date, args.start, args.end, args.timezone))
         reporter.start()
-        saved = service.sync(
-            date=args.date,
-            start=args.start,
-            end=args.end,
-            timezone=args.timezone,
-            is_starred=True if args.starred_only else None,
-            batch_size=max(1, int(args.batch_size)),
-            progress_callback=reporter.make_callback(),
-        )
+        try:
+            saved = service.sync(
+                date=args.date,
+                start=args.start,
+                end=args.end,
+                timezone=args.timezone,
+                is_starred=True if args.starred_only else None,
+                batch_size=max(1, int(args.batch_size)),
+                progress_callback=reporter.make_callback(),
+                headers_first=bool(args.headers_first),
+                resume=bool(args.resume),
+                checkpoint_every=max(0, int(args.checkpoint_every)),
+                timings=reporter.timings,
+            )
+        finally:
+            _write_metrics(metrics, args, log)
         if args.json:
-            import json as _json
             from pathlib import Path as _Path
             # Build items JSON and read state for lastCursor/lastEndTime
             items = []
             for p in saved:
-                try:
-                    with open(p, encoding="utf-8") as _f:
-                        obj = _json.loads(_f.read())
-                    items.append({
-                        "id": obj.get("id"),
-                        "title": obj.get("title"),
-                        "startTime": obj.get("startTime"),
-                        "endTime": obj.get("endTime"),
-                        "path": p,
-                    })
-                except (_json.JSONDecodeError, OSError) as exc:
-                    log.debug("Skipping invalid saved lifelog %s: %s", p, exc)
+                obj = load_lifelog(p)
+                if obj is None:
+                    log.debug("Skipping invalid saved lifelog %s", p)
                     continue
+                items.append({
+                    "id": obj.get("id"),
+                    "title": obj.get("title"),
+                    "startTime": obj.get("startTime"),
+                    "endTime": obj.get("endTime"),
+                    "path": p,
+                })
             # State resides at ../state/lifelogs_sync.json
             try:
                 state_path = _Path(args.data_dir).parent / "state" / "lifelogs_sync.json"
                 if state_path.exists():
-                    state = _json.loads(state_path.read_text())
+                    state = codec.loads(state_path.read_bytes())
                 else:
                     state = {}
-            except (_json.JSONDecodeError, OSError) as exc:
+            except (codec.JSONDecodeError, OSError) as exc:
                 log.debug("Unable to read sync state %s: %s", state_path, exc)
                 state = {}
             result = {
@@ -317,8 +663,9 @@ def _execute_command(
                 "lastCursor": state.get("lastCursor"),
                 "lastEndTime": state.get("lastEndTime"),
                 "items": items,
+                "stats": reporter.stats(getattr(service, "last_report", None)),
             }
-            print(_json.dumps(result, ensure_ascii=False))
+            print(json.dumps(result, ensure_ascii=False))
         reporter.finish(getattr(service, "last_report", None))
         return 0
 
@@ -331,7 +678,6 @@ def _execute_command(
         )
         items = service.list_local(date=args.date, is_starred=True if args.starred_only else None)
         if args.as_json:
-            import json
             print(json.dumps(items, ensure_ascii=False, indent=2))
         else:
             for it in items:
@@ -416,7 +762,6 @@ def _execute_command(
             fuzzy_threshold=int(getattr(args, "fuzzy_threshold", 80)),
         )
         if args.as_json:
-            import json
             print(json.dumps(items, ensure_ascii=False, indent=2))
         else:
             for it in items:
@@ -437,7 +782,7 @@ def _execute_command(
         prof_dict = current.get(target_profile, {}) if current else {}
         # Apply updates from flags (ignore None values)
         updates = {}
-        for k in ["api_key", "api_url", "data_dir", "timezone", "batch_size", "http_timeout", "output_dir"]:
+        for k in (opt.key for opt in _PROFILE_OPTIONS):
             v = getattr(args, k, None)
             if v is not None:
                 updates[k] = v
@@ -481,15 +826,19 @@ def main(argv: list[str] | None = None) -> int:
     verbose = bool(getattr(args, "verbose", False))
 
     try:
-        return _execute_command(
-            args=args,
-            argv_list=argv_list,
-            prof=prof,
-            config_base_dir=config_base_dir,
-            parser=parser,
-            log=log,
-            resolved_config_path=resolved_config_path,
-            profile_name=profile_name,
+        return run_profiled(
+            lambda: _execute_command(
+                args=args,
+                argv_list=argv_list,
+                prof=prof,
+                config_base_dir=config_base_dir,
+                parser=parser,
+                log=log,
+                resolved_config_path=resolved_config_path,
+                profile_name=profile_name,
+            ),
+            cpu_path=args.profile_cpu,
+            mem=bool(args.profile_mem),
         )
     except ValidationError as exc:
         _stderr_line(f"Error: {exc}")
@@ -0,0 +1,72 @@
+"""Optional cProfile/tracemalloc wrappers for CLI commands (``--profile-cpu``/``--profile-mem``)."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import TextIO
+
+# Rows printed to stderr for the hottest functions and the largest allocation sites
+TOP_N = 15
+
+
+def _cpu_summary(profiler: cProfile.Profile, path: str, stream: TextIO) -> None:
+    profiler.dump_stats(path)
+    buf = io.StringIO()
+    pstats.Stats(profiler, stream=buf).strip_dirs().sort_stats("cumulative").print_stats(TOP_N)
+    stream.write(f"CPU profile written to {path} (view with: python -m pstats {path})\n")
+    stream.write(buf.getvalue())
+
+
+def _mem_summary(snapshot: tracemalloc.Snapshot, peak: int, stream: TextIO) -> None:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    stream.write(f"Peak traced memory: {peak / 1_048_576:.1f} MiB\n")
+    stream.write(f"Top {TOP_N} allocation sites still held at exit:\n")
+    for stat in snapshot.statistics("lineno")[:TOP_N]:
+        frame = stat.traceback[0]
+        stream.write(f"  {stat.size / 1024:10.1f} KiB  {stat.count:8d} blocks  {frame.filename}:{frame.lineno}\n")
+
+
+def run_profiled(
+    func: Callable[[], int],
+    *,
+    cpu_path: str | None = None,
+    mem: bool = False,
+    stream: TextIO | None = None,
+) -> int:
+    """Run ``func`` under cProfile (stats dumped to ``cpu_path``) and/or tracemalloc.
+
+    Summaries go to ``stream`` (stderr) even when ``func`` raises. With neither
+    option ``func`` is called directly, so profiling costs nothing when off.
+    """
+    if cpu_path is None and not mem:
+        return func()
+    out = stream or sys.stderr
+    profiler = cProfile.Profile() if cpu_path is not None else None
+    if mem:
+        tracemalloc.start()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            return func()
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    finally:
+        if mem:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _mem_summary(snapshot, peak, out)
+        if profiler is not None and cpu_path is not None:
+            _cpu_summary(profiler, cpu_path, out)
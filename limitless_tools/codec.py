@@ -0,0 +1,92 @@
+"""Internal JSON codec: orjson or msgspec when installed, stdlib ``json`` otherwise.
+
+Every backend produces the same bytes for str keys and str/int/bool/None values
+in nested lists/dicts: compact output uses ``,``/``:`` separators, indented
+output matches ``json.dumps(obj, ensure_ascii=False, indent=2)``. Floats are
+not normalized and may be spelled differently (orjson writes ``1e+16`` where
+``json`` writes ``1e16``); they decode to the same value. User-facing CLI
+output therefore stays on the stdlib encoder.
+Values a fast backend cannot encode (non-str keys, very large ints) fall back to
+the stdlib encoder. Select a backend explicitly with ``LIMITLESS_JSON_BACKEND``
+(``orjson``, ``msgspec`` or ``json``).
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _optional_module(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - optional speedup
+        return None
+
+
+_orjson = _optional_module("orjson")
+_msgspec = _optional_module("msgspec")
+
+
+def _select_backend() -> str:
+    requested = (os.getenv("LIMITLESS_JSON_BACKEND") or "").strip().lower()
+    available = {"orjson": _orjson is not None, "msgspec": _msgspec is not None, "json": True}
+    if requested in available and available[requested]:
+        return requested
+    if _orjson is not None:
+        return "orjson"
+    if _msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+BACKEND = _select_backend()
+# Whether loads() accepts memoryview/mmap slices without copying to bytes
+SUPPORTS_BUFFER = BACKEND in ("orjson", "msgspec")
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Decode JSON; raises JSONDecodeError on invalid input for every backend."""
+    if BACKEND == "orjson":
+        return _orjson.loads(data)
+    if BACKEND == "msgspec":
+        try:
+            return _msgspec.json.decode(data)
+        except _msgspec.DecodeError as exc:
+            raise JSONDecodeError(str(exc), "", 0) from exc
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any, *, indent: bool, sort_keys: bool) -> str:
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes (see module docstring for the format)."""
+    if BACKEND == "orjson":
+        opts = (_orjson.OPT_INDENT_2 if indent else 0) | (_orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return _orjson.dumps(obj, option=opts)
+        except TypeError:
+            pass
+    elif BACKEND == "msgspec" and not indent:
+        try:
+            return _msgspec.json.encode(obj, order="sorted" if sort_keys else None)
+        except (TypeError, OverflowError):
+            pass
+    return _stdlib_dumps(obj, indent=indent, sort_keys=sort_keys).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    """Encode obj as a JSON str (see module docstring for the format)."""
+    if BACKEND == "json":
+        return _stdlib_dumps(obj, indent=indent, sort_keys=sort_keys)
+    return dumps_bytes(obj, indent=indent, sort_keys=sort_keys).decode("utf-8")
@@ -39,6 +39,11 @@ class ApiError(LimitlessError):
     status_code: int | None = None
 
 
+@dataclass(slots=True)
+class CircuitOpenError(ApiError):
+    """Raised without contacting the API while the client circuit breaker is open."""
+
+
 @dataclass(slots=True)
 class StorageError(LimitlessError):
     """Raised when local storage operations fail."""
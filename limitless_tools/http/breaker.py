@@ -0,0 +1,118 @@
+"""Circuit breaker that fails fast while the API keeps failing."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+from limitless_tools import codec
+from limitless_tools.errors import CircuitOpenError
+
+log = logging.getLogger(__name__)
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures; probes again after ``cooldown``.
+
+    While open, ``before_request()`` raises ``CircuitOpenError`` immediately. Once
+    the cooldown has passed one probe request is let through (half-open): success
+    closes the breaker, failure re-opens it for another cooldown. With
+    ``state_path`` the open state is written to disk, so later runs (e.g. the next
+    scheduled sync) fail fast too until the cooldown ends.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        *,
+        state_path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.state_path = state_path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state: BreakerState = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._load()
+
+    def _load(self) -> None:
+        if self.state_path is None or not self.state_path.exists():
+            return
+        try:
+            data = codec.loads(self.state_path.read_bytes())
+        except (codec.JSONDecodeError, OSError) as exc:
+            log.debug("Ignoring unreadable breaker state %s: %s", self.state_path, exc)
+            return
+        if isinstance(data, dict) and isinstance(data.get("openedAt"), (int, float)):
+            self.state = "open"
+            self.opened_at = float(data["openedAt"])
+            self.failures = int(data.get("failures") or self.failure_threshold)
+
+    def _persist(self) -> None:
+        if self.state_path is None:
+            return
+        try:
+            if self.state == "closed":
+                self.state_path.unlink(missing_ok=True)
+                return
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_path.with_name(f".{self.state_path.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_bytes(codec.dumps_bytes({"openedAt": self.opened_at, "failures": self.failures}))
+            os.replace(tmp, self.state_path)
+        except OSError as exc:
+            log.debug("Unable to persist breaker state %s: %s", self.state_path, exc)
+
+    def _transition(self, state: BreakerState) -> None:
+        if state != self.state:
+            log.warning(
+                "circuit_breaker_%s",
+                state,
+                extra={"event": "circuit_breaker", "state": state, "failures": self.failures},
+            )
+            self.state = state
+
+    def before_request(self) -> None:
+        """Raise ``CircuitOpenError`` unless a request may be sent now."""
+        with self._lock:
+            if self.state == "closed":
+                return
+            remaining = self.opened_at + self.cooldown - self._clock()
+            if self.state == "open" and remaining <= 0:
+                self._transition("half_open")
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return
+            raise CircuitOpenError(
+                "Limitless API circuit breaker is open after repeated failures; not sending request.",
+                context={"failures": self.failures, "retry_in_seconds": round(max(0.0, remaining), 1)},
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._probing = False
+            self.failures = 0
+            if self.state != "closed":
+                self._transition("closed")
+                self._persist()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._probing = False
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.opened_at = self._clock()
+                self._transition("open")
+                self._persist()
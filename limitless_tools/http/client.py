@@ -2,10 +2,19 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from limitless_tools.errors import ApiError, ConfigurationError
+from limitless_tools.http.breaker import CircuitBreaker
+from limitless_tools.http.paging import AdaptivePageSize
+from limitless_tools.http.rate_limit import TokenBucket
+from limitless_tools.http.response_cache import ResponseCache
+from limitless_tools.http.retry import RetryBudget, full_jitter
+from limitless_tools.http.session import ACCEPT_ENCODING, shared_session
 
 try:
     import requests
@@ -27,14 +36,32 @@ class LimitlessClient:
         retry_statuses: tuple[int, ...] = (429, 502, 503, 504),
         sleep_fn: Any | None = None,
         timeout: float | None = None,
+        rate_limiter: TokenBucket | None = None,
+        jitter: bool = True,
+        max_backoff: float = 30.0,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         self.api_key = api_key
         self.base_url = (base_url or os.getenv("LIMITLESS_API_URL") or "https://api.limitless.ai").rstrip("/")
         self._enforce_base_url_allowlist()
-        self.session = session or (requests.Session() if requests is not None else None)
+        # Default: the process-wide pooled session shared with other clients
+        self.session = session or shared_session()
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.retry_statuses = retry_statuses
+        # Full-jitter backoff spreads retries from concurrent clients apart
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        # Shared across all requests made by this client (e.g. every page of a sync)
+        self.retry_budget = retry_budget
+        # Fails fast (CircuitOpenError) while the API is consistently failing
+        self.circuit_breaker = circuit_breaker
+        # Optional on-disk cache of response bodies (ETag/Last-Modified/TTL)
+        self.response_cache = response_cache
+        # Optional proactive pacing (may be shared with other clients/threads)
+        self.rate_limiter = rate_limiter
         # Default request timeout (seconds)
         if timeout is None:
             env_to = os.getenv("LIMITLESS_HTTP_TIMEOUT")
@@ -45,12 +72,21 @@ class LimitlessClient:
                 self.timeout = 30.0
         else:
             self.timeout = timeout
-        # default sleep uses time.sleep, but lazily import to avoid overhead in tests
         if sleep_fn is None:
-            import time as _time
-            self.sleep_fn = _time.sleep
+            self.sleep_fn = time.sleep
         else:
             self.sleep_fn = sleep_fn
+        self.last_response_seconds = 0.0
+        self.last_response_bytes = 0
+        # Running totals across requests: time in session.get (every attempt), JSON decoding, body bytes
+        self.network_seconds = 0.0
+        self.decode_seconds = 0.0
+        self.bytes_received = 0
+        # HTTP attempts sent and retries taken (throttling, 5xx, network errors)
+        self.requests_sent = 0
+        self.retries = 0
+        # Guards the counters above: with prefetch a worker thread sends requests too
+        self._stats_lock = threading.Lock()
 
     def _headers(self) -> dict[str, str]:
         # Add a simple User-Agent with package version when available
@@ -61,7 +97,7 @@ class LimitlessClient:
             ua = f"limitless-tools/{version('limitless-tools')}"
         except (ImportError, ModuleNotFoundError) as exc:
             log.debug("Failed to read package metadata: %s", exc)
-        return {"X-API-Key": self.api_key, "User-Agent": ua}
+        return {"X-API-Key": self.api_key, "User-Agent": ua, "Accept-Encoding": ACCEPT_ENCODING}
 
     def _enforce_base_url_allowlist(self) -> None:
         """Prevent accidental egress by restricting base_url host to an allowlist.
@@ -101,9 +137,19 @@ class LimitlessClient:
         batch_size: int = 50,
         cursor: str | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        page_callback: Callable[[list[dict[str, Any]], str | None], None] | None = None,
+        adaptive_batch: bool = False,
+        prefetch: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Fetch lifelogs with automatic pagination. Returns a list of lifelog dicts.
+
+        ``page_callback(items, next_cursor)`` is called after each page is received;
+        unlike ``progress_callback`` its exceptions propagate and stop pagination.
+        With ``adaptive_batch`` the page ``limit`` starts at ``batch_size`` and then
+        follows ``AdaptivePageSize`` (latency, payload size and retries).
+        With ``prefetch`` the request for the next cursor is issued on a worker
+        thread as soon as it is known, overlapping it with the callbacks.
         """
 
         if limit is not None:
@@ -111,128 +157,358 @@ class LimitlessClient:
         else:
             page_size = batch_size
 
+        sizer = AdaptivePageSize(page_size) if adaptive_batch else None
+
+        def _shrink_page(params: dict[str, Any]) -> None:
+            # A timed-out or throttled page is retried with a smaller limit
+            if sizer is not None:
+                params["limit"] = sizer.failed()
+
+        def _page_params(page_cursor: str | None) -> dict[str, Any]:
+            size = page_size
+            if sizer is not None:
+                size = min(sizer.size, int(limit)) if limit is not None else sizer.size
+            return self._list_params(
+                limit=size,
+                direction=direction,
+                include_markdown=include_markdown,
+                include_headings=include_headings,
+                date=date,
+                start=start,
+                end=end,
+                timezone=timezone,
+                is_starred=is_starred,
+                cursor=page_cursor,
+            )
+
+        def _fetch_page(page_cursor: str | None) -> Any:
+            body = self._get_json(f"{self.base_url}/v1/lifelogs", _page_params(page_cursor), on_retry=_shrink_page)
+            if sizer is not None:
+                sizer.observe(self.last_response_seconds, self.last_response_bytes)
+            return body
+
         collected: list[dict[str, Any]] = []
-        # seed initial cursor if provided
-        current_cursor: str | None = cursor
         self.last_next_cursor: str | None = None
+        # Cursor that produced the page currently handed to the callbacks
+        self.last_page_cursor: str | None = cursor
+        # With prefetch, the next page is requested on a worker while callbacks run
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="limitless-prefetch") if prefetch else None
+        pending: Future[Any] | None = None
 
-        page_number = 0
-        while True:
-            page_number += 1
-            params: dict[str, Any] = {
-                "limit": page_size,
-                "direction": direction,
-                "includeMarkdown": "true" if include_markdown else "false",
-                "includeHeadings": "true" if include_headings else "false",
-            }
-            if date:
-                params["date"] = date
-            if start:
-                params["start"] = start
-            if end:
-                params["end"] = end
-            if timezone:
-                params["timezone"] = timezone
-            if is_starred is not None:
-                params["isStarred"] = "true" if is_starred else "false"
-            if current_cursor:
-                params["cursor"] = current_cursor
-
-            url = f"{self.base_url}/v1/lifelogs"
-            # perform request with retry loop
-            attempt = 0
+        try:
+            # seed initial cursor if provided
+            body = _fetch_page(cursor)
+            page_number = 0
             while True:
-                # Pass timeout only if the session.get signature accepts it (keeps tests' fakes working)
-                req_kwargs: dict[str, Any] = {}
-                try:
-                    import inspect as _inspect
-
-                    sig = _inspect.signature(self.session.get)  # type: ignore[union-attr]
-                    if "timeout" in sig.parameters or any(
-                        p.kind == p.VAR_KEYWORD for p in sig.parameters.values()
-                    ):
-                        req_kwargs["timeout"] = self.timeout
-                except (AttributeError, ValueError, TypeError) as exc:
-                    log.debug("Session.get signature missing timeout: %s", exc)
-                try:
-                    resp = self.session.get(  # type: ignore[union-attr]
-                        url,
-                        headers=self._headers(),
-                        params=params,
-                        **req_kwargs,
-                    )
-                except Exception as exc:
-                    if attempt < self.max_retries:
+                page_number += 1
+                page_items: list[dict[str, Any]] = body.get("data", {}).get("lifelogs", []) or []
+                collected.extend(page_items)
+                next_cursor = body.get("meta", {}).get("lifelogs", {}).get("nextCursor")
+                more = bool(next_cursor) and (limit is None or len(collected) < limit)
+                if executor is not None and more:
+                    pending = executor.submit(_fetch_page, next_cursor)
+                if page_callback is not None:
+                    page_callback(page_items, next_cursor)
+                if progress_callback is not None:
+                    try:
+                        progress_callback(page_number, len(collected))
+                    except Exception:
+                        log.debug("Progress callback failed", exc_info=True)
+
+                if limit is not None and len(collected) >= limit:
+                    return collected[:limit]
+
+                if next_cursor:
+                    self.last_next_cursor = next_cursor
+                if not more:
+                    break
+                if pending is not None:
+                    body, pending = pending.result(), None
+                else:
+                    body = _fetch_page(next_cursor)
+                self.last_page_cursor = next_cursor
+        finally:
+            if executor is not None:
+                # Do not wait for an abandoned prefetch (e.g. a callback raised)
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return collected
+
+    def get_lifelogs_page(
+        self,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        direction: str = "desc",
+        include_markdown: bool = True,
+        include_headings: bool = True,
+        date: str | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        timezone: str | None = None,
+        is_starred: bool | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch a single page of lifelogs (one request, no pagination).
+
+        Passing the ``last_page_cursor`` and query of a ``get_lifelogs`` page
+        requests that same page again, e.g. with bodies included.
+        """
+        params = self._list_params(
+            limit=max(1, int(limit)),
+            direction=direction,
+            include_markdown=include_markdown,
+            include_headings=include_headings,
+            date=date,
+            start=start,
+            end=end,
+            timezone=timezone,
+            is_starred=is_starred,
+            cursor=cursor,
+        )
+        body = self._get_json(f"{self.base_url}/v1/lifelogs", params)
+        items = body.get("data", {}).get("lifelogs", []) or []
+        return [ll for ll in items if isinstance(ll, dict)]
+
+    @staticmethod
+    def _list_params(
+        *,
+        limit: int,
+        direction: str,
+        include_markdown: bool,
+        include_headings: bool,
+        date: str | None,
+        start: str | None,
+        end: str | None,
+        timezone: str | None,
+        is_starred: bool | None,
+        cursor: str | None,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {
+            "limit": limit,
+            "direction": direction,
+            "includeMarkdown": "true" if include_markdown else "false",
+            "includeHeadings": "true" if include_headings else "false",
+        }
+        if date:
+            params["date"] = date
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        if timezone:
+            params["timezone"] = timezone
+        if is_starred is not None:
+            params["isStarred"] = "true" if is_starred else "false"
+        if cursor:
+            params["cursor"] = cursor
+        return params
+
+    def _get_json(
+        self,
+        url: str,
+        params: dict[str, Any],
+        *,
+        on_retry: Callable[[dict[str, Any]], None] | None = None,
+    ) -> Any:
+        """GET url with the retry/backoff policy and return the decoded JSON body.
+
+        ``on_retry(params)`` may adjust the query before each retry. The duration and
+        size of the successful response are kept in ``last_response_seconds`` and
+        ``last_response_bytes``. With a ``response_cache``, fresh entries are served
+        without a request and stale ones are revalidated via ETag/Last-Modified; both
+        paths report the stored entry's size as ``last_response_bytes``.
+        """
+        cache = self.response_cache
+        if cache is None:
+            return self._decode(self._send(url, params, on_retry=on_retry))
+        started = time.perf_counter()
+        entry = cache.get(self.api_key, url, params)
+        if entry is not None and cache.is_fresh(entry):
+            cache.hits += 1
+            # Served locally: the page sizer sees the lookup time and the stored size
+            with self._stats_lock:
+                self.last_response_seconds = time.perf_counter() - started
+                self.last_response_bytes = entry.size
+            return entry.body
+        resp = self._send(
+            url,
+            params,
+            on_retry=on_retry,
+            extra_headers=entry.validators() if entry is not None else None,
+        )
+        etag = self._header(resp, "ETag")
+        last_modified = self._header(resp, "Last-Modified")
+        if entry is not None and getattr(resp, "status_code", None) == 304:
+            cache.revalidated += 1
+            body = entry.body
+            with self._stats_lock:
+                # A 304 has no body; the page it stands for is the stored one
+                self.last_response_bytes = entry.size
+        else:
+            cache.misses += 1
+            body = self._decode(resp)
+        cache.put(self.api_key, url, params, body, etag=etag, last_modified=last_modified)
+        return body
+
+    def _send(
+        self,
+        url: str,
+        params: dict[str, Any],
+        *,
+        on_retry: Callable[[dict[str, Any]], None] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Run the request/retry loop and return the successful (or 304) response."""
+        headers = self._headers()
+        if extra_headers:
+            headers.update(extra_headers)
+        # perform request with retry loop
+        attempt = 0
+        while True:
+            # Pass timeout only if the session.get signature accepts it (keeps tests' fakes working)
+            req_kwargs: dict[str, Any] = {}
+            try:
+                import inspect as _inspect
+
+                sig = _inspect.signature(self.session.get)
+                if "timeout" in sig.parameters or any(
+                    p.kind == p.VAR_KEYWORD for p in sig.parameters.values()
+                ):
+                    req_kwargs["timeout"] = self.timeout
+            except (AttributeError, ValueError, TypeError) as exc:
+                log.debug("Session.get signature missing timeout: %s", exc)
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            started = time.perf_counter()
+            with self._stats_lock:
+                self.requests_sent += 1
+            try:
+                resp = self.session.get(
+                    url,
+                    headers=headers,
+                    params=params,
+                    **req_kwargs,
+                )
+            except Exception as exc:
+                with self._stats_lock:
+                    self.network_seconds += time.perf_counter() - started
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                if attempt < self.max_retries:
+                    delay = self._backoff_delay(attempt + 1)
+                    if self._spend_retry(delay):
                         attempt += 1
-                        delay = self.backoff_factor * (2 ** (attempt - 1))
+                        with self._stats_lock:
+                            self.retries += 1
+                        if on_retry is not None:
+                            on_retry(params)
                         self.sleep_fn(delay)
                         continue
-                    msg = self._network_error_message(exc)
-                    raise ApiError(
-                        msg,
-                        cause=exc,
-                        context={
-                            "url": url,
-                            "params": {k: params.get(k) for k in ("cursor", "limit", "date") if params.get(k)},
-                        },
-                    ) from exc
-                if getattr(resp, "ok", False):
-                    break
-                status = getattr(resp, "status_code", None)
-                if status in self.retry_statuses and attempt < self.max_retries:
+                msg = self._network_error_message(exc)
+                raise ApiError(
+                    msg,
+                    cause=exc,
+                    context={
+                        "url": url,
+                        "params": {k: params.get(k) for k in ("cursor", "limit", "date") if params.get(k)},
+                    },
+                ) from exc
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                self.network_seconds += elapsed
+            status = getattr(resp, "status_code", None)
+            if self.circuit_breaker is not None and status != 429:
+                # Throttling says nothing about upstream health; 5xx counts as a failure
+                if isinstance(status, int) and status >= 500:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+            if getattr(resp, "ok", False) or status == 304:
+                content = getattr(resp, "content", None)
+                with self._stats_lock:
+                    self.last_response_seconds = elapsed
+                    self.last_response_bytes = len(content) if isinstance(content, (bytes, bytearray)) else 0
+                    self.bytes_received += self.last_response_bytes
+                break
+            if status in self.retry_statuses and attempt < self.max_retries:
+                # Use Retry-After header if provided; otherwise jittered exponential backoff
+                retry_after = self._retry_after_seconds(resp)
+                delay = retry_after if retry_after is not None else self._backoff_delay(attempt + 1)
+                if self._spend_retry(delay):
                     attempt += 1
-                    # Use Retry-After header if provided; otherwise exponential backoff
-                    headers = getattr(resp, "headers", {}) or {}
-                    ra = headers.get("Retry-After") if isinstance(headers, dict) else None
-                    delay = None
-                    if ra is not None:
-                        # Retry-After can be seconds or HTTP-date per RFC 7231
-                        try:
-                            delay = float(ra)
-                        except Exception:
-                            try:
-                                from datetime import datetime, timezone as _tz
-                                from email.utils import parsedate_to_datetime as _pdt
-
-                                dt = _pdt(str(ra))
-                                if dt is not None:
-                                    now = datetime.now(_tz.utc)  # noqa: UP017
-                                    if dt.tzinfo is None:
-                                        dt = dt.replace(tzinfo=_tz.utc)  # noqa: UP017
-                                    delay = max(0.0, (dt - now).total_seconds())
-                            except Exception:
-                                delay = None
-                    if delay is None:
-                        delay = self.backoff_factor * (2 ** (attempt - 1))
+                    with self._stats_lock:
+                        self.retries += 1
+                    if retry_after is not None and self.rate_limiter is not None:
+                        # Server-provided pause applies to every client sharing the bucket
+                        self.rate_limiter.defer(retry_after)
+                    if on_retry is not None:
+                        on_retry(params)
                     self.sleep_fn(delay)
                     continue
-                # Build informative error message for non-retryable errors
-                detail = self._error_detail(resp)
-                raise ApiError(
-                    f"HTTP {status} error fetching lifelogs: {detail}",
-                    status_code=status,
-                    context={"url": url, "params": {"cursor": params.get("cursor")}},
-                )
+            # Build informative error message for non-retryable errors
+            detail = self._error_detail(resp)
+            raise ApiError(
+                f"HTTP {status} error fetching lifelogs: {detail}",
+                status_code=status,
+                context={"url": url, "params": {"cursor": params.get("cursor")}},
+            )
 
-            body = resp.json()
-            page_items: list[dict[str, Any]] = body.get("data", {}).get("lifelogs", []) or []
-            collected.extend(page_items)
-            if progress_callback is not None:
-                try:
-                    progress_callback(page_number, len(collected))
-                except Exception:
-                    log.debug("Progress callback failed", exc_info=True)
-
-            if limit is not None and len(collected) >= limit:
-                return collected[:limit]
-
-            current_cursor = body.get("meta", {}).get("lifelogs", {}).get("nextCursor")
-            if current_cursor:
-                self.last_next_cursor = current_cursor
-            if not current_cursor:
-                break
+        return resp
 
-        return collected
+    def _decode(self, resp: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return resp.json()
+        finally:
+            with self._stats_lock:
+                self.decode_seconds += time.perf_counter() - started
+
+    def _backoff_delay(self, attempt: int) -> float:
+        if self.jitter:
+            return full_jitter(attempt, self.backoff_factor, cap=self.max_backoff)
+        return min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+
+    def _spend_retry(self, delay: float) -> bool:
+        if self.retry_budget is None or self.retry_budget.try_spend(delay):
+            return True
+        log.warning(
+            "Retry budget exhausted (%s retries, %.1fs spent); giving up",
+            self.retry_budget.retries,
+            self.retry_budget.seconds,
+        )
+        return False
+
+    @staticmethod
+    def _header(resp: Any, name: str) -> str | None:
+        # requests exposes a case-insensitive Mapping, test fakes a plain dict
+        headers = getattr(resp, "headers", None)
+        value = headers.get(name) if isinstance(headers, Mapping) else None
+        return str(value) if value is not None else None
+
+    @classmethod
+    def _retry_after_seconds(cls, resp: Any) -> float | None:
+        ra = cls._header(resp, "Retry-After")
+        if ra is None:
+            return None
+        # Retry-After can be seconds or HTTP-date per RFC 7231
+        try:
+            return float(ra)
+        except Exception:
+            try:
+                from datetime import datetime, timezone as _tz
+                from email.utils import parsedate_to_datetime as _pdt
+
+                dt = _pdt(str(ra))
+                if dt is not None:
+                    now = datetime.now(_tz.utc)  # noqa: UP017
+                    if dt.tzinfo is None:
+                        dt = dt.replace(tzinfo=_tz.utc)  # noqa: UP017
+                    return max(0.0, (dt - now).total_seconds())
+            except Exception:
+                return None
+        return None
 
     def _error_detail(self, resp: Any) -> str:
         """Extract an informative error message from a failed HTTP response."""
@@ -0,0 +1,46 @@
+"""Adaptive page sizing for paginated list requests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Largest ``limit`` the adaptive mode will request per page
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class AdaptivePageSize:
+    """Grows or shrinks the page ``limit`` from observed latency, payload size and errors.
+
+    Fast, small pages grow the size by half; slow or oversized pages shrink it in
+    proportion to how far they overshot; a failed/retried request halves it.
+    """
+
+    size: int
+    min_size: int = 1
+    max_size: int = MAX_PAGE_SIZE
+    target_seconds: float = 2.0
+    max_bytes: int = 8 * 1024 * 1024
+
+    def __post_init__(self) -> None:
+        self.size = self._clamp(self.size)
+
+    def _clamp(self, value: float) -> int:
+        return max(self.min_size, min(self.max_size, int(value)))
+
+    def observe(self, seconds: float, nbytes: int = 0) -> int:
+        """Record a successful page and return the size for the next one."""
+        ratio = max(
+            seconds / self.target_seconds if self.target_seconds > 0 else 0.0,
+            nbytes / self.max_bytes if self.max_bytes > 0 else 0.0,
+        )
+        if ratio > 1.5:
+            self.size = self._clamp(self.size / ratio)
+        elif ratio < 0.5:
+            self.size = self._clamp(self.size + max(1, self.size // 2))
+        return self.size
+
+    def failed(self) -> int:
+        """Record a failed or retried request and return the reduced size."""
+        self.size = self._clamp(self.size // 2)
+        return self.size
@@ -0,0 +1,84 @@
+"""Client-side token-bucket rate limiting shared across threads."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import ClassVar
+
+
+class TokenBucket:
+    """Paces requests to ``rate`` per second with bursts of up to ``burst``.
+
+    ``acquire()`` reserves a token and sleeps until it is available; concurrent
+    callers queue up in reservation order. ``defer(seconds)`` (fed from
+    ``Retry-After``) pauses every client sharing the bucket and drops the burst
+    allowance so requests resume at the steady rate.
+    """
+
+    _shared: ClassVar[dict[tuple[float, float], TokenBucket]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst) if burst and burst > 0 else max(1.0, self.rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        # Time up to which tokens have been accounted; in the future while deferred
+        self._updated = clock()
+
+    @classmethod
+    def shared(cls, rate: float, burst: float | None = None) -> TokenBucket:
+        """Return the process-wide bucket for (rate, burst), creating it on first use."""
+        key = (float(rate), float(burst or 0))
+        with cls._shared_lock:
+            bucket = cls._shared.get(key)
+            if bucket is None:
+                bucket = cls._shared[key] = cls(rate, burst)
+            return bucket
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            deficit = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(0.0, self._updated - now) + deficit
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns the time slept."""
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def defer(self, seconds: float) -> None:
+        """Hold all callers for ``seconds`` (e.g. a server ``Retry-After`` hint)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            until = now + seconds
+            if until > self._updated:
+                # One request may go at the end of the pause, the rest at the steady rate
+                self._tokens = min(self._tokens, 1.0)
+                self._updated = until
@@ -0,0 +1,168 @@
+"""On-disk cache of API response bodies with ETag/Last-Modified revalidation and a TTL."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from limitless_tools import codec
+
+log = logging.getLogger(__name__)
+
+# Entries older than this are pruned even if they carry validators
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 3600.0
+# Oldest entries are pruned once the cache directory grows past this size
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Writes between prunes after the first one of a run
+PRUNE_EVERY = 256
+
+
+@dataclass
+class CachedResponse:
+    body: Any
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    # Size of the stored entry in bytes
+    size: int = 0
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Stores JSON bodies under ``root/<aa>/<sha256>.json`` keyed by account, URL and params.
+
+    An entry younger than ``ttl`` seconds is served without a request; older
+    entries with an ETag/Last-Modified are revalidated (a 304 reuses the body).
+    A response that has neither validators nor a ``ttl`` could never be reused,
+    so it is not stored. The first write of a run, and every ``PRUNE_EVERY``
+    writes after it, removes entries older than ``max_age`` (or ``ttl`` if that is
+    longer) and then the oldest ones until the cache fits in ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        ttl: float = 0.0,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = root
+        self.ttl = ttl
+        self.max_age = max(max_age, ttl)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._writes_until_prune = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.pruned = 0
+
+    def _path(self, api_key: str, url: str, params: dict[str, Any]) -> Path:
+        # The key is hashed so cached pages never expose it, and accounts never share entries
+        material = codec.dumps_bytes(
+            {"account": hashlib.sha256(api_key.encode("utf-8")).hexdigest(), "url": url, "params": params},
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(material).hexdigest()
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def get(self, api_key: str, url: str, params: dict[str, Any]) -> CachedResponse | None:
+        path = self._path(api_key, url, params)
+        try:
+            raw = path.read_bytes()
+            data = codec.loads(raw)
+        except FileNotFoundError:
+            return None
+        except (codec.JSONDecodeError, OSError) as exc:
+            log.debug("Ignoring unreadable cache entry %s: %s", path, exc)
+            return None
+        if not isinstance(data, dict) or "body" not in data:
+            return None
+        return CachedResponse(
+            body=data["body"],
+            stored_at=float(data.get("storedAt") or 0.0),
+            etag=data.get("etag"),
+            last_modified=data.get("lastModified"),
+            size=len(raw),
+        )
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return self.ttl > 0 and self._clock() - entry.stored_at < self.ttl
+
+    def put(
+        self,
+        api_key: str,
+        url: str,
+        params: dict[str, Any],
+        body: Any,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        if not (etag or last_modified or self.ttl > 0):
+            return
+        path = self._path(api_key, url, params)
+        record = {"storedAt": self._clock(), "etag": etag, "lastModified": last_modified, "body": body}
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(codec.dumps_bytes(record))
+            os.replace(tmp, path)
+        except OSError as exc:
+            # A cache write failure must never fail the request
+            tmp.unlink(missing_ok=True)
+            log.debug("Unable to write cache entry %s: %s", path, exc)
+            return
+        if self._writes_until_prune <= 0:
+            self._writes_until_prune = PRUNE_EVERY
+            self.prune()
+        self._writes_until_prune -= 1
+
+    def prune(self) -> int:
+        """Remove expired entries, then the oldest until within ``max_bytes``. Returns the count removed."""
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        # File mtimes are wall-clock time, so the injected clock is not used here
+        cutoff = time.time() - self.max_age
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        # Oldest first: expired entries go, then the rest while the cache is over budget
+        for mtime, size, path in sorted(entries, key=lambda e: e[0]):
+            if mtime >= cutoff and total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                log.debug("Unable to prune cache entry %s: %s", path, exc)
+                continue
+            total -= size
+            removed += 1
+        self.pruned += removed
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses, "pruned": self.pruned}
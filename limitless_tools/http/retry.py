@@ -0,0 +1,45 @@
+"""Retry backoff with full jitter and a run-wide retry budget."""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Callable
+
+
+def full_jitter(
+    attempt: int,
+    backoff_factor: float,
+    *,
+    cap: float = 30.0,
+    rand: Callable[[], float] = random.random,
+) -> float:
+    """Return a delay drawn uniformly from ``[0, min(cap, backoff_factor * 2**(attempt-1))]``."""
+    return rand() * min(cap, backoff_factor * (2 ** max(0, attempt - 1)))
+
+
+class RetryBudget:
+    """Caps the retries (count and total sleep) spent across every request of a run.
+
+    One budget is shared by all pages of a sync, so a long run survives scattered
+    transient failures but cannot stall indefinitely when the API stays unhealthy.
+    ``None`` limits are unbounded.
+    """
+
+    def __init__(self, max_retries: int | None = None, max_seconds: float | None = None) -> None:
+        self.max_retries = max_retries
+        self.max_seconds = max_seconds
+        self.retries = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def try_spend(self, delay: float) -> bool:
+        """Reserve one retry sleeping ``delay`` seconds; False when it would exceed the budget."""
+        with self._lock:
+            if self.max_retries is not None and self.retries + 1 > self.max_retries:
+                return False
+            if self.max_seconds is not None and self.seconds + delay > self.max_seconds:
+                return False
+            self.retries += 1
+            self.seconds += delay
+            return True
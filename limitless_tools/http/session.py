@@ -0,0 +1,62 @@
+"""Shared, pool-tuned ``requests`` session for API clients."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+
+
+def _has_module(name: str) -> bool:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+# Advertise brotli only when urllib3 can decode it (brotli/brotlicffi installed)
+ACCEPT_ENCODING = "gzip, deflate, br" if _has_module("brotli") or _has_module("brotlicffi") else "gzip, deflate"
+
+_sessions: dict[tuple[int, bool], Any] = {}
+_sessions_lock = threading.Lock()
+
+
+def build_session(*, pool_size: int = DEFAULT_POOL_SIZE, keep_alive: bool = True) -> Any:
+    """Return a ``requests.Session`` with an ``HTTPAdapter`` sized for ``pool_size`` connections.
+
+    Returns None when ``requests`` is not installed.
+    """
+    try:
+        requests = importlib.import_module("requests")
+        adapters = importlib.import_module("requests.adapters")
+    except ImportError:  # pragma: no cover - requests should be present in dev
+        return None
+    size = max(1, int(pool_size))
+    session = requests.Session()
+    # Retries are handled by LimitlessClient; the adapter only pools connections
+    adapter = adapters.HTTPAdapter(pool_connections=size, pool_maxsize=size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def shared_session(*, pool_size: int = DEFAULT_POOL_SIZE, keep_alive: bool = True) -> Any:
+    """Return the process-wide session for these settings, so clients reuse TCP/TLS connections."""
+    key = (max(1, int(pool_size)), keep_alive)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = build_session(pool_size=key[0], keep_alive=keep_alive)
+            if session is not None:
+                _sessions[key] = session
+                log.debug("Created shared HTTP session (pool_size=%s, keep_alive=%s)", key[0], keep_alive)
+        return session
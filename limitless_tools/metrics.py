@@ -0,0 +1,120 @@
+"""In-process metrics registry with Prometheus textfile and JSON export."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+from limitless_tools import codec
+from limitless_tools.errors import StorageError
+
+MetricKind = Literal["counter", "gauge"]
+MetricsFormat = Literal["prometheus", "json"]
+METRICS_FORMATS: tuple[str, ...] = ("prometheus", "json")
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+@dataclass
+class Metric:
+    name: str
+    kind: MetricKind
+    help: str
+    samples: dict[LabelKey, float] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    """Named counters and gauges with optional labels.
+
+    Counters only go up (``inc``); gauges hold the last value (``set``). A metric
+    is declared on first use; using a name with another kind raises ``ValueError``.
+    """
+
+    def __init__(self, *, clock: Any = time.time) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def _metric(self, name: str, kind: MetricKind, help_text: str) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Metric(name, kind, help_text)
+        elif metric.kind != kind:
+            raise ValueError(f"Metric {name} is a {metric.kind}, not a {kind}")
+        return metric
+
+    def inc(self, name: str, value: float = 1.0, *, help: str = "", **labels: Any) -> None:  # noqa: A002
+        if value < 0:
+            raise ValueError(f"Counter {name} cannot decrease")
+        key = _label_key(labels)
+        with self._lock:
+            metric = self._metric(name, "counter", help)
+            metric.samples[key] = metric.samples.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, *, help: str = "", **labels: Any) -> None:  # noqa: A002
+        with self._lock:
+            self._metric(name, "gauge", help).samples[_label_key(labels)] = float(value)
+
+    def get(self, name: str, **labels: Any) -> float | None:
+        metric = self._metrics.get(name)
+        return metric.samples.get(_label_key(labels)) if metric is not None else None
+
+    def to_prometheus(self) -> str:
+        """Render the text exposition format (for node_exporter's textfile collector)."""
+        lines: list[str] = []
+        with self._lock:
+            for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+                if metric.help:
+                    lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+                for key, value in sorted(metric.samples.items()):
+                    labels = ",".join(f'{k}="{_escape(v)}"' for k, v in key)
+                    lines.append(f"{metric.name}{{{labels}}} {_number(value)}" if labels else f"{metric.name} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "timestamp": self._clock(),
+                "metrics": {
+                    m.name: {
+                        "type": m.kind,
+                        "help": m.help,
+                        "samples": [{"labels": dict(k), "value": v} for k, v in sorted(m.samples.items())],
+                    }
+                    for m in sorted(self._metrics.values(), key=lambda m: m.name)
+                },
+            }
+
+    def write(self, path: str | Path, fmt: MetricsFormat | None = None) -> Path:
+        """Atomically write the metrics to ``path``; the format defaults from the suffix (.json or Prometheus)."""
+        target = Path(path).expanduser()
+        resolved = fmt or ("json" if target.suffix.lower() == ".json" else "prometheus")
+        payload = codec.dumps_bytes(self.to_json(), indent=True) if resolved == "json" else self.to_prometheus().encode("utf-8")
+        # Scrapers must never see a half-written file, so write a temp file and rename it
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(payload)
+            os.replace(tmp, target)
+        except OSError as exc:
+            tmp.unlink(missing_ok=True)
+            raise StorageError("Unable to write metrics file.", cause=exc, context={"path": str(target)}) from exc
+        return target
@@ -0,0 +1,221 @@
+"""Flattened, array-backed form of a lifelog ``contents`` tree.
+
+Nodes are stored in pre-order as parallel columns (type, speaker name, speaker
+identifier, start/end offsets, parent index, text span into one shared buffer). Building, slicing and
+aggregating never recurse, and NumPy is used for the column math when installed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from array import array
+from pathlib import Path
+from typing import Any
+
+from limitless_tools import codec
+
+NONE = -1
+_FORMAT_VERSION = 2
+
+
+def _numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:  # pragma: no cover - optional acceleration
+        return None
+
+
+def _intern(value: Any, ids: dict[str, int], table: list[str]) -> int:
+    """Return the index of ``value`` in ``table`` (appending it), or ``NONE`` when empty."""
+    if not value:
+        return NONE
+    key = str(value)
+    if key not in ids:
+        ids[key] = len(table)
+        table.append(key)
+    return ids[key]
+
+
+def _as_ms(value: Any) -> int:
+    return int(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else NONE
+
+
+class FlatContents:
+    """Pre-order node columns; ``parent``/``speaker_idx``/``identifier_idx`` use ``NONE`` for "no value".
+
+    ``speakers`` holds ``speakerName`` values and ``identifiers`` the ``speakerIdentifier``
+    role tags (e.g. ``"user"``); a node without a name has no speaker even if it is tagged.
+    """
+
+    __slots__ = (
+        "types",
+        "speakers",
+        "identifiers",
+        "type_idx",
+        "speaker_idx",
+        "identifier_idx",
+        "start_ms",
+        "end_ms",
+        "parent",
+        "text_start",
+        "text_end",
+        "text",
+    )
+
+    def __init__(self) -> None:
+        self.types: list[str] = []
+        self.speakers: list[str] = []
+        self.identifiers: list[str] = []
+        self.type_idx = array("i")
+        self.speaker_idx = array("i")
+        self.identifier_idx = array("i")
+        self.start_ms = array("q")
+        self.end_ms = array("q")
+        self.parent = array("i")
+        self.text_start = array("q")
+        self.text_end = array("q")
+        self.text = ""
+
+    def __len__(self) -> int:
+        return len(self.type_idx)
+
+    @classmethod
+    def from_contents(cls, contents: list[dict[str, Any]] | None) -> FlatContents:
+        """Flatten an API ``contents`` list (pre-order, iterative)."""
+        flat = cls()
+        type_ids: dict[str, int] = {}
+        speaker_ids: dict[str, int] = {}
+        identifier_ids: dict[str, int] = {}
+        chunks: list[str] = []
+        pos = 0
+        stack: list[tuple[dict[str, Any], int]] = [(n, NONE) for n in reversed(contents or []) if isinstance(n, dict)]
+        while stack:
+            node, parent = stack.pop()
+            idx = len(flat.type_idx)
+            node_type = str(node.get("type") or "")
+            if node_type not in type_ids:
+                type_ids[node_type] = len(flat.types)
+                flat.types.append(node_type)
+            text = node.get("content")
+            text = text if isinstance(text, str) else ""
+            flat.type_idx.append(type_ids[node_type])
+            flat.speaker_idx.append(_intern(node.get("speakerName"), speaker_ids, flat.speakers))
+            flat.identifier_idx.append(_intern(node.get("speakerIdentifier"), identifier_ids, flat.identifiers))
+            flat.start_ms.append(_as_ms(node.get("startOffsetMs")))
+            flat.end_ms.append(_as_ms(node.get("endOffsetMs")))
+            flat.parent.append(parent)
+            flat.text_start.append(pos)
+            pos += len(text)
+            flat.text_end.append(pos)
+            chunks.append(text)
+            children = node.get("children") or []
+            stack.extend((c, idx) for c in reversed(children) if isinstance(c, dict))
+        flat.text = "".join(chunks)
+        return flat
+
+    def text_of(self, i: int) -> str:
+        return self.text[self.text_start[i] : self.text_end[i]]
+
+    def speaker_of(self, i: int) -> str | None:
+        s = self.speaker_idx[i]
+        return self.speakers[s] if s != NONE else None
+
+    def identifier_of(self, i: int) -> str | None:
+        s = self.identifier_idx[i]
+        return self.identifiers[s] if s != NONE else None
+
+    def node(self, i: int) -> dict[str, Any]:
+        """Return node i as an API-shaped dict (without children)."""
+        return {
+            "type": self.types[self.type_idx[i]] or None,
+            "content": self.text_of(i) or None,
+            "speakerName": self.speaker_of(i),
+            "speakerIdentifier": self.identifier_of(i),
+            "startOffsetMs": self.start_ms[i] if self.start_ms[i] != NONE else None,
+            "endOffsetMs": self.end_ms[i] if self.end_ms[i] != NONE else None,
+        }
+
+    def talk_time_by_speaker(self) -> dict[str, int]:
+        """Total milliseconds attributed to each speaker (nodes with both offsets)."""
+        totals = [0] * len(self.speakers)
+        np = _numpy()
+        if np is not None and len(self):
+            spk = np.frombuffer(self.speaker_idx, dtype=np.int32)
+            start = np.frombuffer(self.start_ms, dtype=np.int64)
+            end = np.frombuffer(self.end_ms, dtype=np.int64)
+            mask = (spk != NONE) & (start != NONE) & (end != NONE) & (end >= start)
+            sums = np.bincount(spk[mask], weights=(end - start)[mask], minlength=len(self.speakers))
+            totals = [int(v) for v in sums]
+        else:
+            for s, a, b in zip(self.speaker_idx, self.start_ms, self.end_ms, strict=True):
+                if s != NONE and a != NONE and b != NONE and b >= a:
+                    totals[s] += b - a
+        return dict(zip(self.speakers, totals, strict=True))
+
+    def indices_in_window(self, start_ms: int, end_ms: int) -> list[int]:
+        """Indices of timed nodes overlapping [start_ms, end_ms)."""
+        np = _numpy()
+        if np is not None and len(self):
+            start = np.frombuffer(self.start_ms, dtype=np.int64)
+            end = np.frombuffer(self.end_ms, dtype=np.int64)
+            mask = (start != NONE) & (end != NONE) & (start < end_ms) & (end > start_ms)
+            return [int(i) for i in np.nonzero(mask)[0]]
+        return [
+            i
+            for i, (a, b) in enumerate(zip(self.start_ms, self.end_ms, strict=True))
+            if a != NONE and b != NONE and a < end_ms and b > start_ms
+        ]
+
+    def to_contents(self) -> list[dict[str, Any]]:
+        """Rebuild a nested ``contents`` list (string timestamps are not kept)."""
+        roots: list[dict[str, Any]] = []
+        built: list[dict[str, Any]] = []
+        for i in range(len(self)):
+            node = {k: v for k, v in self.node(i).items() if v is not None}
+            node["children"] = []
+            built.append(node)
+            p = self.parent[i]
+            (built[p]["children"] if p != NONE else roots).append(node)
+        return roots
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _FORMAT_VERSION,
+            "types": self.types,
+            "speakers": self.speakers,
+            "identifiers": self.identifiers,
+            "type": self.type_idx.tolist(),
+            "speaker": self.speaker_idx.tolist(),
+            "identifier": self.identifier_idx.tolist(),
+            "startMs": self.start_ms.tolist(),
+            "endMs": self.end_ms.tolist(),
+            "parent": self.parent.tolist(),
+            "textStart": self.text_start.tolist(),
+            "textEnd": self.text_end.tolist(),
+            "text": self.text,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FlatContents:
+        flat = cls()
+        flat.types = list(data.get("types") or [])
+        flat.speakers = list(data.get("speakers") or [])
+        flat.type_idx = array("i", data.get("type") or [])
+        flat.speaker_idx = array("i", data.get("speaker") or [])
+        flat.identifiers = list(data.get("identifiers") or [])
+        # Version 1 files have no identifier column
+        flat.identifier_idx = array("i", data.get("identifier") or [NONE] * len(flat.type_idx))
+        flat.start_ms = array("q", data.get("startMs") or [])
+        flat.end_ms = array("q", data.get("endMs") or [])
+        flat.parent = array("i", data.get("parent") or [])
+        flat.text_start = array("q", data.get("textStart") or [])
+        flat.text_end = array("q", data.get("textEnd") or [])
+        flat.text = str(data.get("text") or "")
+        return flat
+
+    def dump(self, path: Path) -> None:
+        path.write_bytes(codec.dumps_bytes(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: Path) -> FlatContents:
+        return cls.from_dict(codec.loads(path.read_bytes()))
@@ -0,0 +1,115 @@
+"""Compact lifelog representation with a lazily loaded body."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from limitless_tools.models.flat_contents import FlatContents
+
+SUMMARY_FIELDS: tuple[str, ...] = ("id", "title", "startTime", "endTime", "isStarred", "updatedAt")
+
+
+@dataclass(slots=True)
+class LifelogRecord:
+    """Header fields of a lifelog; ``markdown``/``contents`` are loaded only when accessed.
+
+    Records built from index rows (or with ``keep_body=False``) hold no body and
+    call ``loader`` on first access, so list/filter passes never decode transcripts.
+    """
+
+    id: Any
+    title: Any = None
+    startTime: Any = None
+    endTime: Any = None
+    isStarred: Any = None
+    updatedAt: Any = None
+    path: str | None = None
+    loader: Callable[[], dict[str, Any] | None] | None = field(default=None, repr=False, compare=False)
+    _body: dict[str, Any] | None = field(default=None, repr=False, compare=False)
+    _row: dict[str, Any] | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(
+        cls,
+        lifelog: dict[str, Any],
+        *,
+        path: str | None = None,
+        loader: Callable[[], dict[str, Any] | None] | None = None,
+        keep_body: bool = True,
+    ) -> LifelogRecord:
+        return cls(
+            id=lifelog.get("id"),
+            title=lifelog.get("title"),
+            startTime=lifelog.get("startTime"),
+            endTime=lifelog.get("endTime"),
+            isStarred=lifelog.get("isStarred"),
+            updatedAt=lifelog.get("updatedAt"),
+            path=path,
+            loader=loader,
+            _body=lifelog if keep_body else None,
+        )
+
+    @classmethod
+    def from_summary(
+        cls, row: dict[str, Any], *, loader: Callable[[], dict[str, Any] | None] | None = None
+    ) -> LifelogRecord:
+        """Build from an ``index.json`` row; the row is returned unchanged by ``summary()``."""
+        path = row.get("path")
+        return cls(
+            id=row.get("id"),
+            title=row.get("title"),
+            startTime=row.get("startTime"),
+            endTime=row.get("endTime"),
+            isStarred=row.get("isStarred"),
+            updatedAt=row.get("updatedAt"),
+            path=path if isinstance(path, str) else None,
+            loader=loader,
+            _row=row,
+        )
+
+    @property
+    def date(self) -> str:
+        return str(self.startTime or "")[:10]
+
+    def body(self) -> dict[str, Any] | None:
+        """Return the full lifelog dict, loading it on first access."""
+        if self._body is None and self.loader is not None:
+            self._body = self.loader()
+        return self._body
+
+    @property
+    def markdown(self) -> str | None:
+        body = self.body()
+        md = body.get("markdown") if body is not None else None
+        return md if isinstance(md, str) else None
+
+    @property
+    def contents(self) -> list[Any] | None:
+        body = self.body()
+        contents = body.get("contents") if body is not None else None
+        return contents if isinstance(contents, list) else None
+
+    def content_nodes(self) -> list[Any]:
+        """Validate ``contents`` into ``ContentNode`` models (pydantic is imported on demand)."""
+        from limitless_tools.models.lifelog import ContentNode
+
+        return [ContentNode.model_validate(node) for node in self.contents or []]
+
+    def flat_contents(self) -> FlatContents:
+        """Return ``contents`` flattened into parallel arrays (see ``FlatContents``)."""
+        return FlatContents.from_contents(self.contents)
+
+    def release_body(self) -> None:
+        """Drop a loaded body (it is reloaded on next access when a loader is set)."""
+        if self.loader is not None:
+            self._body = None
+
+    def summary(self) -> dict[str, Any]:
+        """Return the index-row shape used by list/search/export-csv."""
+        if self._row is not None:
+            return self._row
+        row: dict[str, Any] = {k: getattr(self, k) for k in SUMMARY_FIELDS}
+        row["path"] = self.path
+        return row
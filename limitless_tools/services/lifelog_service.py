@@ -3,14 +3,33 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from functools import partial, wraps
 from pathlib import Path
+from typing import Any, TypeVar, cast
 
+from limitless_tools import codec
 from limitless_tools.config.env import resolve_timezone
 from limitless_tools.errors import LimitlessError, ServiceError
+from limitless_tools.http.breaker import CircuitBreaker
 from limitless_tools.http.client import LimitlessClient
-from limitless_tools.storage.json_repo import JsonFileRepository
+from limitless_tools.http.rate_limit import TokenBucket
+from limitless_tools.http.response_cache import ResponseCache
+from limitless_tools.http.retry import RetryBudget
+from limitless_tools.http.session import DEFAULT_POOL_SIZE, shared_session
+from limitless_tools.metrics import MetricsRegistry
+from limitless_tools.models.record import LifelogRecord
+from limitless_tools.storage.cache import LifelogCache
+from limitless_tools.storage.json_repo import (
+    JsonFileRepository,
+    SaveResult,
+    StorageLayout,
+    iter_lifelogs,
+    load_lifelog,
+)
+from limitless_tools.storage.readers import read_json_file
 from limitless_tools.storage.state_repo import StateRepository
 
 log = logging.getLogger(__name__)
@@ -18,8 +37,8 @@ log = logging.getLogger(__name__)
 
 def _load_json(path: Path) -> object | None:
     try:
-        return json.loads(path.read_text())
-    except (json.JSONDecodeError, OSError) as exc:
+        return read_json_file(path)
+    except (codec.JSONDecodeError, OSError) as exc:
         log.debug("Failed to read JSON from %s: %s", path, exc)
         return None
 
@@ -42,6 +61,131 @@ class SaveReport:
         return self.created + self.updated + self.unchanged
 
 
+@dataclass
+class PhaseTimings:
+    """Cumulative seconds per phase of a fetch/sync, plus request/item/byte counts, updated per page.
+
+    ``network`` is time inside HTTP requests (including failed attempts), ``decode``
+    JSON parsing, ``save`` writing lifelogs and ``index`` writing index.json. With
+    prefetch, network time overlaps the other phases, so the sum can exceed wall time.
+    """
+
+    network: float = 0.0
+    decode: float = 0.0
+    save: float = 0.0
+    index: float = 0.0
+    items: int = 0
+    bytes: int = 0
+    requests: int = 0
+    retries: int = 0
+    # Rows in index.json after the last write (sync only)
+    index_entries: int | None = None
+    # Earliest startTime seen so far (pages arrive newest first)
+    oldest_start: str | None = None
+
+    def observe_page(self, page: list[dict[str, Any]]) -> None:
+        self.items += len(page)
+        starts = [str(x.get("startTime")) for x in page if x.get("startTime")]
+        if starts:
+            oldest = min(starts)
+            if self.oldest_start is None or oldest < self.oldest_start:
+                self.oldest_start = oldest
+
+    def pull_client(self, client: Any, baseline: tuple[float, float, int, int, int]) -> None:
+        """Set network/decode/bytes/requests/retries from the client's running totals since ``baseline``."""
+        network, decode, nbytes, requests, retries = _client_totals(client)
+        self.network = network - baseline[0]
+        self.decode = decode - baseline[1]
+        self.bytes = nbytes - baseline[2]
+        self.requests = requests - baseline[3]
+        self.retries = retries - baseline[4]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "network_seconds": round(self.network, 3),
+            "decode_seconds": round(self.decode, 3),
+            "save_seconds": round(self.save, 3),
+            "index_seconds": round(self.index, 3),
+            "items": self.items,
+            "bytes": self.bytes,
+        }
+
+
+def _client_totals(client: Any) -> tuple[float, float, int, int, int]:
+    # Injected fake clients may not keep these counters
+    return (
+        float(getattr(client, "network_seconds", 0.0) or 0.0),
+        float(getattr(client, "decode_seconds", 0.0) or 0.0),
+        int(getattr(client, "bytes_received", 0) or 0),
+        int(getattr(client, "requests_sent", 0) or 0),
+        int(getattr(client, "retries", 0) or 0),
+    )
+
+
+_Op = TypeVar("_Op", bound=Callable[..., list[str]])
+
+
+def _metered(operation: str) -> Callable[[_Op], _Op]:
+    """Record a run of ``operation`` into ``self.metrics`` (when set), also when it fails."""
+
+    def decorate(method: _Op) -> _Op:
+        @wraps(method)
+        def wrapper(self: LifelogService, **kwargs: Any) -> list[str]:
+            if self.metrics is None:
+                return method(self, **kwargs)
+            if kwargs.get("timings") is None:
+                kwargs["timings"] = PhaseTimings()
+            started = time.perf_counter()
+            ok = False
+            try:
+                result = method(self, **kwargs)
+                ok = True
+                return result
+            finally:
+                self._record_run(
+                    operation,
+                    timings=kwargs["timings"],
+                    report=self.last_report if ok else None,
+                    duration=time.perf_counter() - started,
+                    success=ok,
+                )
+
+        return cast(_Op, wrapper)
+
+    return decorate
+
+
+def _save_all(repo: Any, lifelogs: list[dict[str, Any]], *, operation: str) -> list[SaveResult]:
+    """Persist lifelogs via the repository, wrapping failures as ServiceError.
+
+    Uses ``repo.save_many`` (parallel writes) when available and falls back to
+    per-item ``save_lifelog`` for simple repositories.
+    """
+    save_many = getattr(repo, "save_many", None)
+    current: dict[str, Any] | None = None
+    try:
+        if callable(save_many):
+            return list(save_many(lifelogs))
+        results: list[SaveResult] = []
+        for current in lifelogs:
+            results.append(repo.save_lifelog(current))
+        return results
+    except LimitlessError as exc:
+        lifelog_id = exc.context.get("lifelog_id") if current is None else current.get("id")
+        raise ServiceError(
+            f"Failed to save lifelog {lifelog_id}: {exc}",
+            cause=exc,
+            context={"operation": operation, "lifelog_id": lifelog_id},
+        ) from exc
+    except Exception as exc:  # pragma: no cover - best-effort guard
+        lifelog_id = current.get("id") if current is not None else None
+        raise ServiceError(
+            f"Unexpected failure while saving lifelog {lifelog_id}.",
+            cause=exc,
+            context={"operation": operation, "lifelog_id": lifelog_id},
+        ) from exc
+
+
 @dataclass
 class LifelogService:
     api_key: str | None
@@ -50,8 +194,132 @@ class LifelogService:
     client: LimitlessClient | None = None
     repo: JsonFileRepository | None = None
     http_timeout: float | None = None
+    save_workers: int | None = None
+    storage_layout: StorageLayout = "files"
+    dedupe_contents: bool = False
+    # Opt-in, shared across methods: decoded lifelogs are reused until files change
+    cache: LifelogCache | None = None
+    # Requests per second (and burst) for a process-wide token bucket; None disables pacing
+    rate_limit: float | None = None
+    rate_burst: float | None = None
+    # Let the client resize pages from observed latency/payload (batch_size is the start)
+    adaptive_batch: bool = False
+    # Request the next page in the background while the current one is saved
+    prefetch: bool = False
+    # Retries per request (jittered backoff), capped per run by count and/or total sleep
+    max_retries: int = 0
+    retry_budget: int | None = None
+    retry_budget_seconds: float | None = None
+    # Consecutive failures that open the circuit breaker (0 disables) and its cooldown
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 60.0
+    # Connections kept in the shared session's pool (raise for parallel syncs)
+    http_pool_size: int | None = None
+    # On-disk API response cache under <data_dir>/../cache/http (TTL in seconds; 0 = always revalidate)
+    http_cache: bool = False
+    http_cache_ttl: float = 0.0
+    # Session for clients this service creates (e.g. a cassette record/replay session)
+    http_session: Any = None
+    # Per-run metrics (requests, items, phase seconds, index size) for export after fetch/sync
+    metrics: MetricsRegistry | None = None
     last_report: SaveReport | None = None
+    last_timings: PhaseTimings | None = None
+
+    def _record_run(
+        self,
+        operation: str,
+        *,
+        timings: PhaseTimings,
+        report: SaveReport | None,
+        duration: float,
+        success: bool,
+    ) -> None:
+        m = self.metrics
+        if m is None:
+            return
+        op = {"operation": operation}
+        m.set("limitless_run_success", 1 if success else 0, help="1 if the last run completed, else 0", **op)
+        m.set("limitless_run_duration_seconds", duration, help="Wall time of the last run", **op)
+        m.set("limitless_run_timestamp_seconds", time.time(), help="Unix time the last run ended", **op)
+        m.set("limitless_run_requests", timings.requests, help="HTTP requests sent (including retries)", **op)
+        m.set("limitless_run_retries", timings.retries, help="Requests retried after throttling or errors", **op)
+        m.set("limitless_run_bytes_downloaded", timings.bytes, help="Response body bytes received", **op)
+        m.set("limitless_run_items_received", timings.items, help="Lifelogs received from the API", **op)
+        if report is not None:
+            for status in ("created", "updated", "unchanged"):
+                m.set(
+                    "limitless_run_items",
+                    getattr(report, status),
+                    help="Lifelogs saved by outcome",
+                    status=status,
+                    **op,
+                )
+        for phase in ("network", "decode", "save", "index"):
+            m.set(
+                "limitless_run_phase_seconds",
+                getattr(timings, phase),
+                help="Seconds spent per phase",
+                phase=phase,
+                **op,
+            )
+        if timings.index_entries is not None:
+            m.set("limitless_index_entries", timings.index_entries, help="Rows in index.json")
+            idx_path = Path(self.data_dir or "") / "index.json"
+            try:
+                m.set("limitless_index_bytes", idx_path.stat().st_size, help="Size of index.json in bytes")
+            except OSError as exc:
+                log.debug("Unable to stat %s: %s", idx_path, exc)
+
+    def _make_client(self) -> LimitlessClient:
+        limiter = TokenBucket.shared(self.rate_limit, self.rate_burst) if self.rate_limit else None
+        budget = None
+        if self.retry_budget is not None or self.retry_budget_seconds is not None:
+            budget = RetryBudget(max_retries=self.retry_budget, max_seconds=self.retry_budget_seconds)
+        return LimitlessClient(
+            api_key=self.api_key or "",
+            base_url=self.api_url or None,
+            session=self.http_session or shared_session(pool_size=self.http_pool_size or DEFAULT_POOL_SIZE),
+            timeout=self.http_timeout,
+            rate_limiter=limiter,
+            max_retries=max(0, self.max_retries),
+            retry_budget=budget,
+            circuit_breaker=self._make_breaker(),
+            response_cache=self._make_response_cache(),
+        )
 
+    def _make_response_cache(self) -> ResponseCache | None:
+        if not self.http_cache:
+            return None
+        root = Path(self.data_dir or "").expanduser().parent / "cache" / "http"
+        return ResponseCache(root, ttl=max(0.0, self.http_cache_ttl))
+
+    def _make_breaker(self) -> CircuitBreaker | None:
+        if self.breaker_threshold <= 0:
+            return None
+        # Persisted next to the sync state so later scheduled runs also fail fast
+        state_path = Path(self.data_dir or "").expanduser().parent / "state" / "circuit_breaker.json"
+        return CircuitBreaker(self.breaker_threshold, self.breaker_cooldown, state_path=state_path)
+
+    def _iter_records(self, *, keep_body: bool) -> Iterator[LifelogRecord]:
+        """Yield local lifelogs as records: from index.json when present, else by scanning storage."""
+        base = Path(self.data_dir or "")
+        idx_path = base / "index.json"
+        if idx_path.exists():
+            idx_items = _load_json(idx_path)
+            if isinstance(idx_items, list):
+                for row in idx_items:
+                    if isinstance(row, dict):
+                        yield LifelogRecord.from_summary(row, loader=self._loader_for(row.get("path")))
+            return
+        for p, obj in iter_lifelogs(base, cache=self.cache):
+            yield LifelogRecord.from_dict(obj, path=p, loader=self._loader_for(p), keep_body=keep_body)
+
+    def _loader_for(self, path: object) -> Callable[[], dict[str, Any] | None] | None:
+        if not isinstance(path, str) or not path:
+            return None
+        return partial(load_lifelog, path, cache=self.cache)
+
+    @_metered("fetch")
     def fetch(
         self,
         *,
@@ -66,15 +334,24 @@ class LifelogService:
         is_starred: bool | None = None,
         batch_size: int = 50,
         progress_callback: Callable[[int, int], None] | None = None,
+        timings: PhaseTimings | None = None,
     ) -> list[str]:
-        """Fetch lifelogs from API and save them to JSON files. Returns saved file paths."""
+        """Fetch lifelogs from API and save them to JSON files. Returns saved file paths.
 
-        client = self.client or LimitlessClient(
-            api_key=self.api_key or "",
-            base_url=self.api_url or None,
-            timeout=self.http_timeout,
+        ``timings`` (or a new ``PhaseTimings``, kept in ``last_timings``) receives the
+        time spent per phase.
+        """
+
+        client = self.client or self._make_client()
+        timings = timings if timings is not None else PhaseTimings()
+        self.last_timings = timings
+        client_baseline = _client_totals(client)
+        repo = self.repo or JsonFileRepository(
+            base_dir=self.data_dir or "",
+            max_workers=self.save_workers,
+            layout=self.storage_layout,
+            dedupe=self.dedupe_contents,
         )
-        repo = self.repo or JsonFileRepository(base_dir=self.data_dir or "")
 
         try:
             lifelogs = client.get_lifelogs(
@@ -89,37 +366,34 @@ class LifelogService:
                 is_starred=is_starred,
                 batch_size=batch_size,
                 progress_callback=progress_callback,
+                adaptive_batch=self.adaptive_batch,
+                prefetch=self.prefetch,
             )
         except LimitlessError as exc:
             raise ServiceError(f"Failed to fetch lifelogs: {exc}", cause=exc, context={"operation": "fetch"}) from exc
         except Exception as exc:  # pragma: no cover - best-effort guard
             raise ServiceError("Unexpected error while fetching lifelogs.", cause=exc, context={"operation": "fetch"}) from exc
+        finally:
+            # Failed runs still report the requests and retries they made
+            timings.pull_client(client, client_baseline)
 
+        timings.observe_page(lifelogs)
         report = SaveReport()
         saved_paths: list[str] = []
-        for item in lifelogs:
-            try:
-                save_result = repo.save_lifelog(item)
-            except LimitlessError as exc:
-                lifelog_id = item.get("id")
-                raise ServiceError(
-                    f"Failed to save lifelog {lifelog_id}: {exc}",
-                    cause=exc,
-                    context={"operation": "fetch", "lifelog_id": lifelog_id},
-                ) from exc
-            except Exception as exc:  # pragma: no cover - best-effort guard
-                lifelog_id = item.get("id")
-                raise ServiceError(
-                    f"Unexpected failure while saving lifelog {lifelog_id}.",
-                    cause=exc,
-                    context={"operation": "fetch", "lifelog_id": lifelog_id},
-                ) from exc
-            saved_paths.append(save_result.path)
-            report.record(save_result.status)
+        save_started = time.perf_counter()
+        try:
+            for save_result in _save_all(repo, lifelogs, operation="fetch"):
+                saved_paths.append(save_result.path)
+                report.record(save_result.status)
+        finally:
+            if self.repo is None:
+                repo.close()
+        timings.save += time.perf_counter() - save_started
 
         self.last_report = report
         return saved_paths
 
+    @_metered("sync")
     def sync(
         self,
         *,
@@ -130,13 +404,36 @@ class LifelogService:
         is_starred: bool | None = None,
         batch_size: int = 50,
         progress_callback: Callable[[int, int], None] | None = None,
+        headers_first: bool = False,
+        resume: bool = False,
+        checkpoint_every: int = 10,
+        timings: PhaseTimings | None = None,
     ) -> list[str]:
-        client = self.client or LimitlessClient(
-            api_key=self.api_key or "",
-            base_url=self.api_url or None,
-            timeout=self.http_timeout,
+        """Sync lifelogs into local storage, index.json and sync state. Returns saved file paths.
+
+        Pages are saved as they arrive. Every ``checkpoint_every`` pages the index
+        and a per-signature checkpoint (next cursor, page number, counts) are
+        written; ``resume=True`` continues from that checkpoint instead of
+        starting the window over. The checkpoint is cleared when a sync completes.
+
+        With ``headers_first`` the window is listed without markdown/headings. A
+        page holding lifelogs whose ``updatedAt`` differs from the local index is
+        requested once more with bodies; unchanged ones are not downloaded again,
+        and a lifelog missing from that second response is left out of the index.
+
+        ``timings`` (or a new ``PhaseTimings``, kept in ``last_timings``) is updated
+        after every page, so a progress callback can report per-phase time live.
+        """
+        client = self.client or self._make_client()
+        timings = timings if timings is not None else PhaseTimings()
+        self.last_timings = timings
+        client_baseline = _client_totals(client)
+        repo = self.repo or JsonFileRepository(
+            base_dir=self.data_dir or "",
+            max_workers=self.save_workers,
+            layout=self.storage_layout,
+            dedupe=self.dedupe_contents,
         )
-        repo = self.repo or JsonFileRepository(base_dir=self.data_dir or "")
         state_repo = StateRepository(base_lifelogs_dir=self.data_dir or "")
 
         # Load previous state and derive default start if none provided
@@ -155,104 +452,237 @@ class LifelogService:
             "is_starred": is_starred,
             "direction": "desc",
         }
+        # Kept on stdlib json: the exact bytes feed the persisted signature hash
         sig_json = json.dumps(sig_dict, sort_keys=True, ensure_ascii=False)
         sig = hashlib.sha256(sig_json.encode("utf-8")).hexdigest()
         signatures = st.get("signatures", {}) if isinstance(st.get("signatures"), dict) else {}
         sig_state = signatures.get(sig, {})
         eff_start = start or sig_state.get("lastEndTime") or st.get("lastEndTime")
+        eff_cursor = (sig_state.get("lastCursor") or st.get("lastCursor")) if not any([date, start, end]) else None
 
-        eff_tz = resolve_timezone(timezone)
-        try:
-            lifelogs = client.get_lifelogs(
-                limit=None,
-                direction="desc",
-                include_markdown=True,
-                include_headings=True,
-                date=date,
-                start=eff_start,
-                end=end,
-                timezone=eff_tz,
-                is_starred=is_starred,
-                batch_size=batch_size,
-                cursor=(sig_state.get("lastCursor") or st.get("lastCursor")) if not any([date, start, end]) else None,
-                progress_callback=progress_callback,
+        report = SaveReport()
+        base_page = 0
+        # Latest endTime among processed lifelogs, carried across checkpoints
+        max_end = ""
+        checkpoint = sig_state.get("checkpoint")
+        if resume and isinstance(checkpoint, dict) and checkpoint.get("cursor"):
+            eff_start = checkpoint.get("start")
+            eff_cursor = checkpoint["cursor"]
+            base_page = int(checkpoint.get("page") or 0)
+            max_end = str(checkpoint.get("maxEndTime") or "")
+            report = SaveReport(
+                created=int(checkpoint.get("created") or 0),
+                updated=int(checkpoint.get("updated") or 0),
+                unchanged=int(checkpoint.get("unchanged") or 0),
             )
-        except LimitlessError as exc:
-            raise ServiceError(f"Failed to sync lifelogs: {exc}", cause=exc, context={"operation": "sync"}) from exc
-        except Exception as exc:  # pragma: no cover - best-effort guard
-            raise ServiceError("Unexpected error while syncing lifelogs.", cause=exc, context={"operation": "sync"}) from exc
+            log.info("Resuming sync from checkpoint at page %s", base_page)
+        base_count = report.total
 
-        report = SaveReport()
-        saved_paths: list[str] = []
-        index_rows: list[dict[str, str | bool | None]] = []
-        for ll in lifelogs:
+        base = Path(self.data_dir or "")
+        idx_path = base / "index.json"
+        existing: list[dict] = []
+        if idx_path.exists():
+            existing_obj = _load_json(idx_path)
+            if isinstance(existing_obj, list):
+                existing = existing_obj
+        merged: dict[str, dict] = {str(it.get("id")): it for it in existing}
+
+        def _write_index() -> None:
+            started = time.perf_counter()
+            base.mkdir(parents=True, exist_ok=True)
+            # sort by startTime ascending for stability
+            merged_list = sorted(merged.values(), key=lambda x: str(x.get("startTime") or ""))
+            idx_path.write_bytes(codec.dumps_bytes(merged_list, indent=True))
+            timings.index += time.perf_counter() - started
+            timings.index_entries = len(merged_list)
+
+        def _save_state() -> None:
+            if signatures:
+                st["signatures"] = signatures
             try:
-                save_result = repo.save_lifelog(ll)
+                state_repo.save(st)
             except LimitlessError as exc:
-                raise ServiceError(
-                    f"Failed to save lifelog {ll.get('id')}: {exc}",
-                    cause=exc,
-                    context={"operation": "sync", "lifelog_id": ll.get("id")},
-                ) from exc
+                raise ServiceError("Failed to persist sync state.", cause=exc, context={"operation": "sync"}) from exc
             except Exception as exc:  # pragma: no cover - best-effort guard
                 raise ServiceError(
-                    f"Unexpected failure while saving lifelog {ll.get('id')}.",
-                    cause=exc,
-                    context={"operation": "sync", "lifelog_id": ll.get("id")},
+                    "Unexpected error while saving sync state.", cause=exc, context={"operation": "sync"}
                 ) from exc
-            saved_paths.append(save_result.path)
-            report.record(save_result.status)
-            index_rows.append(
-                {
+
+        eff_tz = resolve_timezone(timezone)
+        saved_paths: list[str] = []
+        pages_done = 0
+
+        def _process_page(page: list[dict[str, Any]]) -> None:
+            nonlocal max_end
+            # Header-only pass: keep index paths for unchanged ids, download the rest
+            known_paths: dict[str, str] = {}
+            missing: set[str] = set()
+            if headers_first:
+                wanted: list[str] = []
+                for header in page:
+                    row = merged.get(str(header.get("id")))
+                    if (
+                        row is not None
+                        and header.get("updatedAt")
+                        and row.get("updatedAt") == header.get("updatedAt")
+                        and isinstance(row.get("path"), str)
+                    ):
+                        known_paths[str(header.get("id"))] = row["path"]
+                    else:
+                        wanted.append(str(header.get("id")))
+                bodies: dict[str, dict[str, Any]] = {}
+                if wanted:
+                    # One request re-reads this page with bodies instead of one request per id
+                    try:
+                        full_page = client.get_lifelogs_page(
+                            limit=len(page),
+                            cursor=getattr(client, "last_page_cursor", None),
+                            direction="desc",
+                            include_markdown=True,
+                            include_headings=True,
+                            date=date,
+                            start=eff_start,
+                            end=end,
+                            timezone=eff_tz,
+                            is_starred=is_starred,
+                        )
+                    except LimitlessError as exc:
+                        raise ServiceError(
+                            f"Failed to fetch lifelog bodies: {exc}",
+                            cause=exc,
+                            context={"operation": "sync", "lifelog_id": wanted[0]},
+                        ) from exc
+                    bodies = {str(ll.get("id")): ll for ll in full_page}
+                to_save: list[dict[str, Any]] = []
+                for lifelog_id in wanted:
+                    full = bodies.get(lifelog_id)
+                    if full is None:
+                        # Not indexed, so the next sync sees it as new and asks again
+                        log.warning("No body returned for lifelog %s; skipping it", lifelog_id)
+                        missing.add(lifelog_id)
+                        continue
+                    to_save.append(full)
+            else:
+                to_save = page
+
+            save_started = time.perf_counter()
+            save_results = iter(_save_all(repo, to_save, operation="sync"))
+            timings.save += time.perf_counter() - save_started
+            for ll in page:
+                if str(ll.get("id")) in missing:
+                    continue
+                path = known_paths.get(str(ll.get("id")))
+                if path is None:
+                    save_result = next(save_results)
+                    path = save_result.path
+                    report.record(save_result.status)
+                else:
+                    report.record("unchanged")
+                saved_paths.append(path)
+                max_end = max(max_end, str(ll.get("endTime") or ""))
+                merged[str(ll.get("id"))] = {
                     "id": ll.get("id"),
                     "title": ll.get("title"),
                     "startTime": ll.get("startTime"),
                     "endTime": ll.get("endTime"),
                     "isStarred": ll.get("isStarred"),
                     "updatedAt": ll.get("updatedAt"),
-                    "path": save_result.path,
+                    "path": path,
                 }
-            )
 
-        # write index.json at base dir
-        base = Path(self.data_dir or "")
-        base.mkdir(parents=True, exist_ok=True)
-        # merge/update index if exists
-        idx_path = base / "index.json"
-        existing: list[dict] = []
-        if idx_path.exists():
-            existing_obj = _load_json(idx_path)
-            if isinstance(existing_obj, list):
-                existing = existing_obj
-        merged: dict[str, dict] = {str(it.get("id")): it for it in existing}
-        for row in index_rows:
-            merged[str(row.get("id"))] = row
-        # sort by startTime ascending for stability
-        merged_list = sorted(merged.values(), key=lambda x: str(x.get("startTime") or ""))
-        idx_path.write_text(json.dumps(merged_list, ensure_ascii=False, indent=2))
-
-        # update state with latest end time observed
-        if lifelogs:
+        checkpointed_cursor: str | None = None
+        processed_cursor: str | None = None
+
+        def _checkpoint(next_cursor: str) -> None:
+            nonlocal checkpointed_cursor
+            _write_index()
+            signatures.setdefault(sig, {})["checkpoint"] = {
+                "cursor": next_cursor,
+                "start": eff_start,
+                "page": base_page + pages_done,
+                "created": report.created,
+                "updated": report.updated,
+                "unchanged": report.unchanged,
+                "maxEndTime": max_end or None,
+            }
+            _save_state()
+            checkpointed_cursor = next_cursor
+
+        def _on_page(page: list[dict[str, Any]], next_cursor: str | None) -> None:
+            nonlocal pages_done, processed_cursor
+            timings.observe_page(page)
+            _process_page(page)
+            timings.pull_client(client, client_baseline)
+            pages_done += 1
+            processed_cursor = next_cursor
+            if next_cursor and checkpoint_every > 0 and pages_done % checkpoint_every == 0:
+                _checkpoint(next_cursor)
+
+        def _checkpoint_partial() -> None:
+            # Keep pages saved since the last checkpoint when the run is aborted
+            if checkpoint_every <= 0 or not processed_cursor or processed_cursor == checkpointed_cursor:
+                return
+            try:
+                _checkpoint(processed_cursor)
+            except (LimitlessError, OSError) as exc:
+                log.debug("Unable to checkpoint partial sync: %s", exc)
+
+        def _progress(page_number: int, count: int) -> None:
+            # Resumed runs continue the page/count numbering from the checkpoint
+            if progress_callback is not None:
+                progress_callback(base_page + page_number, base_count + count)
+
+        try:
             try:
-                last_end = max([str(x.get("endTime") or "") for x in lifelogs])
-            except (TypeError, ValueError):
-                last_end = None
-            if last_end:
-                st["lastEndTime"] = last_end  # top-level for compatibility
-                # per-signature
-                signatures.setdefault(sig, {})["lastEndTime"] = last_end
+                lifelogs = client.get_lifelogs(
+                    limit=None,
+                    direction="desc",
+                    include_markdown=not headers_first,
+                    include_headings=not headers_first,
+                    date=date,
+                    start=eff_start,
+                    end=end,
+                    timezone=eff_tz,
+                    is_starred=is_starred,
+                    batch_size=batch_size,
+                    cursor=eff_cursor,
+                    progress_callback=_progress if progress_callback is not None else None,
+                    page_callback=_on_page,
+                    adaptive_batch=self.adaptive_batch,
+                    prefetch=self.prefetch,
+                )
+            except ServiceError:
+                _checkpoint_partial()
+                raise
+            except LimitlessError as exc:
+                _checkpoint_partial()
+                raise ServiceError(f"Failed to sync lifelogs: {exc}", cause=exc, context={"operation": "sync"}) from exc
+            except Exception as exc:  # pragma: no cover - best-effort guard
+                raise ServiceError("Unexpected error while syncing lifelogs.", cause=exc, context={"operation": "sync"}) from exc
+            if pages_done == 0:
+                # Clients without page callbacks: everything arrives at once
+                timings.observe_page(lifelogs)
+                _process_page(lifelogs)
+        finally:
+            # Failed runs still report the requests and retries they made
+            timings.pull_client(client, client_baseline)
+            if self.repo is None:
+                repo.close()
+
+        _write_index()
+
+        # update state with latest end time observed (including pages saved before a resume);
+        # it only moves forward, top-level for compatibility and per signature
+        if max_end:
+            for holder in (st, signatures.setdefault(sig, {})):
+                holder["lastEndTime"] = max(max_end, str(holder.get("lastEndTime") or ""))
         # update lastCursor from client if available
         if getattr(client, "last_next_cursor", None):
             st["lastCursor"] = client.last_next_cursor  # top-level for compatibility
             signatures.setdefault(sig, {})["lastCursor"] = client.last_next_cursor
-        if signatures:
-            st["signatures"] = signatures
-        try:
-            state_repo.save(st)
-        except LimitlessError as exc:
-            raise ServiceError("Failed to persist sync state.", cause=exc, context={"operation": "sync"}) from exc
-        except Exception as exc:  # pragma: no cover - best-effort guard
-            raise ServiceError("Unexpected error while saving sync state.", cause=exc, context={"operation": "sync"}) from exc
+        if isinstance(signatures.get(sig), dict):
+            signatures[sig].pop("checkpoint", None)
+        _save_state()
 
         self.last_report = report
         return saved_paths
@@ -264,39 +694,13 @@ class LifelogService:
         is_starred: bool | None = None,
     ) -> list[dict[str, object]]:
         """List locally stored lifelogs, optionally filtered by date (YYYY-MM-DD) and starred."""
-        base = Path(self.data_dir or "")
         results: list[dict[str, object]] = []
-
-        # If we have an index, prefer it; else scan files
-        idx_path = base / "index.json"
-        items: list[dict[str, object]] = []
-        if idx_path.exists():
-            idx_items = _load_json(idx_path)
-            if isinstance(idx_items, list):
-                items = idx_items
-        else:
-            for p in base.rglob("lifelog_*.json"):
-                obj = _load_json(p)
-                if not isinstance(obj, dict):
-                    continue
-                items.append(
-                    {
-                        "id": obj.get("id"),
-                        "title": obj.get("title"),
-                        "startTime": obj.get("startTime"),
-                        "endTime": obj.get("endTime"),
-                        "isStarred": obj.get("isStarred"),
-                        "updatedAt": obj.get("updatedAt"),
-                        "path": str(p),
-                    }
-                )
-
-        for it in items:
-            if date and (str(it.get("startTime")) or "")[:10] != date:
+        for rec in self._iter_records(keep_body=False):
+            if date and rec.date != date:
                 continue
-            if is_starred is not None and bool(it.get("isStarred")) != is_starred:
+            if is_starred is not None and bool(rec.isStarred) != is_starred:
                 continue
-            results.append(it)
+            results.append(rec.summary())
 
         return results
 
@@ -307,10 +711,7 @@ class LifelogService:
         """
         base = Path(self.data_dir or "")
         entries: list[dict[str, object]] = []
-        for p in base.rglob("lifelog_*.json"):
-            obj = _load_json(p)
-            if not isinstance(obj, dict):
-                continue
+        for _, obj in iter_lifelogs(base, cache=self.cache):
             entries.append(obj)
 
         entries.sort(key=lambda x: str(x.get("startTime") or ""))
@@ -377,42 +778,17 @@ class LifelogService:
             rf_scorer = None
         import difflib as _difflib
 
-        base = Path(self.data_dir or "")
         results: list[dict[str, object]] = []
 
-        # Prefer index for quick pass; we will open files as needed to check markdown
-        idx_items: list[dict[str, object]] = []
-        idx_path = base / "index.json"
-        if idx_path.exists():
-            idx_json = _load_json(idx_path)
-            if isinstance(idx_json, list):
-                idx_items = idx_json
-        else:
-            # Build items by scanning files
-            for p in base.rglob("lifelog_*.json"):
-                obj = _load_json(p)
-                if not isinstance(obj, dict):
-                    continue
-                idx_items.append(
-                    {
-                        "id": obj.get("id"),
-                        "title": obj.get("title"),
-                        "startTime": obj.get("startTime"),
-                        "endTime": obj.get("endTime"),
-                        "isStarred": obj.get("isStarred"),
-                        "updatedAt": obj.get("updatedAt"),
-                        "path": str(p),
-                    }
-                )
-
-        for it in idx_items:
-            st = str(it.get("startTime") or "")
-            if date and st[:10] != date:
+        # Records come from the index when present (bodies load lazily, only when the
+        # title does not match) or from a streaming scan of the stored lifelogs.
+        for rec in self._iter_records(keep_body=True):
+            if date and rec.date != date:
                 continue
-            if is_starred is not None and bool(it.get("isStarred")) != is_starred:
+            if is_starred is not None and bool(rec.isStarred) != is_starred:
                 continue
 
-            title = str(it.get("title") or "")
+            title = str(rec.title or "")
             match = False
             if regex and pattern is not None:
                 match = bool(pattern.search(title))
@@ -426,24 +802,20 @@ class LifelogService:
             else:
                 match = ql in title.lower()
             if not match:
-                path_str = it.get("path")
-                if isinstance(path_str, str) and path_str:
-                    obj = _load_json(Path(path_str))
-                    if isinstance(obj, dict):
-                        md = obj.get("markdown")
-                        if isinstance(md, str) and md:
-                            if regex and pattern is not None:
-                                match = bool(pattern.search(md))
-                            elif fuzzy:
-                                if rf_scorer is not None:
-                                    match = rf_scorer(ql, md.lower()) >= max(0, int(fuzzy_threshold))
-                                else:
-                                    ratio = _difflib.SequenceMatcher(None, ql, md.lower()).ratio() * 100.0
-                                    match = ratio >= max(0, float(fuzzy_threshold))
-                            else:
-                                match = ql in md.lower()
+                md = rec.markdown
+                if md:
+                    if regex and pattern is not None:
+                        match = bool(pattern.search(md))
+                    elif fuzzy:
+                        if rf_scorer is not None:
+                            match = rf_scorer(ql, md.lower()) >= max(0, int(fuzzy_threshold))
+                        else:
+                            ratio = _difflib.SequenceMatcher(None, ql, md.lower()).ratio() * 100.0
+                            match = ratio >= max(0, float(fuzzy_threshold))
+                    else:
+                        match = ql in md.lower()
             if match:
-                results.append(it)
+                results.append(rec.summary())
 
         return results
 
@@ -451,10 +823,7 @@ class LifelogService:
         """Return concatenated markdown for all lifelogs on a specific date."""
         base = Path(self.data_dir or "")
         entries: list[dict[str, object]] = []
-        for p in base.rglob("lifelog_*.json"):
-            obj = _load_json(p)
-            if not isinstance(obj, dict):
-                continue
+        for _, obj in iter_lifelogs(base, date=date, cache=self.cache):
             st = str(obj.get("startTime") or "")
             if st[:10] != date:
                 continue
@@ -490,39 +859,11 @@ class LifelogService:
         from io import StringIO
 
 
-        base = Path(self.data_dir or "")
-        # Prefer index for listing paths
-        idx_items: list[dict[str, object]] = []
-        idx_path = base / "index.json"
-        if idx_path.exists():
-            idx_json = _load_json(idx_path)
-            if isinstance(idx_json, list):
-                idx_items = idx_json
-        else:
-            for p in base.rglob("lifelog_*.json"):
-                obj = _load_json(p)
-                if not isinstance(obj, dict):
-                    continue
-                idx_items.append(
-                    {
-                        "id": obj.get("id"),
-                        "title": obj.get("title"),
-                        "startTime": obj.get("startTime"),
-                        "endTime": obj.get("endTime"),
-                        "isStarred": obj.get("isStarred"),
-                        "updatedAt": obj.get("updatedAt"),
-                        "path": str(p),
-                    }
-                )
-
-        # Filter and sort
-        items: list[dict[str, object]] = []
-        for it in idx_items:
-            st = str(it.get("startTime") or "")
-            if date and st[:10] != date:
-                continue
-            items.append(it)
-        items.sort(key=lambda x: str(x.get("startTime") or ""))
+        # Filter and sort (bodies are only loaded below, one at a time, for markdown)
+        items: list[LifelogRecord] = [
+            rec for rec in self._iter_records(keep_body=False) if not date or rec.date == date
+        ]
+        items.sort(key=lambda x: str(x.startTime or ""))
 
         # Build CSV
         buf = StringIO()
@@ -531,17 +872,11 @@ class LifelogService:
             fieldnames.append("markdown")
         writer = csv.DictWriter(buf, fieldnames=fieldnames)
         writer.writeheader()
-        for it in items:
-            row = {k: it.get(k) for k in fieldnames if k != "markdown"}
+        for rec in items:
+            summary = rec.summary()
+            row = {k: summary.get(k) for k in fieldnames if k != "markdown"}
             if include_markdown:
-                md = ""
-                path_str = it.get("path")
-                if isinstance(path_str, str) and path_str:
-                    obj = _load_json(Path(path_str))
-                    if isinstance(obj, dict):
-                        mdt = obj.get("markdown")
-                        if isinstance(mdt, str):
-                            md = mdt
-                row["markdown"] = md
+                row["markdown"] = rec.markdown or ""
+                rec.release_body()
             writer.writerow(row)
         return buf.getvalue()
@@ -0,0 +1,85 @@
+"""Content-addressed blob store for deduplicating lifelog markdown/contents."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Any, TypeGuard
+
+from limitless_tools import codec
+from limitless_tools.errors import StorageError
+
+BLOB_DIR_NAME = "blobs"
+BLOB_KEY = "$blob"
+BLOB_FIELDS: tuple[str, ...] = ("markdown", "contents")
+
+
+def blob_root_for(lifelog_path: Path) -> Path:
+    """Return the blob root for a file stored under ``<base>/YYYY/MM/DD/``."""
+    return lifelog_path.parent.parent.parent.parent / BLOB_DIR_NAME
+
+
+def _is_ref(value: Any) -> TypeGuard[dict[str, str]]:
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(BLOB_KEY), str)
+
+
+def has_blob_refs(lifelog: dict[str, Any]) -> bool:
+    return any(_is_ref(lifelog.get(f)) for f in BLOB_FIELDS)
+
+
+class BlobStore:
+    """Stores JSON values at ``blobs/<aa>/<sha256>.json``; identical values are written once."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def put(self, value: Any) -> dict[str, str]:
+        # Compact encoding is identical across codec backends, so digests are stable
+        data = codec.dumps_bytes(value)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if not path.exists():
+            tmp = path.with_name(f".{digest}.{uuid.uuid4().hex}.tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            except OSError as exc:
+                raise StorageError("Unable to write content blob.", cause=exc, context={"path": str(path)}) from exc
+        return {BLOB_KEY: f"sha256:{digest}"}
+
+    def _read(self, ref: dict[str, str]) -> tuple[Any, int]:
+        digest = ref[BLOB_KEY].split(":", 1)[-1]
+        path = self._path(digest)
+        try:
+            data = path.read_bytes()
+            return codec.loads(data), len(data)
+        except (codec.JSONDecodeError, OSError) as exc:
+            raise StorageError("Unable to read content blob.", cause=exc, context={"path": str(path)}) from exc
+
+    def externalize(self, lifelog: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of lifelog with non-empty markdown/contents replaced by blob refs."""
+        stored = dict(lifelog)
+        for f in BLOB_FIELDS:
+            value = stored.get(f)
+            if value and not _is_ref(value):
+                stored[f] = self.put(value)
+        return stored
+
+    def resolve_sized(self, stored: dict[str, Any]) -> tuple[dict[str, Any], int]:
+        """Return stored with blob refs replaced by their values, and the number of blob bytes read."""
+        if not has_blob_refs(stored):
+            return stored, 0
+        resolved = dict(stored)
+        read = 0
+        for f in BLOB_FIELDS:
+            value = resolved.get(f)
+            if _is_ref(value):
+                resolved[f], size = self._read(value)
+                read += size
+        return resolved, read
@@ -0,0 +1,89 @@
+"""In-process LRU cache of parsed lifelog files, bounded by the bytes they were decoded from."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class _Entry:
+    signature: tuple[int, int]
+    size: int
+    value: Any
+
+
+class LifelogCache:
+    """Caches decoded files keyed by path and invalidated by (mtime_ns, size).
+
+    The budget is measured in the bytes a value was decoded from (the source
+    file plus anything the loader read to resolve it, such as content blobs), a
+    cheap proxy for decoded size. Cached objects are shared between callers and
+    must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load_sized(self, path: Path, loader: Callable[[], tuple[Any, int]]) -> Any:
+        """Return the cached value for path, calling loader on a miss or stale entry.
+
+        ``loader`` returns ``(value, extra_bytes)``; ``extra_bytes`` is what the loader read besides ``path`` (e.g. resolved
+        blobs) and is charged to the budget along with the file size.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return loader()[0]
+        key = str(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+        value, extra = loader()
+        size = st.st_size + max(0, extra)
+        if value is None or size > self.max_bytes:
+            return value
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old.size
+            self._entries[key] = _Entry(signature, size, value)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.size
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,274 @@
+"""Packed per-day storage: one JSONL file plus an offset table per YYYY/MM/DD folder."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Literal
+
+from limitless_tools import codec
+from limitless_tools.errors import StorageError
+from limitless_tools.storage.readers import loads_region
+
+if sys.platform == "win32":  # pragma: no cover - exercised on Windows only
+    import msvcrt
+else:
+    import fcntl
+
+PACK_NAME = "lifelogs.jsonl"
+INDEX_NAME = "lifelogs.idx.json"
+LOCK_NAME = "lifelogs.lock"
+PACK_REF_SEP = "#"
+_INDEX_VERSION = 2
+
+
+def pack_ref(pack_path: Path, lifelog_id: object) -> str:
+    """Return the path-like reference for a record inside a day pack."""
+    return f"{pack_path}{PACK_REF_SEP}{lifelog_id}"
+
+
+def split_pack_ref(ref: str) -> tuple[Path, str] | None:
+    """Split ``<dir>/lifelogs.jsonl#<id>`` into (pack path, id); None for plain paths."""
+    head, sep, lifelog_id = ref.rpartition(PACK_REF_SEP)
+    if not sep or not head.endswith(PACK_NAME):
+        return None
+    return Path(head), lifelog_id
+
+
+@contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive OS-level lock on ``lock_path`` (blocks until it is free)."""
+    with lock_path.open("a+b") as fh:
+        if sys.platform == "win32":  # pragma: no cover - exercised on Windows only
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+class DayPack:
+    """Append-only JSONL file for one day with an ``id -> [offset, length]`` table.
+
+    Updated records are appended and the table is repointed; the pack is
+    compacted once dead bytes outweigh live ones. The table records the pack
+    size it describes and is rebuilt from the pack when that no longer matches
+    (e.g. after a crash between appending and rewriting the table).
+
+    Writes (append, table rewrite, compaction) hold an OS lock on
+    ``lifelogs.lock``, and the table is reloaded under that lock when another
+    process changed the pack, so concurrent syncs never drop each other's
+    records. The instance itself is not thread-safe: callers serialize access
+    per day directory within a process.
+    """
+
+    def __init__(self, dir_path: Path) -> None:
+        self.dir_path = dir_path
+        self.pack_path = dir_path / PACK_NAME
+        self.index_path = dir_path / INDEX_NAME
+        self.lock_path = dir_path / LOCK_NAME
+        self._offsets: dict[str, list[int]] | None = None
+        # (inode, size, mtime) of the pack the in-memory table was last synced with
+        self._seen: tuple[int, int, int] | None = None
+
+    @property
+    def offsets(self) -> dict[str, list[int]]:
+        if self._offsets is None:
+            self._offsets = self._load_offsets()
+        return self._offsets
+
+    def _pack_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            st = self.pack_path.stat()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            raise StorageError("Unable to read day pack.", cause=exc, context={"path": str(self.pack_path)}) from exc
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _refresh(self) -> None:
+        """Reload the table if the pack changed since this instance last wrote or read it."""
+        stamp = self._pack_stamp()
+        if self._offsets is None or stamp != self._seen:
+            self._offsets = self._load_offsets()
+            self._seen = stamp
+
+    def _pack_size(self) -> int:
+        try:
+            return self.pack_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+        except OSError as exc:
+            raise StorageError("Unable to read day pack.", cause=exc, context={"path": str(self.pack_path)}) from exc
+
+    def _load_offsets(self) -> dict[str, list[int]]:
+        if not self.index_path.exists():
+            return self._rebuild_offsets()
+        try:
+            data = codec.loads(self.index_path.read_bytes())
+        except codec.JSONDecodeError:
+            return self._rebuild_offsets()
+        except OSError as exc:
+            raise StorageError(
+                "Unable to read day pack offset table.", cause=exc, context={"path": str(self.index_path)}
+            ) from exc
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return self._rebuild_offsets()
+        records = data.get("records")
+        # A table written for another pack size is stale (or the pack changed underneath it)
+        if not isinstance(records, dict) or data.get("packSize") != self._pack_size():
+            return self._rebuild_offsets()
+        return {str(k): list(v) for k, v in records.items()}
+
+    def _rebuild_offsets(self) -> dict[str, list[int]]:
+        """Recover the offset table by scanning the pack (last record per id wins)."""
+        offsets: dict[str, list[int]] = {}
+        if not self.pack_path.exists():
+            return offsets
+        pos = 0
+        with self.pack_path.open("rb") as fh:
+            for line in fh:
+                try:
+                    obj = codec.loads(line)
+                except codec.JSONDecodeError:
+                    obj = None
+                if isinstance(obj, dict) and obj.get("id") is not None:
+                    offsets[str(obj.get("id"))] = [pos, len(line)]
+                pos += len(line)
+        return offsets
+
+    def _read_at(self, fh: Any, offset: int, length: int) -> dict[str, Any] | None:
+        fh.seek(offset)
+        try:
+            obj = codec.loads(fh.read(length))
+        except codec.JSONDecodeError:
+            return None
+        return obj if isinstance(obj, dict) else None
+
+    def get(self, lifelog_id: str) -> dict[str, Any] | None:
+        loc = self.offsets.get(str(lifelog_id))
+        if loc is None or not self.pack_path.exists():
+            return None
+        try:
+            with self.pack_path.open("rb") as fh:
+                return self._read_at(fh, loc[0], loc[1])
+        except OSError as exc:
+            raise StorageError("Unable to read day pack.", cause=exc, context={"path": str(self.pack_path)}) from exc
+
+    def iter_records(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (id, lifelog) for live records in file order.
+
+        The pack is memory-mapped so records decode straight from the page cache
+        in one sequential pass.
+        """
+        if not self.pack_path.exists():
+            return
+        ordered = sorted(self.offsets.items(), key=lambda kv: kv[1][0])
+        with self.pack_path.open("rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for lifelog_id, (offset, length) in ordered:
+                    if offset + length > size:
+                        continue
+                    try:
+                        obj = loads_region(mm, offset, length)
+                    except codec.JSONDecodeError:
+                        continue
+                    if isinstance(obj, dict):
+                        yield lifelog_id, obj
+
+    def put_many(self, lifelogs: list[dict[str, Any]]) -> list[Literal["created", "updated", "unchanged"]]:
+        """Append new/changed lifelogs; return a created/updated/unchanged status per item."""
+        with _exclusive_lock(self.lock_path):
+            self._refresh()
+            return self._put_many_locked(lifelogs)
+
+    def _put_many_locked(self, lifelogs: list[dict[str, Any]]) -> list[Literal["created", "updated", "unchanged"]]:
+        offsets = self.offsets
+        statuses: list[Literal["created", "updated", "unchanged"]] = []
+        pending: list[tuple[str, bytes]] = []
+        try:
+            with self.pack_path.open("a+b") as fh:
+                for lifelog in lifelogs:
+                    key = str(lifelog.get("id"))
+                    loc = offsets.get(key)
+                    if loc is not None and self._read_at(fh, loc[0], loc[1]) == lifelog:
+                        statuses.append("unchanged")
+                        continue
+                    statuses.append("created" if loc is None else "updated")
+                    pending.append((key, codec.dumps_bytes(lifelog) + b"\n"))
+                if pending:
+                    fh.seek(0, os.SEEK_END)
+                    pos = fh.tell()
+                    for key, line in pending:
+                        fh.write(line)
+                        offsets[key] = [pos, len(line)]
+                        pos += len(line)
+        except OSError as exc:
+            raise StorageError("Unable to write day pack.", cause=exc, context={"path": str(self.pack_path)}) from exc
+        if pending:
+            if self._dead_bytes() > self._live_bytes():
+                self._compact_locked()
+            else:
+                self._write_offsets()
+        return statuses
+
+    def _live_bytes(self) -> int:
+        return sum(length for _, length in self.offsets.values())
+
+    def _dead_bytes(self) -> int:
+        try:
+            size = self.pack_path.stat().st_size
+        except OSError:
+            return 0
+        return size - self._live_bytes()
+
+    def compact(self) -> None:
+        """Rewrite the pack with only live records, then atomically swap it in."""
+        with _exclusive_lock(self.lock_path):
+            self._refresh()
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        tmp_pack = self.pack_path.with_suffix(".jsonl.tmp")
+        new_offsets: dict[str, list[int]] = {}
+        try:
+            with tmp_pack.open("wb") as out:
+                pos = 0
+                for key, obj in self.iter_records():
+                    line = codec.dumps_bytes(obj) + b"\n"
+                    out.write(line)
+                    new_offsets[key] = [pos, len(line)]
+                    pos += len(line)
+            os.replace(tmp_pack, self.pack_path)
+        except OSError as exc:
+            raise StorageError("Unable to compact day pack.", cause=exc, context={"path": str(self.pack_path)}) from exc
+        self._offsets = new_offsets
+        self._write_offsets()
+
+    def _write_offsets(self) -> None:
+        """Atomically replace the offset table, stamped with the current pack size."""
+        tmp = self.index_path.with_suffix(".json.tmp")
+        payload = {"version": _INDEX_VERSION, "packSize": self._pack_size(), "records": self.offsets}
+        try:
+            tmp.write_bytes(codec.dumps_bytes(payload))
+            os.replace(tmp, self.index_path)
+        except OSError as exc:
+            raise StorageError(
+                "Unable to write day pack offset table.", cause=exc, context={"path": str(self.index_path)}
+            ) from exc
+        self._seen = self._pack_stamp()
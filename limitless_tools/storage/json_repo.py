@@ -1,11 +1,28 @@
 from __future__ import annotations
 
-import json
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal
 
+from limitless_tools import codec
 from limitless_tools.errors import LimitlessError, StorageError
+from limitless_tools.storage.blob_store import (
+    BLOB_DIR_NAME,
+    BlobStore,
+    blob_root_for,
+    has_blob_refs,
+)
+from limitless_tools.storage.cache import LifelogCache
+from limitless_tools.storage.day_pack import PACK_NAME, DayPack, pack_ref, split_pack_ref
+from limitless_tools.storage.readers import read_json_file
+
+StorageLayout = Literal["files", "packed"]
+STORAGE_LAYOUTS: tuple[str, ...] = ("files", "packed")
 
 
 @dataclass
@@ -14,11 +31,154 @@ class SaveResult:
     status: Literal["created", "updated", "unchanged"]
 
 
+def _default_max_workers() -> int:
+    """Return the default writer pool size (bounded; file I/O releases the GIL)."""
+    return min(8, (os.cpu_count() or 1) + 4)
+
+
+def _resolve_blobs(obj: dict[str, Any], stored_at: Path) -> tuple[dict[str, Any] | None, int]:
+    """Inline deduplicated markdown/contents; returns (lifelog, blob bytes read).
+
+    The lifelog is None if a referenced blob is missing.
+    """
+    if not has_blob_refs(obj):
+        return obj, 0
+    try:
+        return BlobStore(blob_root_for(stored_at)).resolve_sized(obj)
+    except LimitlessError:
+        return None, 0
+
+
+def _read_file(path: Path) -> tuple[dict[str, Any] | None, int]:
+    try:
+        obj = read_json_file(path)
+    except (codec.JSONDecodeError, OSError):
+        return None, 0
+    return _resolve_blobs(obj, path) if isinstance(obj, dict) else (None, 0)
+
+
+def _read_pack(pack_path: Path) -> tuple[dict[str, dict[str, Any]] | None, int]:
+    """Return ``{id: lifelog}`` for a whole day pack (one sequential read) and the blob bytes read."""
+    try:
+        records = list(DayPack(pack_path.parent).iter_records())
+    except (LimitlessError, OSError):
+        return None, 0
+    out: dict[str, dict[str, Any]] = {}
+    blob_bytes = 0
+    for lifelog_id, rec in records:
+        obj, size = _resolve_blobs(rec, pack_path)
+        blob_bytes += size
+        if obj is not None:
+            out[lifelog_id] = obj
+    return out, blob_bytes
+
+
+def load_lifelog(ref: str, *, cache: LifelogCache | None = None) -> dict[str, Any] | None:
+    """Load a lifelog from a saved path (plain JSON file or ``pack#id`` reference).
+
+    With a cache, whole files (or whole day packs) are decoded once and reused
+    until their mtime/size changes. Deduplicated bodies count toward the cache
+    budget at their blob size.
+    """
+    packed = split_pack_ref(ref)
+    if packed is not None:
+        pack_path, lifelog_id = packed
+        if cache is not None:
+            day = cache.get_or_load_sized(pack_path, partial(_read_pack, pack_path))
+            return day.get(lifelog_id) if day is not None else None
+        try:
+            rec = DayPack(pack_path.parent).get(lifelog_id)
+        except LimitlessError:
+            return None
+        return _resolve_blobs(rec, pack_path)[0] if rec is not None else None
+    path = Path(ref)
+    if cache is not None:
+        return cache.get_or_load_sized(path, partial(_read_file, path))
+    return _read_file(path)[0]
+
+
+def iter_lifelogs(
+    base_dir: str | Path,
+    *,
+    date: str | None = None,
+    cache: LifelogCache | None = None,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield (path, lifelog) for every locally stored lifelog in either layout.
+
+    When ``date`` (YYYY-MM-DD) is given, day packs for other dates are skipped
+    without being read; loose JSON files are still yielded for the caller to filter.
+    """
+    base = Path(base_dir).expanduser()
+    for p in base.rglob("lifelog_*.json"):
+        obj = load_lifelog(str(p), cache=cache)
+        if obj is not None:
+            yield str(p), obj
+    day_parts = tuple(date.split("-")) if date else None
+    for pack_path in base.rglob(PACK_NAME):
+        if day_parts is not None and pack_path.parent.parts[-3:] != day_parts:
+            continue
+        if cache is not None:
+            day = cache.get_or_load_sized(pack_path, partial(_read_pack, pack_path))
+        else:
+            day = _read_pack(pack_path)[0]
+        for lifelog_id, obj in (day or {}).items():
+            yield pack_ref(pack_path, lifelog_id), obj
+
+
 class JsonFileRepository:
-    def __init__(self, base_dir: str) -> None:
+    def __init__(
+        self,
+        base_dir: str,
+        *,
+        max_workers: int | None = None,
+        layout: StorageLayout = "files",
+        dedupe: bool = False,
+    ) -> None:
+        if layout not in STORAGE_LAYOUTS:
+            raise StorageError(f"Unknown storage layout: {layout}", context={"layout": layout})
         self.base_dir = Path(base_dir).expanduser()
+        self.layout = layout
+        # Optional content-addressed store: markdown/contents are written once per unique value
+        self._blobs = BlobStore(self.base_dir / BLOB_DIR_NAME) if dedupe else None
+        self.max_workers = max(1, int(max_workers)) if max_workers is not None else _default_max_workers()
+        # Directories known to exist, with a snapshot of their file names, so bulk
+        # saves into the same YYYY/MM/DD folder avoid repeated mkdir/stat calls.
+        self._dir_listings: dict[Path, set[str]] = {}
+        self._dir_lock = threading.Lock()
+        # Packed layout: one DayPack (with its offset table) and lock per day folder
+        self._packs: dict[Path, tuple[DayPack, threading.Lock]] = {}
+        # Writer pool shared by every save_many call (one per sync page); see close()
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
 
-    def path_for_lifelog(self, lifelog: dict[str, Any]) -> str:
+    def _executor(self) -> ThreadPoolExecutor:
+        """Return the writer pool, creating it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="limitless-save")
+            return self._pool
+
+    def close(self) -> None:
+        """Shut down the writer pool. The repository stays usable; a later save starts a new pool."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _ensure_dir(self, dir_path: Path) -> set[str]:
+        """Create dir_path if needed and return its cached file-name listing."""
+        listing = self._dir_listings.get(dir_path)
+        if listing is not None:
+            return listing
+        with self._dir_lock:
+            listing = self._dir_listings.get(dir_path)
+            if listing is None:
+                dir_path.mkdir(parents=True, exist_ok=True)
+                listing = set(os.listdir(dir_path))
+                self._dir_listings[dir_path] = listing
+            return listing
+
+    def _day_dir(self, lifelog: dict[str, Any]) -> Path:
         start_time = str(lifelog.get("startTime") or "0000-00-00T00:00:00Z")
         try:
             yyyy, mm, dd = start_time[:10].split("-")
@@ -28,11 +188,40 @@ class JsonFileRepository:
                 cause=exc,
                 context={"startTime": start_time, "lifelog_id": lifelog.get("id")},
             ) from exc
-        dir_path = self.base_dir / yyyy / mm / dd
+        return self.base_dir / yyyy / mm / dd
+
+    def path_for_lifelog(self, lifelog: dict[str, Any]) -> str:
+        dir_path = self._day_dir(lifelog)
+        if self.layout == "packed":
+            return pack_ref(dir_path / PACK_NAME, lifelog.get("id"))
         file_path = dir_path / f"lifelog_{lifelog.get('id')}.json"
         return str(file_path)
 
+    def _pack_for(self, dir_path: Path) -> tuple[DayPack, threading.Lock]:
+        with self._dir_lock:
+            entry = self._packs.get(dir_path)
+            if entry is None:
+                entry = (DayPack(dir_path), threading.Lock())
+                self._packs[dir_path] = entry
+            return entry
+
+    def _save_packed_day(self, dir_path: Path, lifelogs: list[dict[str, Any]]) -> list[SaveResult]:
+        try:
+            self._ensure_dir(dir_path)
+        except OSError as exc:
+            raise StorageError("Unable to create lifelog directory.", cause=exc, context={"path": str(dir_path)}) from exc
+        stored = [self._blobs.externalize(ll) for ll in lifelogs] if self._blobs else lifelogs
+        pack, lock = self._pack_for(dir_path)
+        with lock:
+            statuses = pack.put_many(stored)
+        return [
+            SaveResult(pack_ref(pack.pack_path, ll.get("id")), status)
+            for ll, status in zip(lifelogs, statuses, strict=True)
+        ]
+
     def save_lifelog(self, lifelog: dict[str, Any]) -> SaveResult:
+        if self.layout == "packed":
+            return self._save_packed_day(self._day_dir(lifelog), [lifelog])[0]
         try:
             path = Path(self.path_for_lifelog(lifelog))
         except LimitlessError:
@@ -42,31 +231,136 @@ class JsonFileRepository:
                 "Failed to build lifelog path.", cause=exc, context={"lifelog_id": lifelog.get("id")}
             ) from exc
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
+            listing = self._ensure_dir(path.parent)
         except OSError as exc:
             raise StorageError(
                 "Unable to create lifelog directory.", cause=exc, context={"path": str(path.parent)}
             ) from exc
-        serialized = json.dumps(lifelog, ensure_ascii=False, indent=2)
+        # With dedupe on, the file holds blob refs and is compared/written in that form
+        stored = self._blobs.externalize(lifelog) if self._blobs else lifelog
+        serialized = codec.dumps_bytes(stored, indent=True)
         status: Literal["created", "updated", "unchanged"]
-        if path.exists():
+        if path.name in listing:
             try:
-                existing = json.loads(path.read_text())
-            except json.JSONDecodeError:
+                existing = codec.loads(path.read_bytes())
+            except codec.JSONDecodeError:
                 existing = None
+            except FileNotFoundError:
+                # Removed since the directory snapshot was taken
+                existing = None
+                listing.discard(path.name)
             except OSError as exc:
                 raise StorageError(
                     "Unable to read existing lifelog file.", cause=exc, context={"path": str(path)}
                 ) from exc
-            if existing == lifelog:
+            if existing == stored:
                 status = "unchanged"
+            elif path.name not in listing:
+                status = "created"
             else:
                 status = "updated"
         else:
             status = "created"
         if status != "unchanged":
             try:
-                path.write_text(serialized)
+                path.write_bytes(serialized)
+            except FileNotFoundError:
+                # Directory vanished under us; drop the stale cache entry and retry once
+                with self._dir_lock:
+                    self._dir_listings.pop(path.parent, None)
+                try:
+                    listing = self._ensure_dir(path.parent)
+                    path.write_bytes(serialized)
+                except OSError as exc:
+                    raise StorageError("Unable to write lifelog file.", cause=exc, context={"path": str(path)}) from exc
             except OSError as exc:
                 raise StorageError("Unable to write lifelog file.", cause=exc, context={"path": str(path)}) from exc
+            listing.add(path.name)
         return SaveResult(str(path), status)
+
+    def save_many(self, lifelogs: Iterable[dict[str, Any]]) -> list[SaveResult]:
+        """Save lifelogs using a bounded thread pool. Results are returned in input order.
+
+        If any save fails, the first failure (in input order) is raised with the
+        offending lifelog id added to the error context.
+        """
+        items = list(lifelogs)
+        if not items:
+            return []
+        if self.layout == "packed":
+            return self._save_many_packed(items)
+        if self.max_workers <= 1 or len(items) == 1:
+            return [self._save_with_context(item) for item in items]
+        # Items sharing a target file run in input order on one worker, so the last one wins
+        groups: dict[str, list[int]] = {}
+        for i, item in enumerate(items):
+            try:
+                key = self.path_for_lifelog(item)
+            except LimitlessError:
+                # Surfaces again (with context) from _save_with_context
+                key = f"#{i}"
+            groups.setdefault(key, []).append(i)
+        outcomes: list[SaveResult | BaseException | None] = [None] * len(items)
+
+        def _run(positions: list[int]) -> None:
+            for i in positions:
+                try:
+                    outcomes[i] = self._save_with_context(items[i])
+                except Exception as exc:
+                    outcomes[i] = exc
+
+        pool = self._executor()
+        # Let every write finish before surfacing the first failure
+        wait([pool.submit(_run, positions) for positions in groups.values()])
+        results: list[SaveResult] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            if outcome is not None:
+                results.append(outcome)
+        return results
+
+    def _save_many_packed(self, items: list[dict[str, Any]]) -> list[SaveResult]:
+        """Group items by day so each day pack is appended once (days run in parallel)."""
+        groups: dict[Path, list[int]] = {}
+        for i, item in enumerate(items):
+            try:
+                dir_path = self._day_dir(item)
+            except LimitlessError as exc:
+                exc.context.setdefault("lifelog_id", item.get("id"))
+                raise
+            groups.setdefault(dir_path, []).append(i)
+        results: list[SaveResult | None] = [None] * len(items)
+
+        def _run(dir_path: Path, positions: list[int]) -> None:
+            # Duplicate ids within one page: the last occurrence wins, like sequential saves
+            batch = [items[i] for i in positions]
+            try:
+                saved = self._save_packed_day(dir_path, batch)
+            except LimitlessError as exc:
+                exc.context.setdefault("lifelog_id", batch[0].get("id"))
+                raise
+            for i, res in zip(positions, saved, strict=True):
+                results[i] = res
+
+        if self.max_workers <= 1 or len(groups) <= 1:
+            for dir_path, positions in groups.items():
+                _run(dir_path, positions)
+        else:
+            pool = self._executor()
+            futures = [pool.submit(_run, d, pos) for d, pos in groups.items()]
+            wait(futures)
+            for fut in futures:
+                fut.result()
+        return [r for r in results if r is not None]
+
+    def _save_with_context(self, lifelog: dict[str, Any]) -> SaveResult:
+        try:
+            return self.save_lifelog(lifelog)
+        except LimitlessError as exc:
+            exc.context.setdefault("lifelog_id", lifelog.get("id"))
+            raise
+        except Exception as exc:
+            raise StorageError(
+                "Unexpected failure while saving lifelog.", cause=exc, context={"lifelog_id": lifelog.get("id")}
+            ) from exc
@@ -0,0 +1,41 @@
+"""Bytes-oriented JSON read path (mmap for large files, fast decoder when installed)."""
+
+from __future__ import annotations
+
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+from limitless_tools import codec
+
+# Below this size a plain read() is cheaper than setting up a mapping
+MMAP_THRESHOLD = 256 * 1024
+
+
+def loads_region(buf: mmap.mmap, offset: int, length: int) -> Any:
+    """Decode the JSON value stored at buf[offset:offset+length]."""
+    if not codec.SUPPORTS_BUFFER:
+        return codec.loads(buf[offset : offset + length])
+    view = memoryview(buf)
+    try:
+        region = view[offset : offset + length]
+        try:
+            return codec.loads(region)
+        finally:
+            region.release()
+    finally:
+        view.release()
+
+
+def read_json_file(path: Path, *, mmap_threshold: int = MMAP_THRESHOLD) -> Any:
+    """Read and decode a JSON file, memory-mapping it when larger than mmap_threshold.
+
+    Raises OSError for I/O failures and json.JSONDecodeError for invalid JSON.
+    """
+    with path.open("rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size < max(1, mmap_threshold):
+            return codec.loads(fh.read())
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return loads_region(mm, 0, size)
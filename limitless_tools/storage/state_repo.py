@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import json
+import os
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from limitless_tools import codec
 from limitless_tools.errors import StateError
 
 
@@ -22,8 +24,8 @@ class StateRepository:
         if not p.exists():
             return {}
         try:
-            return json.loads(p.read_text())
-        except json.JSONDecodeError as exc:
+            return codec.loads(p.read_bytes())
+        except codec.JSONDecodeError as exc:
             raise StateError("Sync state file is corrupted.", cause=exc, context={"path": str(p)}) from exc
         except OSError as exc:
             raise StateError("Unable to read sync state file.", cause=exc, context={"path": str(p)}) from exc
@@ -34,7 +36,11 @@ class StateRepository:
             p.parent.mkdir(parents=True, exist_ok=True)
         except OSError as exc:
             raise StateError("Unable to create sync state directory.", cause=exc, context={"path": str(p.parent)}) from exc
+        # Write-then-rename so an interrupted sync never leaves a truncated state file
+        tmp = p.with_name(f".{p.name}.{uuid.uuid4().hex}.tmp")
         try:
-            p.write_text(json.dumps(state, ensure_ascii=False, indent=2))
+            tmp.write_bytes(codec.dumps_bytes(state, indent=True))
+            os.replace(tmp, p)
         except OSError as exc:
+            tmp.unlink(missing_ok=True)
             raise StateError("Unable to write sync state file.", cause=exc, context={"path": str(p)}) from exc
@@ -0,0 +1,166 @@
+"""Record real API responses to a cassette file and replay them offline.
+
+A cassette is JSON Lines: one interaction per line with the request (URL, params,
+redacted headers) and the response (status, cache/retry headers, JSON body,
+elapsed seconds). ``RecordingSession`` wraps a live session; ``ReplaySession``
+serves a cassette with optional injected latency, jitter and errors, so sync
+throughput can be measured reproducibly without network access.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from limitless_tools import codec
+
+REDACTED = "REDACTED"
+SENSITIVE_HEADERS = frozenset({"x-api-key", "authorization", "cookie"})
+RECORDED_RESPONSE_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+
+def _request_key(url: str, params: Mapping[str, Any] | None) -> str:
+    return codec.dumps({"url": url, "params": dict(params or {})}, sort_keys=True)
+
+
+class CassetteResponse:
+    """Minimal ``requests.Response`` stand-in built from a recorded interaction."""
+
+    def __init__(self, status_code: int, body: Any, headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+        self._body = body
+        self.content = codec.dumps_bytes(body) if body is not None else b""
+        self.text = self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return self._body
+
+
+class RecordingSession:
+    """Forwards ``get`` to ``session`` and appends each interaction to ``path``.
+
+    API keys are removed from headers and from anything echoed back in URLs or
+    bodies before the line is written.
+    """
+
+    def __init__(self, session: Any, path: Path, *, secrets: tuple[str, ...] = ()) -> None:
+        self.session = session
+        self.path = path
+        self.secrets = tuple(s for s in secrets if s)
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def get(self, url: str, headers: Mapping[str, str] | None = None, params: Any = None, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        resp = self.session.get(url, headers=headers, params=params, **kwargs)
+        elapsed = time.perf_counter() - started
+        req_headers = {
+            k: (REDACTED if k.lower() in SENSITIVE_HEADERS else v) for k, v in dict(headers or {}).items()
+        }
+        secrets = self.secrets + tuple(
+            v for k, v in dict(headers or {}).items() if k.lower() in SENSITIVE_HEADERS and v
+        )
+        try:
+            body = resp.json()
+        except ValueError:
+            body = None
+        resp_headers = getattr(resp, "headers", None)
+        interaction = {
+            "request": {"url": url, "params": dict(params or {}), "headers": req_headers},
+            "response": {
+                "status": getattr(resp, "status_code", 200),
+                "headers": {
+                    h: resp_headers.get(h)
+                    for h in RECORDED_RESPONSE_HEADERS
+                    if isinstance(resp_headers, Mapping) and resp_headers.get(h) is not None
+                },
+                "body": body,
+                "elapsed": round(elapsed, 6),
+            },
+        }
+        line = codec.dumps(interaction)
+        for secret in secrets:
+            line = line.replace(secret, REDACTED)
+        with self._lock, self.path.open("a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+        return resp
+
+
+def load_cassette(path: Path) -> list[dict[str, Any]]:
+    """Read the interactions of a cassette file (blank lines are ignored)."""
+    with path.open("rb") as fh:
+        return [codec.loads(line) for line in fh if line.strip()]
+
+
+class ReplaySession:
+    """Serves recorded responses for matching requests (URL + params), in recorded order.
+
+    ``latency`` (seconds, or ``"recorded"`` to reuse each interaction's elapsed
+    time) plus uniform ``jitter`` is slept before every response. With
+    ``error_rate`` a request fails with ``error_status`` instead (the recorded
+    response stays queued for the retry); ``retry_after`` adds that header.
+    Unknown requests get a 404. ``seed`` makes jitter and errors reproducible.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        latency: float | str = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: float | None = None,
+        seed: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[dict[str, Any]]] = {}
+        self._last: dict[str, dict[str, Any]] = {}
+        for interaction in load_cassette(path):
+            req = interaction.get("request") or {}
+            key = _request_key(str(req.get("url")), req.get("params"))
+            self._queues.setdefault(key, deque()).append(interaction.get("response") or {})
+        self.calls = 0
+        self.injected_errors = 0
+
+    def _next_response(self, key: str) -> dict[str, Any] | None:
+        # Repeated requests past the recording reuse the last recorded response
+        queue = self._queues.get(key)
+        if queue:
+            self._last[key] = queue.popleft()
+        return self._last.get(key)
+
+    def get(self, url: str, headers: Mapping[str, str] | None = None, params: Any = None, **_: Any) -> CassetteResponse:
+        key = _request_key(url, params)
+        with self._lock:
+            self.calls += 1
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+            extra = self._rng.uniform(0.0, self.jitter) if self.jitter > 0 else 0.0
+            recorded = None if fail else self._next_response(key)
+            if fail:
+                self.injected_errors += 1
+        base = float(recorded.get("elapsed") or 0.0) if self.latency == "recorded" and recorded else self.latency
+        delay = (base if isinstance(base, (int, float)) else 0.0) + extra
+        if delay > 0:
+            self._sleep(delay)
+        if fail:
+            err_headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else {}
+            return CassetteResponse(self.error_status, {"message": "injected error"}, err_headers)
+        if recorded is None:
+            return CassetteResponse(404, {"message": "no recorded response for request"})
+        return CassetteResponse(int(recorded.get("status") or 200), recorded.get("body"), recorded.get("headers"))
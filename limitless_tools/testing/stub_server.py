@@ -0,0 +1,341 @@
+"""Local stub of the Limitless lifelogs API for load and integration tests.
+
+Serves ``GET /v1/lifelogs`` (cursor pagination, ``date``/``start``/``end``/
+``timezone``/``isStarred`` filters, ``direction``, ``includeMarkdown``/
+``includeHeadings``) and ``GET /v1/lifelogs/{id}`` from an in-memory dataset,
+with optional latency, jitter and 429/Retry-After injection. Run it with::
+
+    python -m limitless_tools.testing.stub_server --count 5000 --port 8787
+
+and point the CLI at it with ``--api-url http://127.0.0.1:8787`` (localhost and
+127.0.0.1 are in the client's default allowlist).
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import binascii
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from limitless_tools import codec
+from limitless_tools.testing.cassette import CassetteResponse
+from limitless_tools.testing.synthetic import (
+    DEFAULT_SPAN_DAYS,
+    DEFAULT_START,
+    iter_synthetic_lifelogs,
+)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 10
+LIFELOGS_PATH = "/v1/lifelogs"
+
+Response = tuple[int, dict[str, str], Any]
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+    if not raw.startswith("o:"):
+        raise ValueError(f"bad cursor {cursor!r}")
+    return int(raw[2:])
+
+
+def _without_headings(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Heading nodes are dropped and their children take their place
+    out: list[dict[str, Any]] = []
+    for node in nodes:
+        children = _without_headings(node.get("children") or [])
+        if str(node.get("type", "")).startswith("heading"):
+            out.extend(children)
+        else:
+            out.append({**node, "children": children})
+    return out
+
+
+def _error(status: int, message: str, headers: dict[str, str] | None = None) -> Response:
+    return status, headers or {}, {"error": message}
+
+
+class StubApi:
+    """Request handling for the stub, independent of the HTTP server.
+
+    Every ``throttle_every``-th request, and a seeded ``throttle_rate`` fraction
+    of the rest, get a 429 with ``Retry-After: retry_after``. ``latency`` plus
+    uniform ``jitter`` seconds is slept before each response. When ``api_key``
+    is set, requests must send it in ``X-API-Key``.
+    """
+
+    def __init__(
+        self,
+        lifelogs: Iterable[Mapping[str, Any]],
+        *,
+        api_key: str | None = None,
+        max_limit: int = 100,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_every: int = 0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        seed: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.api_key = api_key
+        self.max_limit = max_limit
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_every = throttle_every
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        # Sorted oldest first with parsed start times, so filters avoid reparsing per request
+        rows = [(_parse_time(str(item["startTime"])), dict(item)) for item in lifelogs]
+        rows.sort(key=lambda row: row[0])
+        self._rows = rows
+        self._by_id = {item["id"]: item for _, item in rows}
+        self.requests = 0
+        self.throttled = 0
+
+    def handle(self, path: str, query: Mapping[str, str], headers: Mapping[str, str]) -> Response:
+        """Return ``(status, headers, json_body)`` for a GET request."""
+        with self._lock:
+            self.requests += 1
+            throttle = (self.throttle_every > 0 and self.requests % self.throttle_every == 0) or (
+                self.throttle_rate > 0 and self._rng.random() < self.throttle_rate
+            )
+            if throttle:
+                self.throttled += 1
+            delay = self.latency + (self._rng.uniform(0.0, self.jitter) if self.jitter > 0 else 0.0)
+        if delay > 0:
+            self._sleep(delay)
+        # Header names are case-insensitive on the wire
+        sent_key = next((v for k, v in headers.items() if k.lower() == "x-api-key"), None)
+        if self.api_key is not None and sent_key != self.api_key:
+            return _error(401, "Invalid API key")
+        if throttle:
+            return _error(429, "Rate limit exceeded", {"Retry-After": f"{self.retry_after:g}"})
+        if path.rstrip("/") == LIFELOGS_PATH:
+            return self._list(query)
+        if path.startswith(LIFELOGS_PATH + "/"):
+            return self._get(unquote(path[len(LIFELOGS_PATH) + 1 :]), query)
+        return _error(404, "Not found")
+
+    def _zone(self, query: Mapping[str, str]) -> ZoneInfo:
+        return ZoneInfo(query.get("timezone") or "UTC")
+
+    def _bound(self, value: str, tz: ZoneInfo) -> datetime:
+        # Naive dates/datetimes are in the requested timezone, as in the real API
+        moment = _parse_time(value.replace(" ", "T"))
+        return moment if moment.tzinfo is not None else moment.replace(tzinfo=tz)
+
+    def _render(self, item: Mapping[str, Any], query: Mapping[str, str], tz: ZoneInfo) -> dict[str, Any]:
+        out = dict(item)
+        if query.get("includeMarkdown") == "false":
+            out.pop("markdown", None)
+        if query.get("includeHeadings") == "false" and isinstance(out.get("contents"), list):
+            out["contents"] = _without_headings(out["contents"])
+        if query.get("timezone"):
+            for key in ("startTime", "endTime"):
+                if out.get(key):
+                    out[key] = _parse_time(str(out[key])).astimezone(tz).isoformat()
+        return out
+
+    def _list(self, query: Mapping[str, str]) -> Response:
+        try:
+            tz = self._zone(query)
+            lo = hi = None
+            if query.get("date"):
+                lo = self._bound(query["date"], tz)
+                hi = lo + timedelta(days=1)
+            if query.get("start"):
+                lo = self._bound(query["start"], tz)
+            if query.get("end"):
+                hi = self._bound(query["end"], tz)
+            limit = min(self.max_limit, max(1, int(query.get("limit") or DEFAULT_LIMIT)))
+            offset = _decode_cursor(query["cursor"]) if query.get("cursor") else 0
+        except (ValueError, ZoneInfoNotFoundError, binascii.Error) as exc:
+            return _error(400, str(exc))
+        starred = query.get("isStarred")
+        matches = [
+            item
+            for began, item in self._rows
+            if (lo is None or began >= lo)
+            and (hi is None or began < hi)
+            and (starred is None or bool(item.get("isStarred")) == (starred == "true"))
+        ]
+        if query.get("direction", "desc") != "asc":
+            matches.reverse()
+        page = matches[offset : offset + limit]
+        next_cursor = _encode_cursor(offset + limit) if offset + limit < len(matches) else None
+        body = {
+            "data": {"lifelogs": [self._render(item, query, tz) for item in page]},
+            "meta": {"lifelogs": {"nextCursor": next_cursor, "count": len(page)}},
+        }
+        return 200, {}, body
+
+    def _get(self, lifelog_id: str, query: Mapping[str, str]) -> Response:
+        item = self._by_id.get(lifelog_id)
+        if item is None:
+            return _error(404, "Lifelog not found")
+        try:
+            tz = self._zone(query)
+        except (ValueError, ZoneInfoNotFoundError) as exc:
+            return _error(400, str(exc))
+        return 200, {}, {"data": {"lifelog": self._render(item, query, tz)}}
+
+
+class StubSession:
+    """In-process session that sends ``get`` calls straight to ``api`` (no sockets).
+
+    Useful for benchmarks and tests that exercise the full client and service
+    path without HTTP overhead; pass it as ``http_session``/``session``.
+    """
+
+    def __init__(self, api: StubApi) -> None:
+        self.api = api
+
+    def get(self, url: str, headers: Mapping[str, str] | None = None, params: Any = None, **_: Any) -> CassetteResponse:
+        query = {str(k): str(v) for k, v in dict(params or {}).items()}
+        status, resp_headers, body = self.api.handle(urlsplit(url).path, query, dict(headers or {}))
+        return CassetteResponse(status, body, resp_headers)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _StubHTTPServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        status, headers, body = self.server.api.handle(parts.path, query, dict(self.headers.items()))
+        payload = codec.dumps_bytes(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - signature from base class
+        log.debug("%s - %s", self.address_string(), format % args)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], api: StubApi) -> None:
+        super().__init__(address, _Handler)
+        self.api = api
+
+
+class StubServer:
+    """Runs ``api`` on a background thread; ``port=0`` picks a free port.
+
+    Use as a context manager; ``url`` is the base URL to pass as ``--api-url``.
+    """
+
+    def __init__(self, api: StubApi, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.api = api
+        self._httpd = _StubHTTPServer((host, port), api)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        host_name = host.decode("ascii") if isinstance(host, bytes) else str(host)
+        return f"http://{host_name}:{port}"
+
+    def start(self) -> StubServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="limitless-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted, then close the socket."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> StubServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m limitless_tools.testing.stub_server",
+        description="Serve synthetic lifelogs through a local stub of the Limitless API",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--count", type=int, default=1000, help="Number of synthetic lifelogs")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the dataset and injected faults")
+    parser.add_argument("--start", default=DEFAULT_START, help="Earliest lifelog start time")
+    parser.add_argument("--span-days", type=int, default=DEFAULT_SPAN_DAYS, help="Days the lifelogs are spread over")
+    parser.add_argument("--api-key", default=None, help="Require this X-API-Key (default: accept any)")
+    parser.add_argument("--max-limit", type=int, default=100, help="Largest page size served")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra uniform random delay (seconds)")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every Nth request with 429")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(message)s")
+    api = StubApi(
+        iter_synthetic_lifelogs(args.count, seed=args.seed, start=args.start, span_days=args.span_days),
+        api_key=args.api_key,
+        max_limit=args.max_limit,
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_every=args.throttle_every,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = StubServer(api, host=args.host, port=args.port)
+    log.info("Serving %d synthetic lifelogs at %s (Ctrl-C to stop)", args.count, server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        log.info("Handled %d requests (%d throttled)", api.requests, api.throttled)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
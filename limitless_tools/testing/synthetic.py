@@ -0,0 +1,247 @@
+"""Deterministic synthetic lifelogs for load tests and benchmarks.
+
+Lifelogs mimic the API shape: a ``heading1`` per conversation with ``heading2``
+sections holding ``blockquote`` utterances (speakers, times and offsets), the
+matching markdown, and start times spread over several years, mostly during the
+day. Transcript length is heavy-tailed, so a corpus has many short entries and a
+few very long ones. A given ``seed`` always produces byte-identical lifelogs, so
+benchmark numbers are comparable across releases. Generate an archive with::
+
+    python -m limitless_tools.testing.synthetic --count 10000 --seed 1 --data-dir /tmp/bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from limitless_tools import codec
+from limitless_tools.storage.json_repo import STORAGE_LAYOUTS, JsonFileRepository, StorageLayout
+
+DEFAULT_START = "2022-01-01T00:00:00Z"
+DEFAULT_SPAN_DAYS = 3 * 365
+
+_TOPICS = (
+    "Standup", "Design review", "Lunch", "Planning", "1:1", "Commute", "Call", "Workout",
+    "Retro", "Dinner", "Doctor visit", "Interview", "Brainstorm", "Errands", "Podcast notes",
+)
+_SECTIONS = ("Introductions", "Updates", "Discussion", "Decisions", "Next steps", "Small talk", "Wrap-up")
+_SPEAKERS = ("Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn")
+_WORDS = (
+    "project deadline budget meeting notes follow up customer release schedule review design "
+    "question answer idea plan weekend coffee travel ticket update draft team launch metrics "
+    "feedback priority risk bug fix deploy contract invoice vendor roadmap hiring onboarding "
+    "kids school groceries gym appointment flight hotel dinner birthday garden car repair"
+).split()
+# ln(utterances) ~ N(2.3, 0.9): median ~10, long tail of multi-hundred-line transcripts
+_UTTERANCES_MU = 2.3
+_UTTERANCES_SIGMA = 0.9
+_MAX_UTTERANCES = 2000
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _clock(dt: datetime) -> str:
+    return dt.strftime("%I:%M %p").lstrip("0")
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(_WORDS, k=rng.randint(3, 24))
+    end = "?" if rng.random() < 0.15 else "."
+    return " ".join(words).capitalize() + end
+
+
+def _start_times(rng: random.Random, count: int, origin: datetime, span_days: int) -> list[datetime]:
+    # Days are uniform over the span; times of day cluster between 07:00 and 23:00
+    starts = []
+    for _ in range(count):
+        day = rng.randrange(max(1, span_days))
+        seconds = int(min(86399.0, max(0.0, rng.gauss(15 * 3600, 4 * 3600))))
+        starts.append(origin + timedelta(days=day, seconds=seconds))
+    starts.sort()
+    return starts
+
+
+def _lifelog(seed: int, n: int, began: datetime) -> dict[str, Any]:
+    # One RNG per lifelog keeps each entry stable regardless of how many are generated
+    rng = random.Random(f"{seed}:{n}")
+    title = f"{rng.choice(_TOPICS)} {n}"
+    speakers = ["You", *rng.sample(_SPEAKERS, rng.randint(0, 3))]
+    utterances = min(_MAX_UTTERANCES, max(1, round(rng.lognormvariate(_UTTERANCES_MU, _UTTERANCES_SIGMA))))
+    sections = rng.sample(_SECTIONS, min(len(_SECTIONS), max(1, math.ceil(utterances / 25))))
+
+    offset_ms = 0
+    children: list[dict[str, Any]] = []
+    markdown = [f"# {title}", ""]
+    per_section = math.ceil(utterances / len(sections))
+    for index, heading in enumerate(sections):
+        quotes: list[dict[str, Any]] = []
+        markdown.extend([f"## {heading}", ""])
+        for _ in range(min(per_section, utterances - index * per_section)):
+            speaker = rng.choice(speakers)
+            text = _sentence(rng)
+            duration_ms = rng.randint(800, 12000)
+            said = began + timedelta(milliseconds=offset_ms)
+            quotes.append({
+                "type": "blockquote",
+                "content": text,
+                "startTime": _iso(said),
+                "endTime": _iso(said + timedelta(milliseconds=duration_ms)),
+                "startOffsetMs": offset_ms,
+                "endOffsetMs": offset_ms + duration_ms,
+                "children": [],
+                "speakerName": speaker,
+                "speakerIdentifier": "user" if speaker == "You" else None,
+            })
+            markdown.extend([f"- {speaker} ({_clock(said)}): {text}", ""])
+            offset_ms += duration_ms + rng.randint(0, 3000)
+        children.append({"type": "heading2", "content": heading, "children": quotes})
+    ended = began + timedelta(milliseconds=max(offset_ms, 1000))
+    return {
+        "id": f"syn-{seed}-{n:06d}",
+        "title": title,
+        "markdown": "\n".join(markdown),
+        "contents": [{"type": "heading1", "content": title, "children": children}],
+        "startTime": _iso(began),
+        "endTime": _iso(ended),
+        "isStarred": rng.random() < 0.05,
+        "updatedAt": _iso(ended + timedelta(minutes=rng.randint(1, 90))),
+    }
+
+
+def iter_synthetic_lifelogs(
+    count: int,
+    *,
+    seed: int = 0,
+    start: str = DEFAULT_START,
+    span_days: int = DEFAULT_SPAN_DAYS,
+) -> Iterator[dict[str, Any]]:
+    """Yield ``count`` API-shaped lifelogs spread over ``span_days`` from ``start``, oldest first.
+
+    Lifelogs are built lazily, so large corpora can be written without holding
+    them all in memory.
+    """
+    origin = datetime.fromisoformat(start.replace("Z", "+00:00"))
+    if origin.tzinfo is None:
+        origin = origin.replace(tzinfo=UTC)
+    starts = _start_times(random.Random(seed), max(0, count), origin, span_days)
+    for n, began in enumerate(starts):
+        yield _lifelog(seed, n, began)
+
+
+def generate_lifelogs(
+    count: int,
+    *,
+    seed: int = 0,
+    start: str = DEFAULT_START,
+    span_days: int = DEFAULT_SPAN_DAYS,
+) -> list[dict[str, Any]]:
+    """Return ``count`` synthetic lifelogs, oldest first (see ``iter_synthetic_lifelogs``)."""
+    return list(iter_synthetic_lifelogs(count, seed=seed, start=start, span_days=span_days))
+
+
+def api_pages(
+    lifelogs: Iterable[dict[str, Any]],
+    *,
+    page_size: int = 10,
+    direction: str = "desc",
+) -> Iterator[dict[str, Any]]:
+    """Yield ``GET /v1/lifelogs`` response bodies for ``lifelogs``, chained by ``nextCursor``."""
+    items = sorted(lifelogs, key=lambda x: str(x.get("startTime") or ""), reverse=direction != "asc")
+    size = max(1, int(page_size))
+    for offset in range(0, len(items), size):
+        page = items[offset : offset + size]
+        nxt = f"synthetic-{offset + size}" if offset + size < len(items) else None
+        yield {"data": {"lifelogs": page}, "meta": {"lifelogs": {"nextCursor": nxt, "count": len(page)}}}
+
+
+def write_archive(
+    lifelogs: Iterable[dict[str, Any]],
+    data_dir: str,
+    *,
+    layout: StorageLayout = "files",
+    chunk_size: int = 500,
+    index: bool = True,
+) -> int:
+    """Save lifelogs through ``JsonFileRepository`` and write ``index.json`` as ``sync`` does.
+
+    Returns the number of lifelogs written.
+    """
+    repo = JsonFileRepository(base_dir=data_dir, layout=layout)
+    rows: list[dict[str, Any]] = []
+    chunk: list[dict[str, Any]] = []
+
+    def _flush() -> None:
+        for item, result in zip(chunk, repo.save_many(chunk), strict=True):
+            rows.append({
+                "id": item.get("id"),
+                "title": item.get("title"),
+                "startTime": item.get("startTime"),
+                "endTime": item.get("endTime"),
+                "isStarred": item.get("isStarred"),
+                "updatedAt": item.get("updatedAt"),
+                "path": result.path,
+            })
+        chunk.clear()
+
+    for lifelog in lifelogs:
+        chunk.append(lifelog)
+        if len(chunk) >= chunk_size:
+            _flush()
+    _flush()
+    if index:
+        base = Path(data_dir).expanduser()
+        base.mkdir(parents=True, exist_ok=True)
+        rows.sort(key=lambda x: str(x.get("startTime") or ""))
+        (base / "index.json").write_bytes(codec.dumps_bytes(rows, indent=True))
+    return len(rows)
+
+
+def write_pages(lifelogs: Iterable[dict[str, Any]], out_dir: str, *, page_size: int = 10) -> int:
+    """Write API-shaped pages as ``page-00001.json``... under ``out_dir``. Returns the page count."""
+    target = Path(out_dir).expanduser()
+    target.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for count, body in enumerate(api_pages(lifelogs, page_size=page_size), start=1):
+        (target / f"page-{count:05d}.json").write_bytes(codec.dumps_bytes(body))
+    return count
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m limitless_tools.testing.synthetic",
+        description="Generate a deterministic synthetic lifelog corpus",
+    )
+    parser.add_argument("--count", type=int, required=True, help="Number of lifelogs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", default=DEFAULT_START, help="Earliest lifelog start time")
+    parser.add_argument("--span-days", type=int, default=DEFAULT_SPAN_DAYS, help="Days the lifelogs are spread over")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--data-dir", help="Write a local archive (files + index.json) here")
+    target.add_argument("--pages-dir", help="Write API-shaped response pages here")
+    parser.add_argument("--layout", choices=STORAGE_LAYOUTS, default="files", help="Archive storage layout")
+    parser.add_argument("--page-size", type=int, default=10, help="Lifelogs per page with --pages-dir")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    lifelogs = iter_synthetic_lifelogs(args.count, seed=args.seed, start=args.start, span_days=args.span_days)
+    if args.data_dir:
+        written = write_archive(lifelogs, args.data_dir, layout=args.layout)
+        print(f"Wrote {written} lifelogs to {args.data_dir}")
+    else:
+        pages = write_pages(lifelogs, args.pages_dir, page_size=args.page_size)
+        print(f"Wrote {pages} pages to {args.pages_dir}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
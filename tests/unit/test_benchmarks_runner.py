@@ -0,0 +1,31 @@
+"""
+Benchmark runner: result shape and regression comparison.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+
+def test_suite_reports_every_selected_benchmark(tmp_path: Path):
+    from benchmarks.run import BENCHMARKS, run_suite
+
+    report = run_suite(sizes=[15], names=list(BENCHMARKS), repeat=1, seed=1, layout="files", work_dir=tmp_path)
+    assert [r["name"] for r in report["results"]] == list(BENCHMARKS)
+
+
+def test_archive_is_reused_between_runs(tmp_path: Path):
+    from benchmarks.run import ensure_archive
+
+    first = ensure_archive(tmp_path, 10, 2, "packed")
+    marker = first.parent / ".complete"
+    stamp = marker.stat().st_mtime_ns
+    ensure_archive(tmp_path, 10, 2, "packed")
+    assert marker.stat().st_mtime_ns == stamp
+
+
+def test_compare_flags_median_slowdowns_beyond_threshold():
+    from benchmarks.run import compare
+
+    baseline = {"results": [{"name": "list_local", "size": 10, "median": 1.0}, {"name": "export_csv", "size": 10, "median": 1.0}]}
+    current = {"results": [{"name": "list_local", "size": 10, "median": 1.5}, {"name": "export_csv", "size": 10, "median": 1.1}]}
+    assert [line.split(" ")[0] for line in compare(current, baseline, 0.2)] == ["list_local"]
@@ -58,3 +58,80 @@ batch_size = 50
 
     merged = load_config(str(cfg))
     assert code == 0 and merged["default"]["batch_size"] == 50 and str(merged["default"]["data_dir"]).endswith("dir2")
+
+
+def test_configure_accepts_every_profile_key_the_run_commands_read(monkeypatch, tmp_path: Path):
+    from limitless_tools.cli import main as cli_main
+    from limitless_tools.config.config import load_config
+
+    cfg = tmp_path / "cfg.toml"
+    code = cli_main.main([
+        "--config",
+        str(cfg),
+        "configure",
+        "--rate-limit",
+        "2",
+        "--rate-burst",
+        "4",
+        "--prefetch",
+        "--checkpoint-every",
+        "3",
+        "--metrics-format",
+        "json",
+    ])
+
+    saved = load_config(str(cfg))["default"]
+    assert code == 0 and (
+        saved["rate_limit"],
+        saved["rate_burst"],
+        saved["prefetch"],
+        saved["checkpoint_every"],
+        saved["metrics_format"],
+    ) == (2.0, 4.0, True, 3, "json")
+
+
+def _run_sync_with_profile(monkeypatch, tmp_path: Path, profile: str, extra: list[str]) -> dict:
+    from limitless_tools.cli import main as cli_main
+
+    cfg = tmp_path / "cfg.toml"
+    cfg.write_text("[default]\n" + profile)
+    called: dict = {}
+
+    class FakeService:
+        def __init__(self, *_, **kwargs):
+            called["init"] = kwargs
+
+        def sync(self, **kwargs):
+            called["sync"] = kwargs
+            return []
+
+    monkeypatch.setattr(cli_main, "LifelogService", FakeService)
+    monkeypatch.setattr(cli_main, "load_env", lambda: None)
+    monkeypatch.delenv("LIMITLESS_DATA_DIR", raising=False)
+    cli_main.main(["--config", str(cfg), "sync", "--date", "2025-01-01", "--data-dir", str(tmp_path), *extra])
+    return called
+
+
+def test_profile_values_fill_sync_options_not_given_on_the_command_line(monkeypatch, tmp_path: Path):
+    profile = 'rate_limit = 2\nrate_burst = 4\nheaders_first = true\ncheckpoint_every = 3\n'
+    called = _run_sync_with_profile(monkeypatch, tmp_path, profile, [])
+
+    assert (
+        called["init"]["rate_limit"],
+        called["init"]["rate_burst"],
+        called["sync"]["headers_first"],
+        called["sync"]["checkpoint_every"],
+    ) == (2.0, 4.0, True, 3)
+
+
+def test_command_line_flags_override_profile_values(monkeypatch, tmp_path: Path):
+    profile = "rate_burst = 4\ncheckpoint_every = 3\nmax_retries = true\n"
+    called = _run_sync_with_profile(
+        monkeypatch, tmp_path, profile, ["--rate-burst", "9", "--checkpoint-every", "1"]
+    )
+
+    assert (
+        called["init"]["rate_burst"],
+        called["sync"]["checkpoint_every"],
+        called["init"]["max_retries"],
+    ) == (9.0, 1, 0)
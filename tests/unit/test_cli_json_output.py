@@ -85,3 +85,22 @@ def test_cli_sync_json_outputs_status_and_items(monkeypatch, capsys, tmp_path: P
     doc = json.loads(out)
     assert code == 0 and doc.get("saved_count") == 2 and {x["id"] for x in doc.get("items", [])} == {"c", "d"} and doc.get("lastCursor") == "CUR123"
 
+
+
+def test_cli_fetch_json_keeps_stdlib_layout(monkeypatch, capsys, tmp_path: Path):
+    from limitless_tools.cli import main as cli_main
+
+    f1 = tmp_path / "lifelog_e.json"
+    _write_lifelog(f1, "e", "Café", "2025-03-01T00:00:00Z", "2025-03-01T01:00:00Z")
+
+    class FakeService:
+        def __init__(self, *_, **__):
+            pass
+
+        def fetch(self, **kwargs):
+            return [str(f1)]
+
+    monkeypatch.setattr(cli_main, "LifelogService", FakeService)
+    cli_main.main(["fetch", "--limit", "1", "--data-dir", str(tmp_path), "--json"])
+    out = capsys.readouterr().out
+    assert out == json.dumps(json.loads(out), ensure_ascii=False) + "\n"
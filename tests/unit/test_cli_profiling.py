@@ -0,0 +1,48 @@
+"""
+Global --profile-cpu/--profile-mem flags.
+Single assert per test.
+"""
+
+import io
+import pstats
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+
+def test_profile_cpu_writes_loadable_pstats(monkeypatch, tmp_path: Path):
+    from limitless_tools.cli import main as cli_main
+
+    monkeypatch.setattr(cli_main, "load_env", lambda: None)
+    out = tmp_path / "cpu.prof"
+    cli_main.main(["--profile-cpu", str(out), "list", "--data-dir", str(tmp_path / "lifelogs")])
+    assert pstats.Stats(str(out)).total_calls > 0
+
+
+def test_profile_mem_reports_peak_and_sites(monkeypatch, tmp_path: Path, capsys):
+    from limitless_tools.cli import main as cli_main
+
+    monkeypatch.setattr(cli_main, "load_env", lambda: None)
+    cli_main.main(["--profile-mem", "list", "--data-dir", str(tmp_path / "lifelogs")])
+    err = capsys.readouterr().err
+    assert "Peak traced memory" in err and "allocation sites" in err
+
+
+def test_without_flags_command_runs_unprofiled():
+    from limitless_tools.cli.profiling import run_profiled
+
+    assert run_profiled(lambda: int(tracemalloc.is_tracing())) == 0
+
+
+def test_profile_is_written_when_command_raises(tmp_path: Path):
+    from limitless_tools.cli.profiling import run_profiled
+
+    out = tmp_path / "cpu.prof"
+
+    def boom() -> int:
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        run_profiled(boom, cpu_path=str(out), stream=io.StringIO())
+    assert out.exists()
@@ -0,0 +1,90 @@
+"""
+Per-phase timing, throughput and ETA in sync/fetch progress reporting.
+Single assert per test.
+"""
+
+import json
+import time
+from pathlib import Path
+
+
+def _stub_service(tmp_path: Path, count: int = 40):
+    from limitless_tools.services.lifelog_service import LifelogService
+    from limitless_tools.testing.stub_server import StubApi, StubSession
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    return LifelogService(
+        api_key="K",
+        api_url=None,
+        data_dir=str(tmp_path / "lifelogs"),
+        http_session=StubSession(StubApi(generate_lifelogs(count, seed=2))),
+    )
+
+
+def test_sync_records_items_bytes_and_phase_times(tmp_path: Path):
+    service = _stub_service(tmp_path)
+    service.sync(start="2022-01-01", end="2026-01-01", timezone="UTC", batch_size=10)
+    t = service.last_timings
+    assert t.items == 40 and t.bytes > 0 and t.save > 0 and t.index > 0 and t.network > 0
+
+
+def test_sync_updates_caller_timings_before_each_progress_callback(tmp_path: Path):
+    from limitless_tools.services.lifelog_service import PhaseTimings
+
+    timings = PhaseTimings()
+    seen = []
+    service = _stub_service(tmp_path)
+    service.sync(batch_size=10, timings=timings, progress_callback=lambda page, total: seen.append(timings.items))
+    assert seen == [10, 20, 30, 40]
+
+
+def test_eta_scales_elapsed_time_by_remaining_window():
+    from datetime import UTC, datetime
+
+    from limitless_tools.cli.main import ProgressReporter
+
+    window = (datetime(2025, 1, 1, tzinfo=UTC), datetime(2025, 1, 11, tzinfo=UTC))
+    reporter = ProgressReporter("sync", window=window)
+    reporter._start_ts = time.perf_counter() - 10.0
+    reporter.timings.oldest_start = "2025-01-06T00:00:00Z"
+    assert abs(reporter.eta_seconds() - 10.0) < 0.5
+
+
+def test_window_requires_both_bounds():
+    from limitless_tools.cli.main import _sync_window
+
+    assert _sync_window(None, "2025-01-01", None, "UTC") is None
+
+
+def test_progress_line_reports_throughput_and_eta(capsys):
+    from limitless_tools.cli.main import ProgressReporter, _sync_window
+
+    reporter = ProgressReporter("sync", window=_sync_window("2025-01-02", None, None, "UTC"))
+    reporter.start()
+    reporter.timings.observe_page([{"startTime": "2025-01-02T12:00:00Z"}])
+    reporter.make_callback()(1, 1)
+    line = capsys.readouterr().err.splitlines()[-1]
+    assert "items/s" in line and "MB/s" in line and "ETA" in line
+
+
+def test_sync_json_includes_stats_block(monkeypatch, tmp_path: Path, capsys):
+    from limitless_tools.cli import main as cli_main
+    from limitless_tools.services.lifelog_service import SaveReport
+
+    class FakeService:
+        def __init__(self, *_, **__):
+            self.last_report = SaveReport(created=2)
+
+        def sync(self, **kwargs):
+            timings = kwargs["timings"]
+            timings.observe_page([{"startTime": "2025-01-01T10:00:00Z"}, {"startTime": "2025-01-01T09:00:00Z"}])
+            timings.network, timings.save, timings.index = 0.5, 0.25, 0.125
+            return []
+
+    monkeypatch.setattr(cli_main, "LifelogService", FakeService)
+    monkeypatch.setattr(cli_main, "load_env", lambda: None)
+    monkeypatch.delenv("LIMITLESS_DATA_DIR", raising=False)
+
+    cli_main.main(["sync", "--json", "--data-dir", str(tmp_path / "lifelogs")])
+    stats = json.loads(capsys.readouterr().out)["stats"]
+    assert (stats["items"], stats["network_seconds"], stats["save_seconds"], stats["index_seconds"]) == (2, 0.5, 0.25, 0.125)
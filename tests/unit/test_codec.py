@@ -0,0 +1,62 @@
+"""
+Tests for the internal JSON codec layer.
+Single assert per test.
+"""
+
+import json
+
+import pytest
+
+SAMPLE = {
+    "id": "abc",
+    "title": "Café ☕   notes\t\"quoted\"",
+    "markdown": "# Heading\n\n- line\r\n\u0001",
+    "contents": [{"type": "heading1", "children": [], "startOffsetMs": 12, "speakerName": None}],
+    "isStarred": False,
+    "empty": {},
+    "emptyList": [],
+    "big": 2**40,
+}
+
+
+def _available_backends():
+    from limitless_tools import codec
+
+    names = ["json"]
+    if codec._orjson is not None:
+        names.append("orjson")
+    if codec._msgspec is not None:
+        names.append("msgspec")
+    return names
+
+
+@pytest.mark.parametrize("backend", _available_backends())
+def test_indented_output_matches_stdlib(monkeypatch, backend):
+    from limitless_tools import codec
+
+    monkeypatch.setattr(codec, "BACKEND", backend)
+    assert codec.dumps_bytes(SAMPLE, indent=True) == json.dumps(SAMPLE, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@pytest.mark.parametrize("backend", _available_backends())
+def test_compact_output_matches_stdlib(monkeypatch, backend):
+    from limitless_tools import codec
+
+    monkeypatch.setattr(codec, "BACKEND", backend)
+    expected = json.dumps(SAMPLE, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    assert codec.dumps(SAMPLE, sort_keys=True) == expected
+
+
+@pytest.mark.parametrize("backend", _available_backends())
+def test_invalid_input_raises_json_decode_error(monkeypatch, backend):
+    from limitless_tools import codec
+
+    monkeypatch.setattr(codec, "BACKEND", backend)
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{broken")
+
+
+def test_non_string_keys_fall_back_to_stdlib():
+    from limitless_tools import codec
+
+    assert codec.dumps({1: "a"}) == '{"1":"a"}'
@@ -0,0 +1,58 @@
+"""
+Adaptive page sizing for get_lifelogs.
+Single assert per test.
+"""
+
+
+class FakeResponse:
+    def __init__(self, payload, ok=True, status_code=200, content=b""):
+        self._payload = payload
+        self.ok = ok
+        self.status_code = status_code
+        self.headers = {}
+        self.content = content
+
+    def json(self):
+        return self._payload
+
+
+def test_fast_small_pages_grow():
+    from limitless_tools.http.paging import AdaptivePageSize
+
+    sizer = AdaptivePageSize(10)
+    assert [sizer.observe(0.1), sizer.observe(0.1)] == [15, 22]
+
+
+def test_slow_pages_shrink_in_proportion():
+    from limitless_tools.http.paging import AdaptivePageSize
+
+    sizer = AdaptivePageSize(40, target_seconds=2.0)
+    assert sizer.observe(8.0) == 10
+
+
+def test_large_payload_shrinks_and_bounds_hold():
+    from limitless_tools.http.paging import AdaptivePageSize
+
+    sizer = AdaptivePageSize(500, max_bytes=1000)
+    assert (sizer.size, sizer.observe(0.1, nbytes=100_000)) == (100, 1)
+
+
+def test_client_adapts_limit_and_halves_on_retry():
+    from limitless_tools.http.client import LimitlessClient
+
+    class Session:
+        def __init__(self):
+            self.limits = []
+
+        def get(self, url, headers, params):
+            self.limits.append(params["limit"])
+            n = len(self.limits)
+            if n == 2:
+                return FakeResponse({}, ok=False, status_code=503)
+            cursor = f"c{n}" if n < 4 else None
+            return FakeResponse({"data": {"lifelogs": [{"id": str(n)}]}, "meta": {"lifelogs": {"nextCursor": cursor}}})
+
+    session = Session()
+    client = LimitlessClient(api_key="K", session=session, max_retries=1, sleep_fn=lambda s: None)
+    client.get_lifelogs(batch_size=20, adaptive_batch=True)
+    assert session.limits == [20, 30, 15, 22]
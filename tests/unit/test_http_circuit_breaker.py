@@ -0,0 +1,130 @@
+"""
+Circuit breaker in the HTTP client.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, payload, ok=True, status_code=200):
+        self._payload = payload
+        self.ok = ok
+        self.status_code = status_code
+        self.headers = {}
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+
+class ScriptedSession:
+    """Returns 503 while `down` is True, otherwise an empty last page."""
+
+    def __init__(self):
+        self.down = True
+        self.calls = 0
+
+    def get(self, url, headers, params):
+        self.calls += 1
+        if self.down:
+            return FakeResponse({}, ok=False, status_code=503)
+        return FakeResponse({"data": {"lifelogs": []}, "meta": {"lifelogs": {"nextCursor": None}}})
+
+
+def _client(session, breaker):
+    from limitless_tools.http.client import LimitlessClient
+
+    return LimitlessClient(api_key="K", session=session, max_retries=10, sleep_fn=lambda s: None, circuit_breaker=breaker)
+
+
+def _opened(tmp_path: Path | None = None):
+    from limitless_tools.errors import CircuitOpenError
+    from limitless_tools.http.breaker import CircuitBreaker
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(3, 30.0, clock=clock, state_path=tmp_path / "breaker.json" if tmp_path else None)
+    session = ScriptedSession()
+    with pytest.raises(CircuitOpenError):
+        _client(session, breaker).get_lifelogs(limit=1)
+    return breaker, session, clock
+
+
+def test_opens_after_threshold_and_stops_retrying():
+    _, session, _ = _opened()
+    assert session.calls == 3
+
+
+def test_fails_fast_while_open():
+    from limitless_tools.errors import CircuitOpenError
+
+    breaker, session, _ = _opened()
+    with pytest.raises(CircuitOpenError):
+        _client(session, breaker).get_lifelogs(limit=1)
+    assert session.calls == 3
+
+
+def test_half_open_probe_success_closes():
+    breaker, session, clock = _opened()
+    clock.now += 31
+    session.down = False
+    _client(session, breaker).get_lifelogs(limit=1)
+    assert breaker.state == "closed"
+
+
+def test_half_open_probe_failure_reopens():
+    from limitless_tools.errors import CircuitOpenError
+
+    breaker, session, clock = _opened()
+    clock.now += 31
+    with pytest.raises(CircuitOpenError):
+        _client(session, breaker).get_lifelogs(limit=1)
+    assert (breaker.state, session.calls) == ("open", 4)
+
+
+def test_open_state_is_persisted_for_later_runs(tmp_path: Path):
+    from limitless_tools.http.breaker import CircuitBreaker
+
+    _, _, clock = _opened(tmp_path)
+    later = CircuitBreaker(3, 30.0, clock=clock, state_path=tmp_path / "breaker.json")
+    assert later.state == "open"
+
+
+def test_aborted_sync_checkpoints_saved_pages(tmp_path: Path):
+    import json
+
+    from limitless_tools.errors import ServiceError
+    from limitless_tools.http.breaker import CircuitBreaker
+    from limitless_tools.http.client import LimitlessClient
+    from limitless_tools.services.lifelog_service import LifelogService
+
+    class OnePageThenDown:
+        def __init__(self):
+            self.calls = 0
+
+        def get(self, url, headers, params):
+            self.calls += 1
+            if self.calls == 1:
+                item = {"id": "a", "startTime": "2025-01-01T00:00:00Z", "endTime": "2025-01-01T01:00:00Z"}
+                return FakeResponse({"data": {"lifelogs": [item]}, "meta": {"lifelogs": {"nextCursor": "c1"}}})
+            return FakeResponse({}, ok=False, status_code=503)
+
+    data_dir = tmp_path / "lifelogs"
+    client = LimitlessClient(
+        api_key="K", session=OnePageThenDown(), max_retries=5, sleep_fn=lambda s: None, circuit_breaker=CircuitBreaker(2)
+    )
+    service = LifelogService(api_key="K", api_url=None, data_dir=str(data_dir), client=client)
+    with pytest.raises(ServiceError):
+        service.sync(start="2025-01-01", checkpoint_every=10)
+    state = json.loads((tmp_path / "state" / "lifelogs_sync.json").read_text())
+    assert [s["checkpoint"]["cursor"] for s in state["signatures"].values()] == ["c1"]
@@ -0,0 +1,83 @@
+"""
+Background prefetch of the next page in get_lifelogs.
+Single assert per test.
+"""
+
+import threading
+
+import pytest
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+        self.ok = True
+        self.status_code = 200
+        self.headers = {}
+
+    def json(self):
+        return self._payload
+
+
+class PagedSession:
+    def __init__(self, pages=3):
+        self.pages = pages
+        self.cursors = []
+        self.requested = {}
+
+    def get(self, url, headers, params):
+        cursor = params.get("cursor")
+        self.cursors.append(cursor)
+        n = 1 if cursor is None else int(cursor[1:]) + 1
+        self.requested.setdefault(n, threading.Event()).set()
+        nxt = f"c{n}" if n < self.pages else None
+        return FakeResponse({"data": {"lifelogs": [{"id": str(n)}]}, "meta": {"lifelogs": {"nextCursor": nxt}}})
+
+
+def _client(session):
+    from limitless_tools.http.client import LimitlessClient
+
+    return LimitlessClient(api_key="K", session=session)
+
+
+def test_prefetch_returns_same_items_in_order():
+    items = _client(PagedSession()).get_lifelogs(prefetch=True)
+    assert [x["id"] for x in items] == ["1", "2", "3"]
+
+
+def test_next_page_is_requested_while_callback_runs():
+    session = PagedSession()
+    seen = []
+
+    def on_page(items, next_cursor):
+        if next_cursor == "c1":
+            seen.append(session.requested.setdefault(2, threading.Event()).wait(timeout=5))
+
+    _client(session).get_lifelogs(prefetch=True, page_callback=on_page)
+    assert seen == [True]
+
+
+def test_no_prefetch_past_limit():
+    session = PagedSession(pages=5)
+    _client(session).get_lifelogs(limit=2, batch_size=1, prefetch=True)
+    assert session.cursors == [None, "c1"]
+
+
+def test_callback_error_propagates_with_prefetch():
+    def boom(items, next_cursor):
+        raise RuntimeError("stop")
+
+    with pytest.raises(RuntimeError):
+        _client(PagedSession()).get_lifelogs(prefetch=True, page_callback=boom)
+
+
+def test_request_counter_covers_worker_and_callback_requests():
+    session = PagedSession(pages=50)
+    client = _client(session)
+
+    def on_page(items, next_cursor):
+        # Requests from the callback overlap with the prefetch worker's requests
+        client.get_lifelogs_page(limit=1, cursor=client.last_page_cursor)
+
+    client.get_lifelogs(prefetch=True, page_callback=on_page)
+    assert client.requests_sent == len(session.cursors) == 100
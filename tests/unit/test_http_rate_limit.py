@@ -0,0 +1,85 @@
+"""
+Token-bucket rate limiting in the HTTP client.
+Single assert per test.
+"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, payload, ok=True, status_code=200, headers=None):
+        self._payload = payload
+        self.ok = ok
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+def _bucket(rate=2.0, burst=2):
+    from limitless_tools.http.rate_limit import TokenBucket
+
+    clock = FakeClock()
+    return TokenBucket(rate, burst, clock=clock, sleep=clock.sleep), clock
+
+
+def test_burst_then_steady_rate():
+    bucket, clock = _bucket()
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_idle_time_refills_up_to_burst():
+    bucket, clock = _bucket()
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 10
+    waits = [bucket.reserve() for _ in range(3)]
+    assert waits == [0.0, 0.0, 0.5]
+
+
+def test_defer_pauses_and_drops_burst():
+    bucket, clock = _bucket()
+    bucket.defer(3.0)
+    assert [bucket.reserve(), bucket.reserve()] == [3.0, 3.5]
+
+
+def test_shared_returns_same_bucket_for_same_settings():
+    from limitless_tools.http.rate_limit import TokenBucket
+
+    assert TokenBucket.shared(7.0, 3) is TokenBucket.shared(7.0, 3)
+
+
+def test_client_acquires_before_each_request_and_defers_on_retry_after():
+    from limitless_tools.http.client import LimitlessClient
+
+    class Session:
+        def __init__(self):
+            self.calls = 0
+
+        def get(self, url, headers, params):
+            self.calls += 1
+            if self.calls == 1:
+                return FakeResponse({}, ok=False, status_code=429, headers={"Retry-After": "2"})
+            return FakeResponse({"data": {"lifelogs": []}, "meta": {"lifelogs": {"nextCursor": None}}})
+
+    bucket, clock = _bucket(rate=1.0, burst=5)
+    client = LimitlessClient(
+        api_key="K", session=Session(), max_retries=1, sleep_fn=clock.sleep, rate_limiter=bucket
+    )
+    client.get_lifelogs(limit=1)
+    # The retry goes out right when the 2s Retry-After pause ends, without extra waiting
+    assert clock.sleeps == [2.0]
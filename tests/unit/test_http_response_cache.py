@@ -0,0 +1,170 @@
+"""
+On-disk API response cache with ETag revalidation and TTL.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self._payload = payload
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+PAGE = {"data": {"lifelogs": [{"id": "a"}]}, "meta": {"lifelogs": {"nextCursor": None}}}
+
+
+class EtagSession:
+    """Serves PAGE with an ETag and answers 304 when If-None-Match matches."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers, params):
+        self.requests.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(None, status_code=304, headers={"ETag": '"v1"'})
+        return FakeResponse(PAGE, headers={"ETag": '"v1"'})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client(session, cache, api_key="K"):
+    from limitless_tools.http.client import LimitlessClient
+
+    return LimitlessClient(api_key=api_key, session=session, response_cache=cache)
+
+
+def test_revalidates_with_etag_and_reuses_body_on_304(tmp_path: Path):
+    from limitless_tools.http.response_cache import ResponseCache
+
+    session, cache = EtagSession(), ResponseCache(tmp_path)
+    _client(session, cache).get_lifelogs(limit=1)
+    items = _client(session, cache).get_lifelogs(limit=1)
+    assert (session.requests[1].get("If-None-Match"), items, cache.stats()["revalidated"]) == ('"v1"', [{"id": "a"}], 1)
+
+
+def test_fresh_entries_skip_the_network(tmp_path: Path):
+    from limitless_tools.http.response_cache import ResponseCache
+
+    clock = FakeClock()
+    session, cache = EtagSession(), ResponseCache(tmp_path, ttl=60, clock=clock)
+    _client(session, cache).get_lifelogs(limit=1)
+    clock.now += 30
+    _client(session, cache).get_lifelogs(limit=1)
+    assert len(session.requests) == 1
+
+
+def test_stale_entries_are_requested_again(tmp_path: Path):
+    from limitless_tools.http.response_cache import ResponseCache
+
+    clock = FakeClock()
+    session, cache = EtagSession(), ResponseCache(tmp_path, ttl=60, clock=clock)
+    _client(session, cache).get_lifelogs(limit=1)
+    clock.now += 61
+    _client(session, cache).get_lifelogs(limit=1)
+    assert len(session.requests) == 2
+
+
+def test_entries_are_not_shared_between_accounts_or_store_the_key(tmp_path: Path):
+    from limitless_tools.http.response_cache import ResponseCache
+
+    session, cache = EtagSession(), ResponseCache(tmp_path, ttl=60)
+    _client(session, cache, api_key="SECRET-1").get_lifelogs(limit=1)
+    _client(session, cache, api_key="SECRET-2").get_lifelogs(limit=1)
+    stored = b"".join(p.read_bytes() for p in tmp_path.rglob("*.json"))
+    assert (len(session.requests), b"SECRET" in stored) == (2, False)
+
+
+class PlainSession:
+    """Serves PAGE without validators."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers, params):
+        self.requests.append(dict(headers))
+        return FakeResponse(PAGE)
+
+
+def test_responses_without_validators_or_ttl_are_not_stored(tmp_path: Path):
+    from limitless_tools.http.response_cache import ResponseCache
+
+    _client(PlainSession(), ResponseCache(tmp_path)).get_lifelogs(limit=1)
+    assert list(tmp_path.rglob("*.json")) == []
+
+
+def test_responses_without_validators_are_stored_with_ttl(tmp_path: Path):
+    from limitless_tools.http.response_cache import ResponseCache
+
+    session, cache = PlainSession(), ResponseCache(tmp_path, ttl=60)
+    _client(session, cache).get_lifelogs(limit=1)
+    _client(session, cache).get_lifelogs(limit=1)
+    assert len(session.requests) == 1
+
+
+def test_cache_hit_reports_stored_size_as_last_response_bytes(tmp_path: Path):
+    from limitless_tools.http.response_cache import ResponseCache
+
+    session, cache = EtagSession(), ResponseCache(tmp_path, ttl=60)
+    _client(session, cache).get_lifelogs(limit=1)
+    client = _client(session, cache)
+    client.get_lifelogs(limit=1)
+    size = next(tmp_path.rglob("*.json")).stat().st_size
+    assert client.last_response_bytes == size
+
+
+def _fill(cache, count):
+    for i in range(count):
+        cache.put("K", "https://api.example/v1/lifelogs", {"cursor": str(i)}, {"n": i}, etag=f'"{i}"')
+
+
+def test_prune_removes_entries_older_than_max_age(tmp_path: Path):
+    import os
+    import time
+
+    from limitless_tools.http.response_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path, max_age=3600)
+    _fill(cache, 3)
+    old = time.time() - 7200
+    for path in list(tmp_path.rglob("*.json"))[:2]:
+        os.utime(path, (old, old))
+    assert cache.prune() == 2
+
+
+def test_prune_keeps_cache_within_max_bytes(tmp_path: Path):
+    from limitless_tools.http.response_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path)
+    _fill(cache, 10)
+    entry_size = next(tmp_path.rglob("*.json")).stat().st_size
+    cache.max_bytes = entry_size * 4
+    cache.prune()
+    assert len(list(tmp_path.rglob("*.json"))) <= 4
+
+
+def test_first_write_of_a_run_prunes_expired_entries(tmp_path: Path):
+    import os
+    import time
+
+    from limitless_tools.http.response_cache import ResponseCache
+
+    _fill(ResponseCache(tmp_path), 3)
+    old = time.time() - 7200
+    for path in tmp_path.rglob("*.json"):
+        os.utime(path, (old, old))
+    _fill(ResponseCache(tmp_path, max_age=3600), 1)
+    assert len(list(tmp_path.rglob("*.json"))) == 1
@@ -0,0 +1,75 @@
+"""
+Jittered backoff and the run-wide retry budget.
+Single assert per test.
+"""
+
+import pytest
+
+
+class FakeResponse:
+    def __init__(self, payload, ok=True, status_code=200):
+        self._payload = payload
+        self.ok = ok
+        self.status_code = status_code
+        self.headers = {}
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+
+class AlwaysUnavailable:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, headers, params):
+        self.calls += 1
+        return FakeResponse({}, ok=False, status_code=503)
+
+
+def test_full_jitter_is_bounded_by_exponential_cap():
+    from limitless_tools.http.retry import full_jitter
+
+    assert [full_jitter(a, 0.5, cap=3.0, rand=lambda: 1.0) for a in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_client_sleeps_jittered_delays():
+    from limitless_tools.errors import ApiError
+    from limitless_tools.http.client import LimitlessClient
+
+    sleeps = []
+    c = LimitlessClient(api_key="K", session=AlwaysUnavailable(), max_retries=3, sleep_fn=sleeps.append)
+    with pytest.raises(ApiError):
+        c.get_lifelogs(limit=1)
+    assert len(sleeps) == 3 and all(0 <= s <= 0.5 * 2**i for i, s in enumerate(sleeps))
+
+
+def test_budget_count_limits_retries_across_requests():
+    from limitless_tools.errors import ApiError
+    from limitless_tools.http.client import LimitlessClient
+    from limitless_tools.http.retry import RetryBudget
+
+    session = AlwaysUnavailable()
+    c = LimitlessClient(
+        api_key="K", session=session, max_retries=5, sleep_fn=lambda s: None, retry_budget=RetryBudget(max_retries=3)
+    )
+    for _ in range(2):
+        with pytest.raises(ApiError):
+            c.get_lifelogs(limit=1)
+    # first request: 1 try + 3 retries; second request: budget spent, no retries
+    assert session.calls == 5
+
+
+def test_budget_seconds_limits_total_wait():
+    from limitless_tools.http.retry import RetryBudget
+
+    budget = RetryBudget(max_seconds=1.0)
+    assert [budget.try_spend(0.4), budget.try_spend(0.4), budget.try_spend(0.4)] == [True, True, False]
+
+
+def test_service_passes_max_retries_and_budget_to_client(tmp_path):
+    from limitless_tools.services.lifelog_service import LifelogService
+
+    service = LifelogService(api_key="K", api_url=None, data_dir=str(tmp_path), max_retries=4, retry_budget_seconds=60)
+    client = service._make_client()
+    assert (client.max_retries, client.retry_budget.max_seconds) == (4, 60)
@@ -0,0 +1,58 @@
+"""
+Shared pooled session and Accept-Encoding negotiation.
+Single assert per test.
+"""
+
+import importlib.util
+
+import pytest
+
+requires_requests = pytest.mark.skipif(importlib.util.find_spec("requests") is None, reason="requests not installed")
+
+
+class RecordingSession:
+    def __init__(self):
+        self.last_headers = None
+
+    def get(self, url, headers, params):
+        self.last_headers = headers
+        return FakeResponse()
+
+
+class FakeResponse:
+    ok = True
+    status_code = 200
+    headers: dict = {}
+
+    def json(self):
+        return {"data": {"lifelogs": []}, "meta": {"lifelogs": {"nextCursor": None}}}
+
+
+def test_requests_advertise_compression():
+    from limitless_tools.http.client import LimitlessClient
+
+    session = RecordingSession()
+    LimitlessClient(api_key="K", session=session).get_lifelogs(limit=1)
+    assert session.last_headers["Accept-Encoding"].startswith("gzip, deflate")
+
+
+@requires_requests
+def test_shared_session_is_reused_for_same_pool_size():
+    from limitless_tools.http.session import shared_session
+
+    assert shared_session(pool_size=3) is shared_session(pool_size=3)
+
+
+@requires_requests
+def test_adapter_pool_is_sized():
+    from limitless_tools.http.session import build_session
+
+    adapter = build_session(pool_size=7).get_adapter("https://api.limitless.ai")
+    assert adapter._pool_maxsize == 7
+
+
+@requires_requests
+def test_clients_without_session_share_one():
+    from limitless_tools.http.client import LimitlessClient
+
+    assert LimitlessClient(api_key="A").session is LimitlessClient(api_key="B").session
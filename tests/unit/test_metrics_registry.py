@@ -0,0 +1,63 @@
+"""
+Metrics registry: counters, gauges and Prometheus/JSON export.
+Single assert per test.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def test_counter_accumulates_per_label_set():
+    from limitless_tools.metrics import MetricsRegistry
+
+    m = MetricsRegistry()
+    m.inc("jobs_total", status="ok")
+    m.inc("jobs_total", 2, status="ok")
+    m.inc("jobs_total", status="failed")
+    assert (m.get("jobs_total", status="ok"), m.get("jobs_total", status="failed")) == (3.0, 1.0)
+
+
+def test_counter_cannot_decrease():
+    from limitless_tools.metrics import MetricsRegistry
+
+    with pytest.raises(ValueError):
+        MetricsRegistry().inc("jobs_total", -1)
+
+
+def test_name_cannot_change_kind():
+    from limitless_tools.metrics import MetricsRegistry
+
+    m = MetricsRegistry()
+    m.set("queue_depth", 4)
+    with pytest.raises(ValueError):
+        m.inc("queue_depth")
+
+
+def test_prometheus_text_has_help_type_and_escaped_labels():
+    from limitless_tools.metrics import MetricsRegistry
+
+    m = MetricsRegistry()
+    m.set("run_seconds", 1.5, help="Run time", phase='save "x"')
+    assert m.to_prometheus() == (
+        "# HELP run_seconds Run time\n# TYPE run_seconds gauge\nrun_seconds{phase=\"save \\\"x\\\"\"} 1.5\n"
+    )
+
+
+def test_write_picks_json_from_suffix(tmp_path: Path):
+    from limitless_tools.metrics import MetricsRegistry
+
+    m = MetricsRegistry(clock=lambda: 100.0)
+    m.set("items", 3, operation="sync")
+    data = json.loads(m.write(tmp_path / "run.json").read_text())
+    assert data["metrics"]["items"]["samples"] == [{"labels": {"operation": "sync"}, "value": 3.0}]
+
+
+def test_write_leaves_no_temp_files(tmp_path: Path):
+    from limitless_tools.metrics import MetricsRegistry
+
+    m = MetricsRegistry()
+    m.set("items", 3)
+    m.write(tmp_path / "limitless.prom")
+    assert [p.name for p in tmp_path.iterdir()] == ["limitless.prom"]
@@ -0,0 +1,79 @@
+"""
+Tests for the flattened, array-backed contents representation.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+import pytest
+
+CONTENTS = [
+    {
+        "type": "heading1",
+        "content": "Standup",
+        "children": [
+            {"type": "blockquote", "content": "Hi all", "speakerName": "Ann", "startOffsetMs": 0, "endOffsetMs": 1000, "children": []},
+            {"type": "blockquote", "content": "Hello", "speakerName": "Bob", "startOffsetMs": 1000, "endOffsetMs": 4000, "children": []},
+            {"type": "blockquote", "content": "Bye", "speakerName": "Ann", "startOffsetMs": 4000, "endOffsetMs": 4500, "children": []},
+        ],
+    }
+]
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def flat(request, monkeypatch):
+    from limitless_tools.models import flat_contents
+
+    if request.param == "pure":
+        monkeypatch.setattr(flat_contents, "_numpy", lambda: None)
+    elif flat_contents._numpy() is None:
+        pytest.skip("numpy not installed")
+    return flat_contents.FlatContents.from_contents(CONTENTS)
+
+
+def test_preorder_columns_and_shared_text(flat):
+    assert [flat.text_of(i) for i in range(len(flat))] == ["Standup", "Hi all", "Hello", "Bye"] and list(flat.parent) == [-1, 0, 0, 0]
+
+
+def test_talk_time_by_speaker(flat):
+    assert flat.talk_time_by_speaker() == {"Ann": 1500, "Bob": 3000}
+
+
+def test_time_window_slicing(flat):
+    assert flat.indices_in_window(900, 2000) == [1, 2]
+
+
+def test_roundtrip_through_persisted_form(tmp_path: Path):
+    from limitless_tools.models.flat_contents import FlatContents
+
+    p = tmp_path / "flat.json"
+    FlatContents.from_contents(CONTENTS).dump(p)
+    rebuilt = FlatContents.load(p).to_contents()
+    assert [c["content"] for c in rebuilt[0]["children"]] == ["Hi all", "Hello", "Bye"]
+
+
+def test_deep_tree_does_not_recurse():
+    from limitless_tools.models.flat_contents import FlatContents
+
+    node: dict = {"type": "leaf", "content": "x", "children": []}
+    for _ in range(5000):
+        node = {"type": "wrap", "children": [node]}
+    assert len(FlatContents.from_contents([node])) == 5001
+
+
+def test_speaker_identifier_is_not_used_as_a_speaker_name():
+    from limitless_tools.models.flat_contents import FlatContents
+
+    flat = FlatContents.from_contents([
+        {"type": "blockquote", "content": "Hi", "speakerIdentifier": "user", "startOffsetMs": 0, "endOffsetMs": 500},
+        {"type": "blockquote", "content": "Yo", "speakerName": "You", "speakerIdentifier": "user", "startOffsetMs": 500, "endOffsetMs": 700},
+    ])
+    assert (flat.speaker_of(0), flat.identifier_of(0), flat.talk_time_by_speaker()) == (None, "user", {"You": 200})
+
+
+def test_speaker_identifier_survives_the_persisted_form(tmp_path: Path):
+    from limitless_tools.models.flat_contents import FlatContents
+
+    p = tmp_path / "flat.json"
+    FlatContents.from_contents([{"type": "blockquote", "content": "Yo", "speakerName": "You", "speakerIdentifier": "user"}]).dump(p)
+    assert FlatContents.load(p).to_contents()[0]["speakerIdentifier"] == "user"
@@ -0,0 +1,56 @@
+"""
+Tests for the slotted LifelogRecord with lazily loaded bodies.
+Single assert per test.
+"""
+
+import json
+from pathlib import Path
+
+
+def test_record_from_summary_loads_body_only_on_access():
+    from limitless_tools.models.record import LifelogRecord
+
+    calls: list[int] = []
+
+    def loader():
+        calls.append(1)
+        return {"id": "a", "markdown": "body"}
+
+    rec = LifelogRecord.from_summary({"id": "a", "title": "T", "path": "/x"}, loader=loader)
+    before = len(calls)
+    md = rec.markdown
+    _ = rec.markdown
+    assert (before, md, len(calls)) == (0, "body", 1)
+
+
+def test_record_is_slotted():
+    from limitless_tools.models.record import LifelogRecord
+
+    assert not hasattr(LifelogRecord(id="a"), "__dict__")
+
+
+def test_summary_shape_from_full_lifelog():
+    from limitless_tools.models.record import LifelogRecord
+
+    rec = LifelogRecord.from_dict({"id": "a", "title": "T", "markdown": "m", "startTime": "2025-01-01T00:00:00Z"}, path="/p")
+    assert rec.summary() == {
+        "id": "a",
+        "title": "T",
+        "startTime": "2025-01-01T00:00:00Z",
+        "endTime": None,
+        "isStarred": None,
+        "updatedAt": None,
+        "path": "/p",
+    }
+
+
+def test_list_local_with_index_does_not_open_lifelog_files(tmp_path: Path, monkeypatch):
+    from limitless_tools.services import lifelog_service
+    from limitless_tools.services.lifelog_service import LifelogService
+
+    rows = [{"id": "a", "title": "A", "startTime": "2025-01-01T00:00:00Z", "path": str(tmp_path / "missing.json")}]
+    (tmp_path / "index.json").write_text(json.dumps(rows))
+    opened: list[str] = []
+    monkeypatch.setattr(lifelog_service, "load_lifelog", lambda p, **_: opened.append(p))
+    items = LifelogService(api_key=None, api_url=None, data_dir=str(tmp_path)).list_local()
+    assert [it["id"] for it in items] == ["a"] and opened == []
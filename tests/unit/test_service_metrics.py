@@ -0,0 +1,120 @@
+"""
+Sync/fetch metrics collected by LifelogService and exported by the CLI.
+Single assert per test.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def _service(tmp_path: Path, **api_kwargs):
+    from limitless_tools.metrics import MetricsRegistry
+    from limitless_tools.services.lifelog_service import LifelogService
+    from limitless_tools.testing.stub_server import StubApi, StubSession
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    api = StubApi(generate_lifelogs(25, seed=4), **api_kwargs)
+    return LifelogService(
+        api_key="K",
+        api_url=None,
+        data_dir=str(tmp_path / "lifelogs"),
+        http_session=StubSession(api),
+        metrics=MetricsRegistry(),
+        max_retries=3,
+    )
+
+
+def test_sync_records_requests_retries_and_items(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    service = _service(tmp_path, throttle_every=2, retry_after=0)
+    service.sync(batch_size=10, timezone="UTC")
+    m = service.metrics
+    got = (
+        m.get("limitless_run_requests", operation="sync"),
+        m.get("limitless_run_retries", operation="sync"),
+        m.get("limitless_run_items", operation="sync", status="created"),
+        m.get("limitless_run_success", operation="sync"),
+    )
+    assert got == (5.0, 2.0, 25.0, 1.0)
+
+
+def test_sync_records_index_size(tmp_path: Path):
+    service = _service(tmp_path)
+    service.sync(batch_size=10, timezone="UTC")
+    size = (tmp_path / "lifelogs" / "index.json").stat().st_size
+    m = service.metrics
+    assert (m.get("limitless_index_entries"), m.get("limitless_index_bytes")) == (25.0, float(size))
+
+
+def test_failed_sync_is_recorded(tmp_path: Path):
+    from limitless_tools.errors import ServiceError
+
+    service = _service(tmp_path, api_key="other")
+    with pytest.raises(ServiceError):
+        service.sync(batch_size=10, timezone="UTC")
+    assert service.metrics.get("limitless_run_success", operation="sync") == 0.0
+
+
+class UnavailableSession:
+    """Answers every request with 503, so each run exhausts its retries."""
+
+    def get(self, url, headers=None, params=None, **_):
+        from limitless_tools.testing.cassette import CassetteResponse
+
+        return CassetteResponse(503, {"error": "unavailable"}, {})
+
+
+def _failing_service(tmp_path: Path):
+    from limitless_tools.metrics import MetricsRegistry
+    from limitless_tools.services.lifelog_service import LifelogService
+
+    return LifelogService(
+        api_key="K",
+        api_url=None,
+        data_dir=str(tmp_path / "lifelogs"),
+        http_session=UnavailableSession(),
+        metrics=MetricsRegistry(),
+        max_retries=3,
+    )
+
+
+@pytest.mark.parametrize("operation", ["sync", "fetch"])
+def test_failed_run_records_requests_and_retries(tmp_path: Path, monkeypatch, operation):
+    from limitless_tools.errors import ServiceError
+
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    service = _failing_service(tmp_path)
+    with pytest.raises(ServiceError):
+        getattr(service, operation)(batch_size=10, timezone="UTC")
+    m = service.metrics
+    got = (m.get("limitless_run_requests", operation=operation), m.get("limitless_run_retries", operation=operation))
+    assert got == (4.0, 3.0)
+
+
+def test_fetch_records_phase_seconds(tmp_path: Path):
+    service = _service(tmp_path)
+    service.fetch(limit=10, batch_size=10)
+    assert service.metrics.get("limitless_run_phase_seconds", operation="fetch", phase="save") > 0
+
+
+def test_cli_writes_metrics_file(monkeypatch, tmp_path: Path):
+    from limitless_tools.cli import main as cli_main
+    from limitless_tools.services.lifelog_service import SaveReport
+
+    class FakeService:
+        def __init__(self, *_, **kwargs):
+            self.metrics = kwargs["metrics"]
+            self.last_report = SaveReport()
+
+        def sync(self, **kwargs):
+            self.metrics.set("limitless_run_requests", 7, operation="sync")
+            return []
+
+    monkeypatch.setattr(cli_main, "LifelogService", FakeService)
+    monkeypatch.setattr(cli_main, "load_env", lambda: None)
+    out = tmp_path / "metrics.json"
+    cli_main.main(["sync", "--data-dir", str(tmp_path / "lifelogs"), "--metrics-file", str(out)])
+    samples = json.loads(out.read_text())["metrics"]["limitless_run_requests"]["samples"]
+    assert samples == [{"labels": {"operation": "sync"}, "value": 7.0}]
@@ -0,0 +1,66 @@
+"""
+Tests for content-addressed deduplication of markdown/contents.
+Single assert per test.
+"""
+
+import json
+from pathlib import Path
+
+
+def _lifelog(id_: str, title: str = "t", markdown: str = "shared body") -> dict:
+    return {
+        "id": id_,
+        "title": title,
+        "markdown": markdown,
+        "contents": [{"type": "blockquote", "content": markdown, "children": []}],
+        "startTime": "2025-07-01T00:00:00Z",
+        "endTime": "2025-07-01T01:00:00Z",
+        "isStarred": False,
+        "updatedAt": "2025-07-01T02:00:00Z",
+    }
+
+
+def test_identical_bodies_are_stored_once(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), dedupe=True)
+    repo.save_many([_lifelog("a"), _lifelog("b"), _lifelog("c")])
+    blobs = list((tmp_path / "blobs").rglob("*.json"))
+    assert len(blobs) == 2
+
+
+def test_lifelog_file_references_blobs(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    result = JsonFileRepository(base_dir=str(tmp_path), dedupe=True).save_lifelog(_lifelog("a"))
+    raw = json.loads(Path(result.path).read_text())
+    assert str(raw["markdown"]["$blob"]).startswith("sha256:")
+
+
+def test_load_resolves_blob_references(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository, load_lifelog
+
+    result = JsonFileRepository(base_dir=str(tmp_path), dedupe=True).save_lifelog(_lifelog("a"))
+    assert load_lifelog(result.path) == _lifelog("a")
+
+
+def test_title_change_reuses_existing_blobs(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), dedupe=True)
+    repo.save_lifelog(_lifelog("a"))
+    before = sorted(p.name for p in (tmp_path / "blobs").rglob("*.json"))
+    status = repo.save_lifelog(_lifelog("a", title="renamed")).status
+    after = sorted(p.name for p in (tmp_path / "blobs").rglob("*.json"))
+    assert status == "updated" and before == after
+
+
+def test_service_search_reads_deduplicated_markdown(tmp_path: Path):
+    from limitless_tools.services.lifelog_service import LifelogService
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    JsonFileRepository(base_dir=str(tmp_path), layout="packed", dedupe=True).save_lifelog(
+        _lifelog("a", markdown="needle in here")
+    )
+    svc = LifelogService(api_key=None, api_url=None, data_dir=str(tmp_path))
+    assert [it["id"] for it in svc.search_local(query="needle")] == ["a"]
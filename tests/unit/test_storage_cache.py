@@ -0,0 +1,71 @@
+"""
+Tests for the opt-in LRU cache of parsed lifelogs.
+Single assert per test.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+def _write(path: Path, obj: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(obj))
+
+
+def _lifelog(id_: str, markdown: str = "body") -> dict:
+    return {"id": id_, "title": id_, "markdown": markdown, "startTime": "2025-08-01T00:00:00Z"}
+
+
+def test_repeated_service_calls_hit_cache(tmp_path: Path):
+    from limitless_tools.services.lifelog_service import LifelogService
+    from limitless_tools.storage.cache import LifelogCache
+
+    for i in range(3):
+        _write(tmp_path / "2025" / "08" / "01" / f"lifelog_{i}.json", _lifelog(str(i)))
+    cache = LifelogCache()
+    svc = LifelogService(api_key=None, api_url=None, data_dir=str(tmp_path), cache=cache)
+    svc.search_local(query="body")
+    svc.export_markdown_by_date(date="2025-08-01")
+    assert (cache.misses, cache.hits) == (3, 3)
+
+
+def test_modified_file_is_reloaded(tmp_path: Path):
+    from limitless_tools.storage.cache import LifelogCache
+    from limitless_tools.storage.json_repo import load_lifelog
+
+    p = tmp_path / "lifelog_a.json"
+    _write(p, _lifelog("a", markdown="old"))
+    cache = LifelogCache()
+    load_lifelog(str(p), cache=cache)
+    _write(p, _lifelog("a", markdown="newer"))
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    loaded = load_lifelog(str(p), cache=cache) or {}
+    assert loaded.get("markdown") == "newer"
+
+
+def test_cache_evicts_by_bytes(tmp_path: Path):
+    from limitless_tools.storage.cache import LifelogCache
+    from limitless_tools.storage.json_repo import load_lifelog
+
+    paths = []
+    for i in range(4):
+        p = tmp_path / f"lifelog_{i}.json"
+        _write(p, _lifelog(str(i), markdown="x" * 1000))
+        paths.append(p)
+    cache = LifelogCache(max_bytes=int(paths[0].stat().st_size * 2.5))
+    for p in paths:
+        load_lifelog(str(p), cache=cache)
+    assert cache.stats()["entries"] == 2 and cache.evictions == 2
+
+
+def test_cache_charges_resolved_blob_bytes(tmp_path: Path):
+    from limitless_tools.storage.cache import LifelogCache
+    from limitless_tools.storage.json_repo import JsonFileRepository, load_lifelog
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), dedupe=True)
+    saved = repo.save_lifelog(_lifelog("big", markdown="y" * 50_000))
+    cache = LifelogCache()
+    load_lifelog(saved.path, cache=cache)
+    assert cache.current_bytes > 50_000 > Path(saved.path).stat().st_size
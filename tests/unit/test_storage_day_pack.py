@@ -0,0 +1,140 @@
+"""
+Tests for the packed per-day storage layout.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+
+def _lifelog(id_: str, day: str = "05", title: str | None = None) -> dict:
+    return {
+        "id": id_,
+        "title": title or id_,
+        "markdown": f"md {id_}",
+        "contents": [],
+        "startTime": f"2025-06-{day}T00:00:00Z",
+        "endTime": f"2025-06-{day}T01:00:00Z",
+        "isStarred": False,
+        "updatedAt": f"2025-06-{day}T02:00:00Z",
+    }
+
+
+def test_packed_layout_writes_one_pack_per_day(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), layout="packed")
+    repo.save_many([_lifelog(f"a{i}", day="05") for i in range(10)] + [_lifelog("b", day="06")])
+    packs = sorted(str(p.relative_to(tmp_path)) for p in tmp_path.rglob("lifelogs.jsonl"))
+    assert packs == ["2025/06/05/lifelogs.jsonl", "2025/06/06/lifelogs.jsonl"]
+
+
+def test_packed_record_loads_by_id_via_offset_table(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository, load_lifelog
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), layout="packed")
+    results = repo.save_many([_lifelog("x"), _lifelog("y"), _lifelog("z")])
+    assert load_lifelog(results[1].path) == _lifelog("y")
+
+
+def test_packed_statuses_and_latest_version_wins(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository, load_lifelog
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), layout="packed")
+    repo.save_lifelog(_lifelog("k"))
+    updated = repo.save_lifelog(_lifelog("k", title="new"))
+    again = JsonFileRepository(base_dir=str(tmp_path), layout="packed").save_lifelog(_lifelog("k", title="new"))
+    loaded = load_lifelog(again.path) or {}
+    assert (updated.status, again.status, loaded.get("title")) == ("updated", "unchanged", "new")
+
+
+def test_pack_compacts_when_mostly_dead(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), layout="packed")
+    for i in range(5):
+        repo.save_lifelog(_lifelog("c", title=f"v{i}"))
+    lines = (tmp_path / "2025" / "06" / "05" / "lifelogs.jsonl").read_text().splitlines()
+    assert len(lines) <= 2
+
+
+def test_service_reads_packed_archive(tmp_path: Path):
+    from limitless_tools.services.lifelog_service import LifelogService
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    JsonFileRepository(base_dir=str(tmp_path), layout="packed").save_many(
+        [_lifelog("p1", day="05"), _lifelog("p2", day="06")]
+    )
+    svc = LifelogService(api_key=None, api_url=None, data_dir=str(tmp_path))
+    assert svc.export_markdown_by_date(date="2025-06-06") == "md p2"
+
+
+def test_stale_offset_table_is_rebuilt_after_interrupted_append(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository, load_lifelog
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), layout="packed")
+    repo.save_lifelog(_lifelog("first"))
+    index = tmp_path / "2025" / "06" / "05" / "lifelogs.idx.json"
+    stale = index.read_bytes()
+    later = repo.save_lifelog(_lifelog("second"))
+    # Simulate a crash after the append but before the offset table was rewritten
+    index.write_bytes(stale)
+    assert load_lifelog(later.path) == _lifelog("second")
+
+
+def test_missing_offset_table_is_rebuilt_from_pack(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository, load_lifelog
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), layout="packed")
+    saved = repo.save_lifelog(_lifelog("only"))
+    (tmp_path / "2025" / "06" / "05" / "lifelogs.idx.json").unlink()
+    assert load_lifelog(saved.path) == _lifelog("only")
+
+
+def _pack_ids(tmp_path: Path) -> list[str]:
+    from limitless_tools.storage.day_pack import DayPack
+
+    return sorted(DayPack(tmp_path / "2025" / "06" / "05").offsets)
+
+
+def test_concurrent_writers_keep_each_others_records(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    # Two repositories stand in for two processes syncing the same day
+    first = JsonFileRepository(base_dir=str(tmp_path), layout="packed")
+    second = JsonFileRepository(base_dir=str(tmp_path), layout="packed")
+    first.save_lifelog(_lifelog("a"))
+    second.save_lifelog(_lifelog("b"))
+    first.save_lifelog(_lifelog("c"))
+    assert _pack_ids(tmp_path) == ["a", "b", "c"]
+
+
+def test_compaction_by_stale_writer_keeps_other_records(tmp_path: Path):
+    from limitless_tools.storage.day_pack import DayPack
+
+    day = tmp_path / "2025" / "06" / "05"
+    day.mkdir(parents=True)
+    first, second = DayPack(day), DayPack(day)
+    second.put_many([_lifelog("churn")])
+    first.put_many([_lifelog("keep")])
+    second.compact()
+    assert _pack_ids(tmp_path) == ["churn", "keep"]
+
+
+def _save_range(base: str, prefix: str, count: int) -> None:
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=base, layout="packed")
+    for i in range(count):
+        repo.save_lifelog(_lifelog(f"{prefix}{i:02d}"))
+
+
+def test_parallel_processes_do_not_lose_records(tmp_path: Path):
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_save_range, args=(str(tmp_path), p, 20)) for p in ("p", "q")]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=60)
+    assert len(_pack_ids(tmp_path)) == 40
@@ -0,0 +1,55 @@
+"""
+Tests for the repository's in-process directory cache.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+
+def _lifelog(id_: str) -> dict:
+    return {
+        "id": id_,
+        "title": id_,
+        "markdown": "md",
+        "contents": [],
+        "startTime": "2025-03-04T00:00:00Z",
+        "endTime": "2025-03-04T01:00:00Z",
+        "isStarred": False,
+        "updatedAt": "2025-03-04T02:00:00Z",
+    }
+
+
+def test_same_day_saves_create_directory_once(tmp_path: Path, monkeypatch):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    day_dir = tmp_path / "2025" / "03" / "04"
+    day_dir.mkdir(parents=True)
+    calls: list[Path] = []
+    real_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        calls.append(self)
+        return real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    repo = JsonFileRepository(base_dir=str(tmp_path), max_workers=4)
+    repo.save_many([_lifelog(f"x{i}") for i in range(10)])
+    assert calls.count(day_dir) == 1
+
+
+def test_existing_files_detected_from_directory_snapshot(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    JsonFileRepository(base_dir=str(tmp_path)).save_lifelog(_lifelog("keep"))
+    result = JsonFileRepository(base_dir=str(tmp_path)).save_lifelog(_lifelog("keep"))
+    assert result.status == "unchanged"
+
+
+def test_externally_deleted_file_is_recreated(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path))
+    first = repo.save_lifelog(_lifelog("gone"))
+    Path(first.path).unlink()
+    second = repo.save_lifelog(_lifelog("gone"))
+    assert second.status == "created" and Path(second.path).exists()
@@ -0,0 +1,47 @@
+"""
+Tests for the bytes-oriented (mmap) JSON read path.
+Single assert per test.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def test_small_file_roundtrip(tmp_path: Path):
+    from limitless_tools.storage.readers import read_json_file
+
+    p = tmp_path / "small.json"
+    p.write_text(json.dumps({"id": "a", "markdown": "héllo"}, ensure_ascii=False))
+    assert read_json_file(p) == {"id": "a", "markdown": "héllo"}
+
+
+def test_large_file_uses_mmap_and_roundtrips(tmp_path: Path):
+    from limitless_tools.storage.readers import read_json_file
+
+    payload = {"id": "big", "markdown": "x" * 5000}
+    p = tmp_path / "big.json"
+    p.write_text(json.dumps(payload))
+    assert read_json_file(p, mmap_threshold=1024) == payload
+
+
+@pytest.mark.parametrize("threshold", [1, 10_000])
+def test_stdlib_fallback_without_fast_decoder(tmp_path: Path, monkeypatch, threshold: int):
+    from limitless_tools import codec
+    from limitless_tools.storage import readers
+
+    monkeypatch.setattr(codec, "BACKEND", "json")
+    monkeypatch.setattr(codec, "SUPPORTS_BUFFER", False)
+    p = tmp_path / "f.json"
+    p.write_text(json.dumps([1, 2, 3]))
+    assert readers.read_json_file(p, mmap_threshold=threshold) == [1, 2, 3]
+
+
+def test_invalid_json_raises_json_decode_error(tmp_path: Path):
+    from limitless_tools.storage.readers import read_json_file
+
+    p = tmp_path / "bad.json"
+    p.write_text("{not json")
+    with pytest.raises(json.JSONDecodeError):
+        read_json_file(p)
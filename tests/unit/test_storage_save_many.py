@@ -0,0 +1,92 @@
+"""
+Tests for bulk (thread-pooled) saves in the JSON repository.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+def _lifelog(id_: str, day: str = "01") -> dict:
+    return {
+        "id": id_,
+        "title": f"t-{id_}",
+        "markdown": "md",
+        "contents": [],
+        "startTime": f"2025-01-{day}T00:00:00Z",
+        "endTime": f"2025-01-{day}T01:00:00Z",
+        "isStarred": False,
+        "updatedAt": f"2025-01-{day}T02:00:00Z",
+    }
+
+
+def test_save_many_returns_results_in_input_order(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), max_workers=4)
+    items = [_lifelog(f"id{i}", day=f"{(i % 3) + 1:02d}") for i in range(20)]
+    results = repo.save_many(items)
+    assert [Path(r.path).name for r in results] == [f"lifelog_id{i}.json" for i in range(20)]
+
+
+def test_save_many_classifies_statuses(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), max_workers=4)
+    repo.save_many([_lifelog("a"), _lifelog("b")])
+    changed = dict(_lifelog("b"), title="new")
+    results = repo.save_many([_lifelog("a"), changed, _lifelog("c")])
+    assert [r.status for r in results] == ["unchanged", "updated", "created"]
+
+
+def test_save_many_error_carries_lifelog_id(tmp_path: Path):
+    from limitless_tools.errors import StorageError
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), max_workers=2)
+    bad = dict(_lifelog("bad"), startTime="garbage")
+    with pytest.raises(StorageError) as excinfo:
+        repo.save_many([_lifelog("ok"), bad])
+    assert excinfo.value.context.get("lifelog_id") == "bad"
+
+
+def test_save_many_reuses_one_executor_across_calls(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), max_workers=4)
+    repo.save_many([_lifelog("a"), _lifelog("b")])
+    first = repo._pool
+    repo.save_many([_lifelog("c"), _lifelog("d")])
+    assert repo._pool is first and first is not None
+
+
+def test_close_shuts_down_executor_and_repo_stays_usable(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), max_workers=4)
+    repo.save_many([_lifelog("a"), _lifelog("b")])
+    repo.close()
+    results = repo.save_many([_lifelog("c"), _lifelog("d")])
+    repo.close()
+    assert [r.status for r in results] == ["created", "created"]
+
+
+def test_save_many_duplicate_ids_keep_last_item(tmp_path: Path):
+    import json
+
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), max_workers=8)
+    items = [dict(_lifelog("dup"), title=f"v{i}") for i in range(8)] + [_lifelog("other")]
+    results = repo.save_many(items)
+    assert json.loads(Path(results[0].path).read_text())["title"] == "v7"
+
+
+def test_save_many_duplicate_ids_report_sequential_statuses(tmp_path: Path):
+    from limitless_tools.storage.json_repo import JsonFileRepository
+
+    repo = JsonFileRepository(base_dir=str(tmp_path), max_workers=8)
+    items = [_lifelog("other")] + [dict(_lifelog("dup"), title=f"v{i}") for i in range(4)]
+    results = repo.save_many(items)
+    assert [r.status for r in results] == ["created", "created", "updated", "updated", "updated"]
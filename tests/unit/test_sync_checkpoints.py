@@ -0,0 +1,121 @@
+"""
+Page-level sync checkpoints and `sync(resume=True)`.
+Single assert per test.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+class FakeResponse:
+    def __init__(self, payload, ok=True, status_code=200):
+        self._payload = payload
+        self.ok = ok
+        self.status_code = status_code
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+
+class PagedSession:
+    """Serves pages keyed by the request cursor; `fail_on` cursors return HTTP 500."""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.params_history = []
+
+    def get(self, url, headers, params):
+        self.params_history.append(dict(params))
+        cursor = params.get("cursor")
+        if cursor in self.fail_on:
+            return FakeResponse({"message": "boom"}, ok=False, status_code=500)
+        n = {None: 1, "c1": 2, "c2": 3}[cursor]
+        item = {
+            "id": f"i{n}",
+            "title": f"T{n}",
+            "markdown": f"m{n}",
+            "contents": [],
+            "startTime": f"2025-04-0{n}T01:00:00Z",
+            "endTime": f"2025-04-0{n}T02:00:00Z",
+            "updatedAt": f"2025-04-0{n}T03:00:00Z",
+        }
+        return FakeResponse({"data": {"lifelogs": [item]}, "meta": {"lifelogs": {"nextCursor": f"c{n}" if n < 3 else None}}})
+
+
+def _service(tmp_path: Path, session):
+    from limitless_tools.http.client import LimitlessClient
+    from limitless_tools.services.lifelog_service import LifelogService
+
+    client = LimitlessClient(api_key="K", base_url="https://api.limitless.ai", session=session)
+    return LifelogService(api_key="K", api_url="https://api.limitless.ai", data_dir=str(tmp_path), client=client)
+
+
+def _state(tmp_path: Path):
+    return json.loads((tmp_path.parent / "state" / "lifelogs_sync.json").read_text())
+
+
+def _interrupted(tmp_path: Path):
+    from limitless_tools.errors import ServiceError
+
+    data_dir = tmp_path / "lifelogs"
+    with pytest.raises(ServiceError):
+        _service(data_dir, PagedSession(fail_on={"c2"})).sync(start="2025-04-01", checkpoint_every=1)
+    return data_dir
+
+
+def test_interrupted_sync_leaves_checkpoint(tmp_path: Path):
+    data_dir = _interrupted(tmp_path)
+    (checkpoint,) = [s["checkpoint"] for s in _state(data_dir)["signatures"].values()]
+    assert (checkpoint["cursor"], checkpoint["page"], checkpoint["created"]) == ("c2", 2, 2)
+
+
+def test_interrupted_sync_indexes_checkpointed_pages(tmp_path: Path):
+    data_dir = _interrupted(tmp_path)
+    assert [row["id"] for row in json.loads((data_dir / "index.json").read_text())] == ["i1", "i2"]
+
+
+def test_resume_continues_from_checkpoint_cursor(tmp_path: Path):
+    data_dir = _interrupted(tmp_path)
+    session = PagedSession()
+    _service(data_dir, session).sync(start="2025-04-01", resume=True)
+    assert [p.get("cursor") for p in session.params_history] == ["c2"]
+
+
+def test_resume_keeps_counts_and_completes(tmp_path: Path):
+    data_dir = _interrupted(tmp_path)
+    service = _service(data_dir, PagedSession())
+    service.sync(start="2025-04-01", resume=True)
+    state = _state(data_dir)
+    assert (service.last_report.created, any("checkpoint" in s for s in state["signatures"].values())) == (3, False)
+
+
+def test_without_resume_the_window_starts_over(tmp_path: Path):
+    data_dir = _interrupted(tmp_path)
+    session = PagedSession()
+    _service(data_dir, session).sync(start="2025-04-01")
+    assert session.params_history[0].get("cursor") is None
+
+
+class NewestFirstSession(PagedSession):
+    """Like PagedSession, but page 1 holds the newest lifelog, as a descending sync sees it."""
+
+    def get(self, url, headers, params):
+        resp = super().get(url, headers, params)
+        for item in resp._payload.get("data", {}).get("lifelogs", []):
+            day = 4 - int(item["id"][1:])
+            for key in ("startTime", "endTime", "updatedAt"):
+                item[key] = f"2025-04-0{day}" + item[key][10:]
+        return resp
+
+
+def test_resume_does_not_move_last_end_time_backwards(tmp_path: Path):
+    from limitless_tools.errors import ServiceError
+
+    data_dir = tmp_path / "lifelogs"
+    with pytest.raises(ServiceError):
+        _service(data_dir, NewestFirstSession(fail_on={"c2"})).sync(start="2025-04-01", checkpoint_every=1)
+    _service(data_dir, NewestFirstSession()).sync(start="2025-04-01", checkpoint_every=1, resume=True)
+    assert _state(data_dir)["lastEndTime"] == "2025-04-03T02:00:00Z"
@@ -0,0 +1,128 @@
+"""
+Two-phase (header-only) sync downloads full bodies only for new or changed lifelogs.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+
+class FakeResponse:
+    def __init__(self, payload, ok=True, status_code=200):
+        self._payload = payload
+        self.ok = ok
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+
+def _ll(lid, updated, *, body=True):
+    item = {
+        "id": lid,
+        "title": f"T{lid}",
+        "startTime": f"2025-04-0{lid[-1]}T01:00:00Z",
+        "endTime": f"2025-04-0{lid[-1]}T02:00:00Z",
+        "isStarred": False,
+        "updatedAt": updated,
+    }
+    if body:
+        item.update({"markdown": f"md {lid} {updated}", "contents": []})
+    return item
+
+
+class RoutingSession:
+    """Serves list pages (headers or full) from a dict of lifelogs, honouring cursor and limit."""
+
+    def __init__(self, lifelogs):
+        self.lifelogs = lifelogs
+        self.calls: list[tuple[str, dict]] = []
+
+    def get(self, url, headers, params):
+        self.calls.append((url, dict(params)))
+        full = params.get("includeMarkdown") == "true"
+        rows = [ll if full else {k: v for k, v in ll.items() if k not in ("markdown", "contents")} for ll in self.lifelogs.values()]
+        start = int(str(params.get("cursor") or "c0")[1:])
+        end = start + int(params["limit"])
+        next_cursor = f"c{end}" if end < len(rows) else None
+        return FakeResponse({"data": {"lifelogs": rows[start:end]}, "meta": {"lifelogs": {"nextCursor": next_cursor}}})
+
+
+def _service(tmp_path: Path, session):
+    from limitless_tools.http.client import LimitlessClient
+    from limitless_tools.services.lifelog_service import LifelogService
+
+    client = LimitlessClient(api_key="KEY", base_url="https://api.limitless.ai", session=session)
+    return LifelogService(api_key="KEY", api_url="https://api.limitless.ai", data_dir=str(tmp_path), client=client)
+
+
+def _resync(tmp_path: Path):
+    first = RoutingSession({"i1": _ll("i1", "u1"), "i2": _ll("i2", "u1")})
+    _service(tmp_path, first).sync(start="2025-04-01", end="2025-04-05", timezone="UTC")
+    second = RoutingSession({"i1": _ll("i1", "u1"), "i2": _ll("i2", "u2"), "i3": _ll("i3", "u1")})
+    service = _service(tmp_path, second)
+    paths = service.sync(start="2025-04-01", end="2025-04-05", timezone="UTC", headers_first=True)
+    return second, service, paths
+
+
+def test_headers_first_lists_without_bodies(tmp_path: Path):
+    session, _, _ = _resync(tmp_path)
+    assert session.calls[0][1]["includeMarkdown"] == "false" and session.calls[0][1]["includeHeadings"] == "false"
+
+
+def test_headers_first_refetches_page_once_for_changed_ids(tmp_path: Path):
+    session, _, _ = _resync(tmp_path)
+    assert [(url.rsplit("/", 1)[-1], params["includeMarkdown"]) for url, params in session.calls] == [
+        ("lifelogs", "false"),
+        ("lifelogs", "true"),
+    ]
+
+
+def test_headers_first_skips_page_refetch_when_nothing_changed(tmp_path: Path):
+    lifelogs = {"i1": _ll("i1", "u1"), "i2": _ll("i2", "u1")}
+    _service(tmp_path, RoutingSession(lifelogs)).sync(start="2025-04-01", end="2025-04-05", timezone="UTC")
+    session = RoutingSession(lifelogs)
+    _service(tmp_path, session).sync(start="2025-04-01", end="2025-04-05", timezone="UTC", headers_first=True)
+    assert len(session.calls) == 1
+
+
+def test_headers_first_refetches_only_the_changed_page_by_cursor(tmp_path: Path):
+    lifelogs = {f"i{n}": _ll(f"i{n}", "u1") for n in range(1, 7)}
+    window = {"start": "2025-04-01", "end": "2025-04-07", "timezone": "UTC", "batch_size": 2}
+    _service(tmp_path, RoutingSession(lifelogs)).sync(**window)
+    lifelogs["i4"] = _ll("i4", "u2")
+    session = RoutingSession(lifelogs)
+    _service(tmp_path, session).sync(headers_first=True, **window)
+    refetched = [(p.get("cursor"), p["limit"]) for _, p in session.calls if p["includeMarkdown"] == "true"]
+    assert refetched == [("c2", 2)]
+
+
+class BodylessSession(RoutingSession):
+    """Full listings omit one lifelog, as if it vanished between the two requests."""
+
+    def __init__(self, lifelogs, missing):
+        super().__init__(lifelogs)
+        self.missing = missing
+
+    def get(self, url, headers, params):
+        resp = super().get(url, headers, params)
+        if params.get("includeMarkdown") == "true":
+            items = [ll for ll in resp._payload["data"]["lifelogs"] if ll["id"] != self.missing]
+            resp._payload["data"]["lifelogs"] = items
+        return resp
+
+
+def test_headers_first_does_not_index_lifelog_without_body(tmp_path: Path):
+    import json
+
+    session = BodylessSession({"i1": _ll("i1", "u1"), "i2": _ll("i2", "u1")}, missing="i2")
+    _service(tmp_path, session).sync(start="2025-04-01", end="2025-04-05", timezone="UTC", headers_first=True)
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert [row["id"] for row in index] == ["i1"]
+
+
+def test_headers_first_reports_unchanged_and_saves_changed_bodies(tmp_path: Path):
+    from limitless_tools.storage.json_repo import load_lifelog
+
+    _, service, paths = _resync(tmp_path)
+    report = service.last_report
+    assert (report.created, report.updated, report.unchanged, load_lifelog(paths[1])["markdown"]) == (1, 1, 1, "md i2 u2")
@@ -0,0 +1,99 @@
+"""
+Record/replay cassettes for offline API runs.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self._payload = payload
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+def _page(n, nxt):
+    item = {
+        "id": f"i{n}",
+        "title": f"T{n}",
+        "markdown": "m",
+        "startTime": f"2025-01-0{n}T00:00:00Z",
+        "endTime": f"2025-01-0{n}T01:00:00Z",
+    }
+    return {"data": {"lifelogs": [item]}, "meta": {"lifelogs": {"nextCursor": nxt}}}
+
+
+class LiveSession:
+    def get(self, url, headers, params, timeout=None):
+        if params.get("cursor") == "c1":
+            return FakeResponse(_page(2, None))
+        return FakeResponse(_page(1, "c1"), headers={"ETag": '"e1"'})
+
+
+def _record(tmp_path: Path) -> Path:
+    from limitless_tools.http.client import LimitlessClient
+    from limitless_tools.testing.cassette import RecordingSession
+
+    cassette = tmp_path / "cassette.jsonl"
+    session = RecordingSession(LiveSession(), cassette, secrets=("SECRET-KEY",))
+    LimitlessClient(api_key="SECRET-KEY", session=session).get_lifelogs(batch_size=1)
+    return cassette
+
+
+def test_recording_redacts_api_key(tmp_path: Path):
+    cassette = _record(tmp_path)
+    text = cassette.read_text()
+    assert "SECRET-KEY" not in text and '"X-API-Key":"REDACTED"' in text
+
+
+def test_replay_serves_recorded_pages(tmp_path: Path):
+    from limitless_tools.http.client import LimitlessClient
+    from limitless_tools.testing.cassette import ReplaySession
+
+    session = ReplaySession(_record(tmp_path))
+    items = LimitlessClient(api_key="other", session=session).get_lifelogs(batch_size=1)
+    assert [x["id"] for x in items] == ["i1", "i2"]
+
+
+def test_replay_injects_latency_and_jitter(tmp_path: Path):
+    from limitless_tools.testing.cassette import ReplaySession
+
+    sleeps = []
+    session = ReplaySession(_record(tmp_path), latency=0.1, jitter=0.05, seed=1, sleep=sleeps.append)
+    session.get("https://api.limitless.ai/v1/lifelogs", params={})
+    assert 0.1 <= sleeps[0] <= 0.15
+
+
+def test_injected_errors_are_retried_and_reproducible(tmp_path: Path):
+    from limitless_tools.http.client import LimitlessClient
+    from limitless_tools.testing.cassette import ReplaySession
+
+    cassette = _record(tmp_path)
+    runs = []
+    for _ in range(2):
+        session = ReplaySession(cassette, error_rate=0.5, seed=3)
+        client = LimitlessClient(api_key="K", session=session, max_retries=10, sleep_fn=lambda s: None)
+        items = client.get_lifelogs(batch_size=1)
+        runs.append((len(items), session.injected_errors))
+    assert runs[0] == runs[1] and runs[0][0] == 2
+
+
+def test_sync_runs_offline_from_recorded_sync(tmp_path: Path):
+    from limitless_tools.services.lifelog_service import LifelogService
+    from limitless_tools.testing.cassette import RecordingSession, ReplaySession
+
+    cassette = tmp_path / "sync.jsonl"
+    recorder = RecordingSession(LiveSession(), cassette)
+    LifelogService(api_key="K", api_url=None, data_dir=str(tmp_path / "live" / "lifelogs"), http_session=recorder).sync(
+        batch_size=1, timezone="UTC"
+    )
+    service = LifelogService(
+        api_key="K", api_url=None, data_dir=str(tmp_path / "offline" / "lifelogs"), http_session=ReplaySession(cassette)
+    )
+    paths = service.sync(batch_size=1, timezone="UTC")
+    assert len(paths) == 2
@@ -0,0 +1,114 @@
+"""
+Local stub of the lifelogs API: pagination, filters, throttling and a real sync.
+Single assert per test.
+"""
+
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+
+def _api(count=25, **kwargs):
+    from limitless_tools.testing.stub_server import StubApi
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    return StubApi(generate_lifelogs(count, seed=5, start="2024-01-01T00:00:00Z", span_days=10), **kwargs)
+
+
+def _all_ids(api, **query):
+    ids, cursor = [], None
+    while True:
+        params = {"limit": "4", **query, **({"cursor": cursor} if cursor else {})}
+        _, _, body = api.handle("/v1/lifelogs", params, {})
+        ids.extend(item["id"] for item in body["data"]["lifelogs"])
+        cursor = body["meta"]["lifelogs"]["nextCursor"]
+        if not cursor:
+            return ids
+
+
+class UrllibResponse:
+    def __init__(self, status, headers, payload):
+        self.status_code = status
+        self.ok = status < 400
+        self.headers = dict(headers)
+        self.content = payload
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class UrllibSession:
+    """Just enough of requests.Session for LimitlessClient, over urllib."""
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        full = f"{url}?{urllib.parse.urlencode(params or {})}"
+        req = urllib.request.Request(full, headers=headers or {})
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                return UrllibResponse(resp.status, resp.headers, resp.read())
+        except urllib.error.HTTPError as exc:
+            return UrllibResponse(exc.code, exc.headers, exc.read())
+
+
+def test_cursor_pagination_returns_every_lifelog_once_newest_first():
+    api = _api()
+    ids = _all_ids(api)
+    assert ids == [item["id"] for _, item in reversed(api._rows)]
+
+
+def test_date_filter_uses_requested_timezone():
+    api = _api()
+    _, _, body = api.handle("/v1/lifelogs", {"date": "2024-01-03", "timezone": "Asia/Tokyo", "limit": "100"}, {})
+    days = {item["startTime"][:10] for item in body["data"]["lifelogs"]}
+    assert days == {"2024-01-03"}
+
+
+def test_start_end_window_is_half_open():
+    api = _api()
+    ids = _all_ids(api, start="2024-01-02 00:00:00", end="2024-01-05 00:00:00", direction="asc")
+    expected = [item["id"] for began, item in api._rows if "2024-01-02" <= began.strftime("%Y-%m-%d") < "2024-01-05"]
+    assert ids == expected
+
+
+def test_every_nth_request_is_throttled_with_retry_after():
+    api = _api(throttle_every=2, retry_after=3)
+    api.handle("/v1/lifelogs", {}, {})
+    status, headers, _ = api.handle("/v1/lifelogs", {}, {})
+    assert (status, headers) == (429, {"Retry-After": "3"})
+
+
+def test_latency_and_jitter_are_slept():
+    sleeps = []
+    api = _api(latency=0.2, jitter=0.1, seed=1, sleep=sleeps.append)
+    api.handle("/v1/lifelogs", {}, {})
+    assert 0.2 <= sleeps[0] <= 0.3
+
+
+def test_api_key_is_enforced_when_configured():
+    api = _api(api_key="secret")
+    status, _, _ = api.handle("/v1/lifelogs", {}, {"X-API-Key": "wrong"})
+    assert status == 401
+
+
+def test_api_key_header_name_is_case_insensitive():
+    api = _api(api_key="secret")
+    status, _, _ = api.handle("/v1/lifelogs", {}, {"x-api-key": "secret"})
+    assert status == 200
+
+
+def test_sync_against_stub_server_survives_throttling(tmp_path: Path):
+    from limitless_tools.services.lifelog_service import LifelogService
+    from limitless_tools.testing.stub_server import StubServer
+
+    with StubServer(_api(count=30, throttle_every=3, retry_after=0)) as server:
+        service = LifelogService(
+            api_key="K",
+            api_url=server.url,
+            data_dir=str(tmp_path / "lifelogs"),
+            http_session=UrllibSession(),
+            max_retries=5,
+        )
+        paths = service.sync(start="2024-01-01", end="2024-02-01", timezone="UTC", batch_size=7)
+    assert len(paths) == 30
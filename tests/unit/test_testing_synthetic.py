@@ -0,0 +1,77 @@
+"""
+Deterministic synthetic lifelog corpus for benchmarks.
+Single assert per test.
+"""
+
+from pathlib import Path
+
+from limitless_tools import codec
+
+
+def _blockquotes(nodes):
+    for node in nodes:
+        if node.get("type") == "blockquote":
+            yield node
+        yield from _blockquotes(node.get("children") or [])
+
+
+def test_same_seed_yields_identical_corpus():
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    assert codec.dumps(generate_lifelogs(20, seed=9)) == codec.dumps(generate_lifelogs(20, seed=9))
+
+
+def test_different_seeds_yield_different_corpora():
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    assert generate_lifelogs(5, seed=1)[0]["markdown"] != generate_lifelogs(5, seed=2)[0]["markdown"]
+
+
+def test_lifelogs_span_several_years_oldest_first():
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    starts = [x["startTime"] for x in generate_lifelogs(300, seed=3)]
+    assert starts == sorted(starts) and {s[:4] for s in starts} == {"2022", "2023", "2024"}
+
+
+def test_markdown_has_one_line_per_spoken_blockquote():
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    lifelog = generate_lifelogs(8, seed=4)[7]
+    lines = [line for line in lifelog["markdown"].splitlines() if line.startswith("- ")]
+    assert len(lines) == len(list(_blockquotes(lifelog["contents"])))
+
+
+def test_user_utterances_carry_the_user_speaker_identifier():
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    quotes = [q for x in generate_lifelogs(30, seed=5) for q in _blockquotes(x["contents"])]
+    assert {q["speakerIdentifier"] for q in quotes if q["speakerName"] == "You"} == {"user"}
+
+
+def test_api_pages_chain_cursors_over_every_lifelog():
+    from limitless_tools.testing.synthetic import api_pages, generate_lifelogs
+
+    pages = list(api_pages(generate_lifelogs(23, seed=6), page_size=5))
+    cursors = [p["meta"]["lifelogs"]["nextCursor"] for p in pages]
+    assert sum(len(p["data"]["lifelogs"]) for p in pages) == 23 and cursors[-1] is None and all(cursors[:-1])
+
+
+def test_write_archive_is_listed_by_service(tmp_path: Path):
+    from limitless_tools.services.lifelog_service import LifelogService
+    from limitless_tools.testing.synthetic import generate_lifelogs, write_archive
+
+    data_dir = str(tmp_path / "lifelogs")
+    write_archive(generate_lifelogs(40, seed=7), data_dir, layout="packed", chunk_size=16)
+    service = LifelogService(api_key=None, api_url=None, data_dir=data_dir)
+    assert len(service.list_local()) == 40
+
+
+def test_stub_without_headings_hoists_spoken_lines():
+    from limitless_tools.testing.stub_server import StubApi
+    from limitless_tools.testing.synthetic import generate_lifelogs
+
+    api = StubApi(generate_lifelogs(1, seed=8))
+    _, _, body = api.handle("/v1/lifelogs", {"includeHeadings": "false"}, {})
+    contents = body["data"]["lifelogs"][0]["contents"]
+    assert contents and {n["type"] for n in contents} == {"blockquote"}